@@ -1,30 +1,12 @@
 import streamlit as st
 from pathlib import Path
 
+from src.ui import apply_sidebar_style
+
 # ---------------------------------
 # Side Bar Customization
 # ---------------------------------
-st.markdown(
-    """
-    <style>
-    /* Sidebar spacing */
-    section[data-testid="stSidebar"] ul {
-        gap: 12px;
-    }
-
-    /* Sidebar text size */
-    section[data-testid="stSidebar"] span {
-        font-size: 16px;
-    }
-
-    /* Sidebar page labels spacing */
-    section[data-testid="stSidebar"] li {
-        margin-bottom: 10px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+apply_sidebar_style()
 
 # -----------------------------------
 # Page config
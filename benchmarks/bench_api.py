@@ -0,0 +1,205 @@
+"""
+Load test for the JSON query API.
+
+Starts a local API server (or targets --url), then sends a mix of
+metric, classification, correlation and win-probability requests
+from concurrent keep-alive clients. Part of the traffic revalidates
+with If-None-Match to exercise 304 responses. By default there are
+more clients than server workers, and extra keep-alive connections
+stay open but idle for the whole run, so a server that ties a worker
+to a connection stalls instead of looking fast. Reports throughput
+and p50/p90/p99 latency.
+
+Usage:
+    python -m benchmarks.bench_api
+    python -m benchmarks.bench_api --clients 64 --workers 4 --idle 16
+    python -m benchmarks.bench_api --url http://127.0.0.1:8000
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+
+
+# -----------------------------------
+# Request mix
+# -----------------------------------
+def request_mix(seasons: list, teams: list) -> list:
+    """
+    Builds the pool of GET paths the clients draw from.
+    """
+
+    paths = ["/health", "/team-seasons", "/classifications", "/correlations"]
+
+    for season in seasons:
+        paths += [
+            f"/team-seasons?season={season}",
+            f"/classifications?season={season}",
+            f"/correlations?season={season}",
+        ]
+
+    for team in teams:
+        paths += [
+            f"/team-seasons?team={team}",
+            f"/win-probability?team={team}",
+            f"/win-probability?team={team}&season={seasons[-1]}",
+        ]
+
+    return paths
+
+
+def _get(conn, path: str, etag: str = None) -> tuple:
+    headers = {"If-None-Match": etag} if etag else {}
+    conn.request("GET", path, headers=headers)
+    response = conn.getresponse()
+    response.read()
+    return response.status, response.getheader("ETag")
+
+
+def run_client(
+    host: str,
+    port: int,
+    paths: list,
+    etags: dict,
+    n_requests: int,
+    revalidate_share: float,
+    seed: int,
+) -> tuple:
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    latencies = []
+    statuses = Counter()
+
+    for _ in range(n_requests):
+        path = rng.choice(paths)
+        etag = etags.get(path) if rng.random() < revalidate_share else None
+
+        start = time.perf_counter()
+        status, _ = _get(conn, path, etag)
+        latencies.append(time.perf_counter() - start)
+        statuses[status] += 1
+
+    conn.close()
+    return latencies, statuses
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=None, help="existing API to target")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="worker threads of the local server (default: 8)",
+    )
+    parser.add_argument(
+        "--idle",
+        type=int,
+        default=8,
+        help="keep-alive connections left idle during the run (default: 8)",
+    )
+    parser.add_argument(
+        "--revalidate",
+        type=float,
+        default=0.3,
+        help="share of requests sent with If-None-Match (default: 0.3)",
+    )
+    args = parser.parse_args(argv)
+
+    server = None
+
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        from src.api import create_server
+
+        server = create_server(port=0, max_workers=args.workers, quiet=True)
+        host, port = server.server_address[:2]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # -----------------------------------
+    # Discover the dataset and warm the ETags
+    # -----------------------------------
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    conn.request("GET", "/team-seasons")
+    rows = json.loads(conn.getresponse().read())["rows"]
+    seasons = sorted({row["SEASON"] for row in rows})
+    teams = sorted({row["TEAM_ABBREVIATION"] for row in rows})
+
+    paths = request_mix(seasons, teams)
+    etags = {path: _get(conn, path)[1] for path in paths}
+    conn.close()
+
+    # Each idle client sends one request and then holds its connection
+    idle_conns = []
+    for _ in range(args.idle):
+        idle = http.client.HTTPConnection(host, port, timeout=30)
+        _get(idle, "/health")
+        idle_conns.append(idle)
+
+    per_client = max(args.requests // args.clients, 1)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        results = list(
+            pool.map(
+                lambda seed: run_client(
+                    host,
+                    port,
+                    paths,
+                    etags,
+                    per_client,
+                    args.revalidate,
+                    seed,
+                ),
+                range(args.clients),
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    for idle in idle_conns:
+        idle.close()
+
+    latencies = np.concatenate([np.array(lat) for lat, _ in results]) * 1000
+    statuses = sum((counts for _, counts in results), Counter())
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+
+    print(
+        f"{len(latencies):,} requests from {args.clients} clients "
+        f"({args.idle} more idle) over {len(paths)} distinct paths "
+        f"in {elapsed:.2f}s"
+    )
+    print(f"throughput: {len(latencies) / elapsed:,.0f} req/s")
+    print(
+        f"latency ms: p50={p50:.2f}  p90={p90:.2f}  p99={p99:.2f}  "
+        f"max={latencies.max():.2f}"
+    )
+    print(
+        "status: "
+        + ", ".join(f"{code}={n:,}" for code, n in sorted(statuses.items()))
+    )
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    return 0 if set(statuses) <= {200, 304} else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
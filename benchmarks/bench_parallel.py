@@ -0,0 +1,123 @@
+"""
+Serial vs per-season parallel preprocessing and aggregation.
+
+Times preprocess_data + aggregate_team_season_metrics on the
+synthetic datasets of bench_pipeline.py against
+parallel_preprocess_and_aggregate at increasing worker counts, and
+checks that every parallel run produces exactly the serial output.
+Speedup is reported relative to the serial path together with the
+number of cores available, since it cannot exceed min(workers, cores).
+
+Usage:
+    python -m benchmarks.bench_parallel
+    python -m benchmarks.bench_parallel --scales 10 100 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.bench_pipeline import dataset_path, output_fingerprint
+from src.data_loader import read_games_csv
+from src.metrics import aggregate_team_season_metrics
+from src.parallel_pipeline import parallel_preprocess_and_aggregate
+from src.preprocessing import preprocess_data
+
+
+# -----------------------------------
+# Benchmark configuration
+# -----------------------------------
+DEFAULT_SCALES = [1, 10]
+
+OUTPUTS = ("clean", "team_season")
+
+
+def default_workers() -> list:
+    """
+    Powers of two up to the core count, always including 2 so the
+    process pool is exercised on single-core machines.
+    """
+
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] < max(cores, 2):
+        workers.append(min(workers[-1] * 2, max(cores, 2)))
+    return workers
+
+
+def serial_preprocess_and_aggregate(df_raw) -> tuple:
+    df_clean = preprocess_data(df_raw)
+    return df_clean, aggregate_team_season_metrics(df_clean)
+
+
+def time_runs(func, repeat: int) -> tuple:
+    """
+    Returns (median seconds, output of the last run).
+    """
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = func()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs), output
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=DEFAULT_SCALES
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    workers = args.workers or default_workers()
+    print(f"{os.cpu_count()} cores available")
+
+    mismatches = []
+
+    for scale in args.scales:
+        df_raw = read_games_csv(dataset_path(scale, args.seed))
+
+        serial_seconds, serial_output = time_runs(
+            lambda: serial_preprocess_and_aggregate(df_raw), args.repeat
+        )
+        expected = output_fingerprint(dict(zip(OUTPUTS, serial_output)))
+
+        print(f"\nscale {scale}x: {len(df_raw):,} rows")
+        print(
+            f"  {'mode':<12} {'seconds':>9} {'speedup':>8} "
+            f"{'efficiency':>11} {'output':>8}"
+        )
+        print(f"  {'serial':<12} {serial_seconds:9.3f} {1:8.2f}x")
+
+        for n in workers:
+            seconds, output = time_runs(
+                lambda: parallel_preprocess_and_aggregate(df_raw, n),
+                args.repeat,
+            )
+            same = output_fingerprint(dict(zip(OUTPUTS, output))) == expected
+            speedup = serial_seconds / seconds
+            print(
+                f"  {f'{n} workers':<12} {seconds:9.3f} {speedup:8.2f}x "
+                f"{speedup / min(n, os.cpu_count() or 1):11.0%} "
+                f"{'same' if same else 'CHANGED':>8}"
+            )
+            if not same:
+                mismatches.append(f"{scale}x with {n} workers")
+
+    if mismatches:
+        print(f"\noutputs differ from serial: {', '.join(mismatches)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,164 @@
+"""
+Payload-size benchmark for chart and table rendering.
+
+Renders every page with Streamlit's AppTest twice, first sending full
+frames (NBA_DASHBOARD_TRIM_PAYLOADS=0) and then with payload trimming,
+and reports the serialized bytes of all charts and tables each rerun
+sends. A large game-level scatter is measured the same way to show
+the effect of WebGL traces and column projection at scale.
+
+Usage:
+    python -m benchmarks.bench_payload
+"""
+
+import argparse
+import os
+import time
+
+from src.figure_cache import clear_figure_cache
+from src.rendering import TRIM_ENV_VAR, plot_frame, render_mode
+
+
+# -----------------------------------
+# Benchmark configuration
+# -----------------------------------
+PAGES = [
+    "pages/1_League_Overview.py",
+    "pages/2_Team_Performance_Deep_Dive.py",
+    "pages/3_What_Wins_Games.py",
+    "pages/4_Team_Strength_Classification.py",
+    "pages/5_Win_Prediction.py",
+    "pages/6_Season_Simulator.py",
+]
+
+# Keeps the simulator run short; the payload size does not depend on it
+SIMULATOR_RUNS = 10_000
+
+
+def _set_trimming(enabled: bool) -> None:
+    os.environ[TRIM_ENV_VAR] = "1" if enabled else "0"
+    clear_figure_cache()
+
+
+def page_payload_bytes(page: str) -> dict:
+    """
+    Runs a page and sums the serialized size of its charts and tables.
+    """
+
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.abspath(page), default_timeout=300)
+    app.run()
+
+    # The simulator only draws charts after a run
+    if app.button:
+        app.select_slider[0].set_value(SIMULATOR_RUNS)
+        app.button[0].click()
+        app.run()
+
+    if app.exception:
+        raise RuntimeError(f"{page}: {[e.value for e in app.exception]}")
+
+    charts = sum(
+        len(chart.proto.SerializeToString())
+        for chart in app.get("plotly_chart")
+    )
+    tables = sum(
+        len(table.proto.SerializeToString()) for table in app.dataframe
+    )
+
+    return {"charts": charts, "tables": tables}
+
+
+def large_scatter_bytes() -> dict:
+    """
+    Serialized size and build time of a game-level scatter.
+    """
+
+    import plotly.express as px
+    import plotly.io as pio
+
+    from src.pipeline import load_game_features
+
+    games = load_game_features()
+
+    start = time.perf_counter()
+    fig = px.scatter(
+        plot_frame(
+            games,
+            ["pre_points", "opp_pre_points", "RESULT", "TEAM_NAME"],
+        ),
+        x="pre_points",
+        y="opp_pre_points",
+        color="RESULT",
+        hover_name="TEAM_NAME",
+        render_mode=render_mode(len(games)),
+    )
+    figure_json = pio.to_json(fig, validate=False)
+
+    return {
+        "rows": len(games),
+        "bytes": len(figure_json),
+        "trace": fig.data[0].type,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _reduction(full: int, trimmed: int) -> str:
+    if full == 0:
+        return "      -"
+    return f"{1 - trimmed / full:7.1%}"
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", nargs="*", default=PAGES)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'page':<42} {'full':>10} {'trimmed':>10} {'saved':>8}"
+    )
+
+    total_full = total_trimmed = 0
+
+    for page in args.pages:
+        _set_trimming(False)
+        full = page_payload_bytes(page)
+        _set_trimming(True)
+        trimmed = page_payload_bytes(page)
+
+        full_bytes = full["charts"] + full["tables"]
+        trimmed_bytes = trimmed["charts"] + trimmed["tables"]
+        total_full += full_bytes
+        total_trimmed += trimmed_bytes
+
+        print(
+            f"{page:<42} {full_bytes:>10,} {trimmed_bytes:>10,} "
+            f"{_reduction(full_bytes, trimmed_bytes)}"
+        )
+
+    print(
+        f"{'total per rerun':<42} {total_full:>10,} {total_trimmed:>10,} "
+        f"{_reduction(total_full, total_trimmed)}"
+    )
+
+    _set_trimming(False)
+    full = large_scatter_bytes()
+    _set_trimming(True)
+    trimmed = large_scatter_bytes()
+
+    print(
+        f"\ngame-level scatter ({full['rows']:,} points): "
+        f"{full['bytes']:,} B {full['trace']} {full['seconds']:.2f}s -> "
+        f"{trimmed['bytes']:,} B {trimmed['trace']} {trimmed['seconds']:.2f}s "
+        f"({_reduction(full['bytes'], trimmed['bytes']).strip()} smaller)"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
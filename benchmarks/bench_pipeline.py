@@ -0,0 +1,402 @@
+"""
+Per-stage benchmark of the analytics pipeline on synthetic data.
+
+Generates deterministic synthetic datasets (see synthetic_data.py) at
+1x, 10x and 100x the real dataset, then times and memory-profiles
+each pipeline stage: load_data, preprocess_data,
+aggregate_team_season_metrics, classify_team_strength,
+calculate_win_correlations and train_win_prediction_model.
+
+Timings are the median of --repeat runs without tracing; peak memory
+comes from one extra run under tracemalloc, and a final traced run of
+all stages back to back gives the peak of a whole pipeline pass.
+Each stage's output is fingerprinted, so a refactor can be checked
+for identical results. Every run is appended to a history file tagged
+with the git commit, and the report compares against the latest run
+recorded for another commit (or --compare).
+
+Usage:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --scales 1 10 --repeat 5
+    python -m benchmarks.bench_pipeline --compare 3cdd6e0 --check-outputs
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data import write_games_csv
+from src.classification import classify_team_strength
+from src.data_loader import read_games_csv
+from src.insights import calculate_win_correlations
+from src.metrics import aggregate_team_season_metrics
+from src.model import train_win_prediction_model
+from src.preprocessing import preprocess_data
+
+
+# -----------------------------------
+# Benchmark configuration
+# -----------------------------------
+ROOT = Path(__file__).resolve().parent.parent
+
+DATA_DIR = ROOT / "artifacts/benchmarks/data"
+HISTORY_PATH = ROOT / "artifacts/benchmarks/pipeline_history.jsonl"
+
+DEFAULT_SCALES = [1, 10, 100]
+
+# (stage, function, name of its input, name of its output)
+STAGES = [
+    ("load_data", read_games_csv, "path", "raw"),
+    ("preprocess_data", preprocess_data, "raw", "clean"),
+    (
+        "aggregate_team_season_metrics",
+        aggregate_team_season_metrics,
+        "clean",
+        "team_season",
+    ),
+    (
+        "classify_team_strength",
+        classify_team_strength,
+        "team_season",
+        "classified",
+    ),
+    (
+        "calculate_win_correlations",
+        calculate_win_correlations,
+        "team_season",
+        "correlations",
+    ),
+    (
+        "train_win_prediction_model",
+        train_win_prediction_model,
+        "team_season",
+        "model",
+    ),
+]
+
+
+def dataset_path(scale: int, seed: int) -> Path:
+    """
+    Generates the synthetic CSV for a scale once and reuses it.
+    """
+
+    path = DATA_DIR / f"synthetic_{scale}x_seed{seed}.csv"
+    if not path.exists():
+        print(f"generating {path.name} ...", flush=True)
+        write_games_csv(path, scale, seed)
+    return path
+
+
+def git_commit() -> dict:
+    def git(*args) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+# -----------------------------------
+# Measurement
+# -----------------------------------
+def _rows(value) -> int:
+    if isinstance(value, dict):
+        return None
+    return len(value)
+
+
+def _row_hashes(data) -> bytes:
+    return pd.util.hash_pandas_object(data).to_numpy().tobytes()
+
+
+def output_fingerprint(value) -> str:
+    """
+    Content hash of a stage output (frames, series, arrays, scalars
+    and dicts of those; fitted estimators contribute their coefficients).
+    """
+
+    digest = hashlib.sha1()
+
+    def feed(item) -> None:
+        if isinstance(item, pd.DataFrame):
+            digest.update(repr(list(item.columns)).encode())
+            digest.update(repr(list(map(str, item.dtypes))).encode())
+            digest.update(_row_hashes(item))
+        elif isinstance(item, pd.Series):
+            digest.update(repr((item.name, str(item.dtype))).encode())
+            digest.update(_row_hashes(item))
+        elif isinstance(item, np.ndarray):
+            digest.update(np.ascontiguousarray(item).tobytes())
+        elif isinstance(item, dict):
+            for key in sorted(item):
+                digest.update(str(key).encode())
+                feed(item[key])
+        elif isinstance(item, (int, float, str, Path)):
+            digest.update(repr(item).encode())
+        elif hasattr(item, "steps"):
+            for _, step in item.steps:
+                for attr in ("mean_", "scale_", "coef_", "intercept_"):
+                    if hasattr(step, attr):
+                        feed(getattr(step, attr))
+
+    feed(value)
+    return digest.hexdigest()[:16]
+
+
+def pipeline_peak_mb(path: Path) -> float:
+    """
+    Peak traced memory of one pass through every stage, keeping each
+    output alive as a page rerun does.
+    """
+
+    outputs = {"path": path}
+
+    tracemalloc.start()
+    try:
+        for _, func, source, target in STAGES:
+            outputs[target] = func(outputs[source])
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return peak / 1024 ** 2
+
+
+def run_stages(path: Path, repeat: int) -> dict:
+    """
+    Runs every stage in order and measures it.
+
+    Args:
+        path (Path): Synthetic CSV to load
+        repeat (int): Timed runs per stage
+
+    Returns:
+        dict: stage -> {"seconds", "runs", "peak_mb", "rows_in",
+        "rows_out", "output"}
+    """
+
+    outputs = {"path": path}
+    results = {}
+
+    for stage, func, source, target in STAGES:
+        data = outputs[source]
+
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(data)
+            runs.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            outputs[target] = func(data)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        results[stage] = {
+            "seconds": statistics.median(runs),
+            "runs": runs,
+            "peak_mb": peak / 1024 ** 2,
+            "rows_in": None if source == "path" else _rows(data),
+            "rows_out": _rows(outputs[target]),
+            "output": output_fingerprint(outputs[target]),
+        }
+
+        # The raw frame is only needed by preprocessing
+        if source == "raw":
+            outputs.pop("raw")
+
+    return results
+
+
+# -----------------------------------
+# History
+# -----------------------------------
+def load_history(path: Path) -> list:
+    if not path.exists():
+        return []
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(path: Path, entry: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def reference_run(
+    history: list,
+    scale: int,
+    seed: int,
+    commit: str,
+    compare: str = None,
+) -> dict:
+    """
+    Latest earlier run at the same scale and seed, either on the
+    requested commit or on any commit other than the current one.
+    """
+
+    for entry in reversed(history):
+        if entry["scale"] != scale or entry["seed"] != seed:
+            continue
+        if compare is not None:
+            if entry["commit"].startswith(compare):
+                return entry
+        elif entry["commit"] != commit:
+            return entry
+    return None
+
+
+def _delta(current: float, previous: float) -> str:
+    if not previous:
+        return "       -"
+    return f"{current / previous - 1:+8.1%}"
+
+
+def _output_status(result: dict, previous: dict) -> str:
+    if not previous.get("output"):
+        return "-"
+    return "same" if result["output"] == previous["output"] else "CHANGED"
+
+
+def print_report(entry: dict, reference: dict) -> list:
+    """
+    Prints one scale's results and returns the stages whose output
+    differs from the reference run.
+    """
+
+    ref_stages = reference["stages"] if reference else {}
+    ref_label = reference["commit"] if reference else "-"
+    changed = []
+
+    print(
+        f"\nscale {entry['scale']}x: {entry['rows']:,} rows "
+        f"(vs {ref_label})"
+    )
+    print(
+        f"  {'stage':<32} {'seconds':>9} {'delta':>8} "
+        f"{'peak MB':>9} {'delta':>8} {'rows out':>11} {'output':>8}"
+    )
+
+    for stage, result in entry["stages"].items():
+        previous = ref_stages.get(stage, {})
+        rows_out = (
+            f"{result['rows_out']:,}" if result["rows_out"] is not None else "-"
+        )
+        print(
+            f"  {stage:<32} {result['seconds']:9.3f} "
+            f"{_delta(result['seconds'], previous.get('seconds'))} "
+            f"{result['peak_mb']:9.1f} "
+            f"{_delta(result['peak_mb'], previous.get('peak_mb'))} "
+            f"{rows_out:>11} {_output_status(result, previous):>8}"
+        )
+        if _output_status(result, previous) == "CHANGED":
+            changed.append(stage)
+
+    previous_peak = reference.get("pipeline_peak_mb") if reference else None
+    print(
+        f"  {'whole pipeline pass':<32} {'':>9} {'':>8} "
+        f"{entry['pipeline_peak_mb']:9.1f} "
+        f"{_delta(entry['pipeline_peak_mb'], previous_peak)}"
+    )
+
+    return changed
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=DEFAULT_SCALES
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--compare",
+        default=None,
+        help="commit to compare against (default: latest other commit)",
+    )
+    parser.add_argument(
+        "--check-outputs",
+        action="store_true",
+        help="fail when any stage output differs from the reference run",
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    parser.add_argument(
+        "--no-save",
+        action="store_true",
+        help="do not append this run to the history",
+    )
+    args = parser.parse_args(argv)
+
+    revision = git_commit()
+    history = load_history(args.history)
+
+    print(
+        f"commit {revision['commit']}{' (dirty)' if revision['dirty'] else ''}"
+        f", pandas {pd.__version__}, python {platform.python_version()}"
+    )
+
+    changed = []
+
+    for scale in args.scales:
+        path = dataset_path(scale, args.seed)
+        stages = run_stages(path, args.repeat)
+        pipeline_peak = pipeline_peak_mb(path)
+
+        entry = {
+            **revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "scale": scale,
+            "seed": args.seed,
+            "rows": stages["load_data"]["rows_out"],
+            "repeat": args.repeat,
+            "stages": stages,
+            "pipeline_peak_mb": pipeline_peak,
+        }
+
+        changed += [
+            f"{scale}x {stage}"
+            for stage in print_report(
+                entry,
+                reference_run(
+                    history, scale, args.seed, revision["commit"], args.compare
+                ),
+            )
+        ]
+
+        if not args.no_save:
+            append_history(args.history, entry)
+
+    if not args.no_save:
+        print(f"\nresults appended to {args.history}")
+
+    if changed:
+        print(f"\noutputs changed: {', '.join(changed)}")
+        if args.check_outputs:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,308 @@
+"""
+Concurrent-session load harness for the dashboard pages.
+
+Simulates N analysts using the dashboard at once. Each session runs
+in its own thread and opens every page, in a seeded random order,
+as a fresh Streamlit AppTest (a new browser session). It then replays
+a scripted sequence of widget interactions (filters, team and metric
+pickers, a simulator run), each one triggering a rerun. All sessions
+share one process, as they would on one server, so caches and the
+GIL are shared too.
+
+Reports per-page rerun latency percentiles, overall reruns per second
+and the process resident memory (RSS) before, at peak and after the
+run.
+
+Usage:
+    python -m benchmarks.bench_sessions
+    python -m benchmarks.bench_sessions --sessions 16 --rounds 3
+    python -m benchmarks.bench_sessions --pages pages/1_League_Overview.py
+"""
+
+import argparse
+import os
+import random
+import resource
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+
+# -----------------------------------
+# Harness configuration
+# -----------------------------------
+ROOT = Path(__file__).resolve().parent.parent
+
+RERUN_TIMEOUT = 300
+
+# Sampling interval of the RSS monitor, in seconds
+RSS_INTERVAL = 0.1
+
+# Keeps scripted simulator runs short
+SIMULATOR_RUNS = 10_000
+
+
+def _widget(app, kind: str, label: str):
+    for widget in getattr(app, kind):
+        if widget.label == label:
+            return widget
+    raise ValueError(f"No {kind} labelled {label!r} on the page")
+
+
+def _pick(rng: random.Random, widget):
+    return rng.choice(list(widget.options))
+
+
+# -----------------------------------
+# Scripted interactions
+# -----------------------------------
+# Each step takes (app, rng), changes one or more widgets and returns
+# an action name; the harness then reruns the page and times it.
+def _league_seasons(app, rng) -> str:
+    seasons = _widget(app, "multiselect", "Select Seasons")
+    options = list(seasons.options)
+    seasons.set_value(rng.sample(options, rng.randint(1, len(options))))
+    return "filter seasons"
+
+
+def _team_select(app, rng) -> str:
+    team = _widget(app, "selectbox", "Select Team")
+    team.set_value(_pick(rng, team))
+    return "select team"
+
+
+def _team_season(app, rng) -> str:
+    season = _widget(app, "selectbox", "Select Season")
+    season.set_value(_pick(rng, season))
+    return "select season"
+
+
+def _game_log(app, rng) -> str:
+    sort = app.selectbox(key="game_log_sort")
+    sort.set_value(_pick(rng, sort))
+    app.selectbox(key="game_log_order").set_value("Descending")
+    return "sort game log"
+
+
+def _correlation_metric(app, rng) -> str:
+    metric = app.selectbox[0]
+    metric.set_value(_pick(rng, metric))
+    return "select metric"
+
+
+def _classification_season(app, rng) -> str:
+    season = app.selectbox[0]
+    season.set_value(_pick(rng, season))
+    return "select season"
+
+
+def _what_if_axis(app, rng) -> str:
+    axis = _widget(app, "selectbox", "X-Axis Metric")
+    axis.set_value(_pick(rng, axis))
+    return "change what-if axis"
+
+
+def _simulate(app, rng) -> str:
+    _widget(app, "slider", "Season Completed (%)").set_value(
+        rng.choice(range(10, 95, 5))
+    )
+    _widget(app, "select_slider", "Simulations").set_value(SIMULATOR_RUNS)
+    app.button[0].click()
+    return "run simulation"
+
+
+SCRIPTS = {
+    "pages/1_League_Overview.py": [_league_seasons, _league_seasons],
+    "pages/2_Team_Performance_Deep_Dive.py": [
+        _team_select,
+        _team_season,
+        _game_log,
+    ],
+    "pages/3_What_Wins_Games.py": [_league_seasons, _correlation_metric],
+    "pages/4_Team_Strength_Classification.py": [
+        _classification_season,
+        _classification_season,
+    ],
+    "pages/5_Win_Prediction.py": [_team_select, _what_if_axis],
+    "pages/6_Season_Simulator.py": [_simulate],
+}
+
+
+# -----------------------------------
+# Process memory
+# -----------------------------------
+def current_rss() -> int:
+    """
+    Resident set size of this process in bytes.
+    """
+
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    # ru_maxrss is the peak, in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class RssMonitor:
+    """
+    Samples process RSS in a background thread and keeps the peak.
+    """
+
+    def __init__(self, interval: float = RSS_INTERVAL):
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+# -----------------------------------
+# Sessions
+# -----------------------------------
+def run_session(session_id: int, pages: list, rounds: int, seed: int) -> list:
+    """
+    Replays every page's script as one simulated analyst.
+
+    Returns:
+        list: (page, action, seconds, error) per rerun
+    """
+
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed * 10_007 + session_id)
+    samples = []
+
+    for _ in range(rounds):
+        for page in rng.sample(pages, len(pages)):
+            app = AppTest.from_file(
+                str(ROOT / page), default_timeout=RERUN_TIMEOUT
+            )
+
+            steps = [None] + SCRIPTS.get(page, [])
+            for step in steps:
+                action = "first render" if step is None else step(app, rng)
+
+                start = time.perf_counter()
+                app.run()
+                seconds = time.perf_counter() - start
+
+                error = [e.value for e in app.exception] or None
+                samples.append((page, action, seconds, error))
+                if error:
+                    break
+
+    return samples
+
+
+def summarize(samples: list) -> dict:
+    by_page = defaultdict(list)
+    for page, _, seconds, _ in samples:
+        by_page[page].append(seconds)
+
+    summary = {}
+    for page, seconds in by_page.items():
+        ms = np.array(seconds) * 1000
+        p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+        summary[page] = {
+            "reruns": len(ms),
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "max": ms.max(),
+        }
+
+    return summary
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pages", nargs="*", default=list(SCRIPTS))
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="measure cold caches instead of rendering every page first",
+    )
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+
+    rss_start = current_rss()
+
+    if not args.no_warmup:
+        run_session(-1, args.pages, rounds=1, seed=args.seed)
+    rss_warm = current_rss()
+
+    with RssMonitor() as monitor:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+            results = list(
+                pool.map(
+                    lambda session: run_session(
+                        session, args.pages, args.rounds, args.seed
+                    ),
+                    range(args.sessions),
+                )
+            )
+        elapsed = time.perf_counter() - start
+
+    samples = [sample for session in results for sample in session]
+    errors = [sample for sample in samples if sample[3]]
+
+    print(
+        f"{args.sessions} concurrent sessions x {args.rounds} rounds over "
+        f"{len(args.pages)} pages: {len(samples):,} reruns in {elapsed:.1f}s"
+    )
+    print(f"throughput: {len(samples) / elapsed:.2f} reruns/s\n")
+
+    print(
+        f"{'page':<42} {'reruns':>7} {'p50 ms':>9} {'p90 ms':>9} "
+        f"{'p99 ms':>9} {'max ms':>9}"
+    )
+    for page, stats in sorted(summarize(samples).items()):
+        print(
+            f"{page:<42} {stats['reruns']:>7} {stats['p50']:9.0f} "
+            f"{stats['p90']:9.0f} {stats['p99']:9.0f} {stats['max']:9.0f}"
+        )
+
+    mb = 1024 ** 2
+    print(
+        f"\nRSS: start {rss_start / mb:,.0f} MB, after warm-up "
+        f"{rss_warm / mb:,.0f} MB, peak {monitor.peak / mb:,.0f} MB, "
+        f"end {current_rss() / mb:,.0f} MB"
+    )
+
+    if errors:
+        print(f"\n{len(errors)} reruns raised:")
+        for page, action, _, error in errors[:10]:
+            print(f"  {page} ({action}): {error}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""
+Throughput benchmark for the Monte Carlo season simulator.
+
+Builds a synthetic 30-team league with half a season remaining and
+reports simulated seasons per second for several worker counts.
+
+Usage:
+    python -m benchmarks.bench_simulation
+    python -m benchmarks.bench_simulation --simulations 500000 --workers 1 4 8
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.simulation import iter_simulate_season
+
+
+# -----------------------------------
+# Synthetic league
+# -----------------------------------
+def synthetic_league(
+    n_teams: int = 30,
+    games_per_team: int = 82,
+    played_fraction: float = 0.5,
+    seed: int = 0,
+) -> tuple:
+    rng = np.random.default_rng(seed)
+    team_ids = np.arange(n_teams)
+
+    n_games = n_teams * games_per_team // 2
+    n_remaining = int(n_games * (1 - played_fraction))
+
+    home = rng.integers(0, n_teams, n_remaining)
+    away = (home + rng.integers(1, n_teams, n_remaining)) % n_teams
+
+    played = int(games_per_team * played_fraction)
+    wins = rng.binomial(played, 0.5, n_teams)
+
+    standings = pd.DataFrame(
+        {
+            "TEAM_ID": team_ids,
+            "TEAM_NAME": [f"Team {i}" for i in team_ids],
+            "wins": wins,
+            "losses": played - wins,
+            "conference": np.where(team_ids < n_teams // 2, "East", "West"),
+        }
+    )
+    schedule = pd.DataFrame({"HOME_TEAM_ID": home, "AWAY_TEAM_ID": away})
+    ratings = pd.Series(rng.uniform(0.25, 0.75, n_teams), index=team_ids)
+
+    return standings, schedule, ratings
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--simulations", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="*",
+        default=sorted({1, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args(argv)
+
+    standings, schedule, ratings = synthetic_league()
+
+    print(
+        f"{len(standings)} teams, {len(schedule)} remaining games, "
+        f"{args.simulations:,} simulations"
+    )
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        first_update = None
+
+        for result in iter_simulate_season(
+            standings,
+            schedule,
+            ratings,
+            n_simulations=args.simulations,
+            chunk_size=args.chunk_size,
+            max_workers=workers,
+        ):
+            if first_update is None:
+                first_update = time.perf_counter() - start
+
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"workers={workers:<3} {elapsed:7.2f}s  "
+            f"{result['simulations'] / elapsed:12,.0f} seasons/s  "
+            f"first partial result after {first_update:.2f}s"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,182 @@
+"""
+SQLite filter pushdown vs in-memory pandas filtering.
+
+Builds the derived tables (cleaned games, team-season metrics,
+classified team-seasons) from the synthetic datasets of
+bench_pipeline.py, writes them to an indexed SQLite database, and
+times the page filters both ways: boolean masks over the full frames
+held in memory, and query_table reading only the matching rows. Each
+query result is checked against the pandas result.
+
+Alongside latency it reports what each backend keeps in memory: the
+pandas path holds every table in full, the SQLite path only the rows
+a query returns.
+
+Usage:
+    python -m benchmarks.bench_sql
+    python -m benchmarks.bench_sql --scales 1 10 100 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.bench_pipeline import ROOT, dataset_path
+from src.classification import classify_team_strength
+from src.data_loader import read_games_csv
+from src.metrics import aggregate_team_season_metrics
+from src.preprocessing import preprocess_data
+from src.sql_store import build_database, filter_frame, query_table
+
+
+# -----------------------------------
+# Benchmark configuration
+# -----------------------------------
+DB_DIR = ROOT / "artifacts/benchmarks/sqlite"
+
+DEFAULT_SCALES = [1, 10]
+
+
+def queries(tables: dict) -> list:
+    """
+    The page filters to time: (label, table, filter kwargs).
+    """
+
+    games = tables["games_clean"]
+    seasons = sorted(games["SEASON"].unique().tolist())
+    team_id = int(games["TEAM_ID"].iloc[0])
+    team_name = games.loc[games["TEAM_ID"] == team_id, "TEAM_NAME"].iloc[0]
+
+    return [
+        ("team-seasons, 1 season", "team_season", {"seasons": seasons[-1:]}),
+        (
+            "team-seasons, 3 seasons",
+            "team_season",
+            {"seasons": seasons[-3:]},
+        ),
+        (
+            "classified, 1 team",
+            "classified",
+            {"team_names": [team_name]},
+        ),
+        ("games, 1 season", "games_clean", {"seasons": seasons[-1:]}),
+        ("games, 1 team", "games_clean", {"team_ids": [team_id]}),
+        (
+            "games, 1 team-season",
+            "games_clean",
+            {"seasons": seasons[-1:], "team_ids": [team_id]},
+        ),
+    ]
+
+
+def build_tables(scale: int, seed: int) -> dict:
+    df_clean = preprocess_data(read_games_csv(dataset_path(scale, seed)))
+    team_season = aggregate_team_season_metrics(df_clean)
+
+    return {
+        "games_clean": df_clean,
+        "team_season": team_season,
+        "classified": classify_team_strength(team_season),
+    }
+
+
+def database_for(scale: int, seed: int, tables: dict) -> tuple:
+    """
+    Builds the scale's database once; returns (path, build seconds).
+    """
+
+    path = DB_DIR / f"synthetic_{scale}x_seed{seed}.sqlite"
+    if path.exists():
+        return path, None
+
+    start = time.perf_counter()
+    build_database(path, tables)
+    return path, time.perf_counter() - start
+
+
+def median_seconds(func, repeat: int) -> tuple:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs), result
+
+
+def _mb(frame: pd.DataFrame) -> float:
+    return frame.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=DEFAULT_SCALES
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    mismatches = []
+
+    for scale in args.scales:
+        tables = build_tables(scale, args.seed)
+        path, build_seconds = database_for(scale, args.seed, tables)
+
+        built = (
+            f"built in {build_seconds:.1f}s"
+            if build_seconds is not None
+            else "reused"
+        )
+        print(
+            f"\nscale {scale}x: {len(tables['games_clean']):,} games, "
+            f"database {Path(path).stat().st_size / 1024 ** 2:,.0f} MB "
+            f"({built})"
+        )
+        print(
+            "  pandas keeps "
+            + ", ".join(
+                f"{name} {_mb(df):,.1f} MB" for name, df in tables.items()
+            )
+            + " in memory"
+        )
+        print(
+            f"  {'query':<26} {'rows':>9} {'pandas ms':>10} "
+            f"{'sqlite ms':>10} {'speedup':>8} {'result MB':>10} {'same':>5}"
+        )
+
+        for label, table, filters in queries(tables):
+            pandas_seconds, expected = median_seconds(
+                lambda: filter_frame(tables[table], **filters), args.repeat
+            )
+            sql_seconds, result = median_seconds(
+                lambda: query_table(path, table, **filters), args.repeat
+            )
+
+            same = expected.equals(result) and (
+                list(expected.dtypes) == list(result.dtypes)
+            )
+            if not same:
+                mismatches.append(f"{scale}x {label}")
+
+            print(
+                f"  {label:<26} {len(result):>9,} "
+                f"{pandas_seconds * 1000:10.2f} {sql_seconds * 1000:10.2f} "
+                f"{pandas_seconds / sql_seconds:7.2f}x "
+                f"{_mb(result):10.2f} {'yes' if same else 'NO':>5}"
+            )
+
+    if mismatches:
+        print(f"\nresults differ from pandas: {', '.join(mismatches)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
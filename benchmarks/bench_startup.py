@@ -0,0 +1,249 @@
+"""
+Startup-time benchmark for the dashboard.
+
+Measures, each in a fresh interpreter, the import time of heavy
+third-party and src/ modules and the time-to-first-render of app.py
+and every page (via Streamlit's AppTest). Results are compared with
+a saved baseline and the run fails when any measurement regresses
+beyond the tolerance, or when a module or page that should stay
+light pulls in scikit-learn or SciPy.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 5 --tolerance 0.2
+    python -m benchmarks.bench_startup --save-baseline
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+# -----------------------------------
+# Benchmark configuration
+# -----------------------------------
+ROOT = Path(__file__).resolve().parent.parent
+
+BASELINE_PATH = Path("artifacts/benchmarks/startup_baseline.json")
+
+MODULES = [
+    "pandas",
+    "plotly.express",
+    "sklearn.linear_model",
+    "src.pipeline",
+    "src.game_model",
+    "src.simulation",
+    "src.numpy_scorer",
+    "src.what_if",
+    "src.insights",
+    "src.summaries",
+]
+
+PAGES = ["app.py"] + sorted(
+    str(path.relative_to(ROOT)) for path in (ROOT / "pages").glob("*.py")
+)
+
+HEAVY_MODULES = ["sklearn", "scipy", "plotly.express"]
+
+# Entries that must render or import without loading scikit-learn
+# (or SciPy, which it brings in)
+SKLEARN_FREE = {
+    "src.pipeline",
+    "src.game_model",
+    "src.simulation",
+    "src.numpy_scorer",
+    "src.what_if",
+    "app.py",
+    "pages/1_League_Overview.py",
+    "pages/2_Team_Performance_Deep_Dive.py",
+    "pages/3_What_Wins_Games.py",
+    "pages/4_Team_Strength_Classification.py",
+    "pages/5_Win_Prediction.py",
+    "pages/6_Season_Simulator.py",
+}
+
+# Differences below this are noise, whatever the relative change
+MIN_REGRESSION_SECONDS = 0.05
+
+
+# -----------------------------------
+# Probes (run in a fresh interpreter)
+# -----------------------------------
+_IMPORT_PROBE = """
+import importlib, json, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+importlib.import_module(sys.argv[2])
+seconds = time.perf_counter() - start
+heavy = [m for m in json.loads(sys.argv[3]) if m in sys.modules]
+print(json.dumps({"seconds": seconds, "heavy": heavy}))
+"""
+
+# Streamlit itself is already loaded in a running server, so it is
+# imported before the clock starts
+_RENDER_PROBE = """
+import json, os, sys, time
+sys.path.insert(0, sys.argv[1])
+os.chdir(sys.argv[1])
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(os.path.join(sys.argv[1], sys.argv[2]), default_timeout=300)
+start = time.perf_counter()
+app.run()
+seconds = time.perf_counter() - start
+heavy = [m for m in json.loads(sys.argv[3]) if m in sys.modules]
+errors = [str(e.value) for e in app.exception]
+print(json.dumps({"seconds": seconds, "heavy": heavy, "errors": errors}))
+"""
+
+
+def _probe(code: str, target: str) -> dict:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code,
+            str(ROOT),
+            target,
+            json.dumps(HEAVY_MODULES),
+        ],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(code: str, targets: list, repeat: int) -> dict:
+    """
+    Runs a probe `repeat` times per target and keeps the median time.
+    """
+
+    results = {}
+
+    for target in targets:
+        runs = [_probe(code, target) for _ in range(repeat)]
+        results[target] = {
+            "seconds": statistics.median(run["seconds"] for run in runs),
+            "heavy": runs[-1]["heavy"],
+            "errors": runs[-1].get("errors", []),
+        }
+
+    return results
+
+
+# -----------------------------------
+# Regression checks
+# -----------------------------------
+def find_regressions(
+    results: dict,
+    baseline: dict,
+    tolerance: float,
+) -> list:
+    failures = []
+
+    for section in ("imports", "renders"):
+        for target, result in results[section].items():
+            if result["errors"]:
+                failures.append(f"{target}: raised {result['errors']}")
+
+            if target in SKLEARN_FREE:
+                for module in ("sklearn", "scipy"):
+                    if module in result["heavy"]:
+                        failures.append(f"{target}: loads {module}")
+
+            previous = baseline.get(section, {}).get(target)
+            if previous is None:
+                continue
+
+            limit = max(
+                previous["seconds"] * (1 + tolerance),
+                previous["seconds"] + MIN_REGRESSION_SECONDS,
+            )
+            if result["seconds"] > limit:
+                failures.append(
+                    f"{target}: {result['seconds']:.3f}s exceeds baseline "
+                    f"{previous['seconds']:.3f}s (+{tolerance:.0%})"
+                )
+
+    return failures
+
+
+def _print_section(title: str, section: dict, baseline: dict) -> None:
+    print(f"\n{title}")
+    for target, result in section.items():
+        previous = baseline.get(target)
+        delta = (
+            f"{result['seconds'] - previous['seconds']:+8.3f}s"
+            if previous
+            else " " * 9
+        )
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(
+            f"  {target:<42} {result['seconds']:7.3f}s {delta}  heavy: {heavy}"
+        )
+
+
+# -----------------------------------
+# Benchmark
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown relative to the baseline (default: 0.25)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="record this run as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    baseline_path = ROOT / args.baseline
+    baseline = (
+        json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    )
+
+    results = {
+        "imports": measure(_IMPORT_PROBE, MODULES, args.repeat),
+        "renders": measure(_RENDER_PROBE, PAGES, args.repeat),
+    }
+
+    _print_section(
+        "Import time (fresh interpreter)",
+        results["imports"],
+        baseline.get("imports", {}),
+    )
+    _print_section(
+        "Time to first render",
+        results["renders"],
+        baseline.get("renders", {}),
+    )
+
+    failures = find_regressions(results, baseline, args.tolerance)
+
+    if args.save_baseline or not (baseline or failures):
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=1))
+        print(f"\nbaseline written to {args.baseline}")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    print("\nOK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,330 @@
+"""
+Equivalence check for the copy-on-write refactor.
+
+The analytics stages dropped their defensive DataFrame.copy() calls and
+rely on copy-on-write instead (see src/pandas_compat.py). This check
+runs each of those stages on the synthetic benchmark data next to a
+reference that keeps the defensive copy, and asserts with
+pandas.testing that:
+
+- the outputs are identical, and
+- the stage left its input frame untouched.
+
+preprocess_data and classify_team_strength were also rewritten in the
+same change, so their references are the pre-refactor implementations
+kept verbatim below. For prepare_model_data and the simulator's odds
+table the copy was the only change, so the reference is the current
+function run on a deep copy of its input. Batch scoring is not covered:
+the frame it stopped copying is a chunk read from disk inside the loop,
+so there is no caller-owned input to protect.
+
+On pandas 2.x, where copy-on-write is optional, the current stages are
+also run once with the mode switched off, so they are checked against
+the old semantics too. pandas 3 always uses copy-on-write.
+
+Usage:
+    python -m benchmarks.check_copies
+    python -m benchmarks.check_copies --scales 1 10 --nan-share 0.05
+"""
+
+import argparse
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_pipeline import dataset_path
+from src.classification import (
+    NET_RATING_CONTENDER,
+    NET_RATING_HIGH_RISK,
+    TURNOVER_RATIO_LIMIT,
+    WIN_PCT_CONTENDER,
+    WIN_PCT_HIGH_RISK,
+    classify_team_strength,
+)
+from src.data_loader import read_games_csv
+from src.metrics import aggregate_team_season_metrics
+from src.model import prepare_model_data
+from src.pandas_compat import PANDAS_MAJOR
+from src.preprocessing import COLUMNS_TO_KEEP, preprocess_data
+from src.simulation import _summarize
+
+
+# -----------------------------------
+# Pre-refactor references
+# -----------------------------------
+def reference_preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+
+    df = df[COLUMNS_TO_KEEP]
+
+    valid_results = {0, 1}
+    if not set(df["RESULT"].unique()).issubset(valid_results):
+        raise ValueError(
+            "RESULT column must contain only 0 (loss) or 1 (win)"
+        )
+
+    numeric_cols = df.select_dtypes(include="number").columns
+    df[numeric_cols] = df[numeric_cols].fillna(0)
+
+    categorical_cols = df.select_dtypes(include="object").columns
+    df[categorical_cols] = df[categorical_cols].fillna("Unknown")
+
+    df = df[df["FGA"] >= df["FGM"]]
+    df = df[df["FG3A"] >= df["FG3M"]]
+    df = df[df["FTA"] >= df["FTM"]]
+
+    df = df.sort_values(
+        by=["SEASON", "TEAM_NAME", "GAME_ID"]
+    ).reset_index(drop=True)
+
+    return df
+
+
+def reference_classify_team_strength(
+    team_season_df: pd.DataFrame,
+) -> pd.DataFrame:
+    df = team_season_df.copy()
+
+    conditions = [
+        (
+            (df["win_pct"] >= WIN_PCT_CONTENDER)
+            & (df["net_rating"] >= NET_RATING_CONTENDER)
+            & (df["turnover_ratio"] <= TURNOVER_RATIO_LIMIT)
+        ),
+        (
+            (df["win_pct"] <= WIN_PCT_HIGH_RISK)
+            & (df["net_rating"] <= NET_RATING_HIGH_RISK)
+        ),
+    ]
+
+    choices = [
+        "Strong Contender",
+        "High Risk",
+    ]
+
+    df["team_strength"] = pd.Series(
+        pd.NA, index=df.index
+    )
+
+    df.loc[conditions[0], "team_strength"] = choices[0]
+    df.loc[conditions[1], "team_strength"] = choices[1]
+
+    df["team_strength"] = df["team_strength"].fillna(
+        "Inconsistent Performer"
+    )
+
+    return df
+
+
+def _on_deep_copy(func):
+    return lambda data: func(data.copy(deep=True))
+
+
+# -----------------------------------
+# Sample data
+# -----------------------------------
+def with_missing_values(
+    raw: pd.DataFrame, share: float, seed: int
+) -> pd.DataFrame:
+    """
+    Blanks a share of the kept numeric and text cells (never RESULT)
+    so the missing-value handling is exercised.
+    """
+
+    rng = np.random.default_rng(seed)
+    raw = raw.copy()
+
+    for col in COLUMNS_TO_KEEP:
+        if col == "RESULT":
+            continue
+        mask = rng.random(len(raw)) < share
+        if raw[col].dtype.kind == "i":
+            raw[col] = raw[col].astype(float)
+        raw.loc[mask, col] = np.nan
+
+    return raw
+
+
+def summarize_inputs(team_season: pd.DataFrame, seed: int) -> tuple:
+    """
+    Standings and random simulation totals for one season, shaped as
+    iter_simulate_season passes them to _summarize.
+    """
+
+    rng = np.random.default_rng(seed)
+    season = team_season["SEASON"].max()
+    standings = team_season.loc[
+        team_season["SEASON"] == season,
+        ["TEAM_ID", "TEAM_NAME", "wins", "games_played"],
+    ].reset_index(drop=True)
+    standings = standings.assign(
+        losses=standings["games_played"] - standings["wins"]
+    ).drop(columns="games_played")
+
+    teams = len(standings)
+    simulations = 200
+    totals = {
+        "simulations": simulations,
+        "playoff_spots": min(8, teams),
+        "win_hist": rng.multinomial(
+            simulations, np.full(83, 1 / 83), size=teams
+        ),
+        "seed_hist": rng.multinomial(
+            simulations, np.full(teams, 1 / teams), size=teams
+        ),
+    }
+    return totals, standings
+
+
+# -----------------------------------
+# Comparison
+# -----------------------------------
+def assert_same(current, reference) -> None:
+    if isinstance(current, pd.DataFrame):
+        pd.testing.assert_frame_equal(current, reference)
+    elif isinstance(current, pd.Series):
+        pd.testing.assert_series_equal(current, reference)
+    elif isinstance(current, (tuple, list)):
+        assert len(current) == len(reference)
+        for a, b in zip(current, reference):
+            assert_same(a, b)
+    elif isinstance(current, dict):
+        assert current.keys() == reference.keys()
+        for key in current:
+            assert_same(current[key], reference[key])
+    else:
+        assert current == reference, f"{current!r} != {reference!r}"
+
+
+def copy_on_write_modes() -> list:
+    """
+    The copy-on-write settings to run the current stages under.
+    """
+
+    modes = [("default", nullcontext)]
+    if PANDAS_MAJOR < 3:
+        modes.append(
+            (
+                "copy-on-write off",
+                lambda: pd.option_context("mode.copy_on_write", False),
+            )
+        )
+    return modes
+
+
+def check_stage(name: str, func, reference, data) -> list:
+    """
+    Runs a stage under every copy-on-write mode and compares it with
+    its reference.
+
+    Returns:
+        list: Failure messages (empty when the stage matches)
+    """
+
+    failures = []
+    expected = reference(data)
+
+    for mode, context in copy_on_write_modes():
+        before = data.copy(deep=True) if hasattr(data, "copy") else data
+        with context():
+            result = func(data)
+
+        try:
+            assert_same(result, expected)
+        except AssertionError as error:
+            failures.append(f"{name} [{mode}]: output differs\n{error}")
+
+        try:
+            assert_same(data, before)
+        except AssertionError as error:
+            failures.append(f"{name} [{mode}]: input was modified\n{error}")
+
+    return failures
+
+
+def run_checks(raw: pd.DataFrame, seed: int) -> list:
+    """
+    Checks every stage that dropped its defensive copy.
+
+    Returns:
+        list: (stage, failures) pairs
+    """
+
+    clean = preprocess_data(raw)
+    team_season = aggregate_team_season_metrics(clean)
+    totals, standings = summarize_inputs(team_season, seed)
+
+    checks = [
+        (
+            "preprocess_data",
+            preprocess_data,
+            reference_preprocess_data,
+            raw,
+        ),
+        (
+            "classify_team_strength",
+            classify_team_strength,
+            reference_classify_team_strength,
+            team_season,
+        ),
+        (
+            "prepare_model_data",
+            prepare_model_data,
+            _on_deep_copy(prepare_model_data),
+            team_season,
+        ),
+        (
+            "simulation odds",
+            lambda frame: _summarize(totals, frame),
+            _on_deep_copy(lambda frame: _summarize(totals, frame)),
+            standings,
+        ),
+    ]
+
+    return [
+        (name, check_stage(name, func, reference, data))
+        for name, func, reference, data in checks
+    ]
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--nan-share",
+        type=float,
+        default=0.02,
+        help="share of cells blanked to exercise missing-value handling",
+    )
+    args = parser.parse_args(argv)
+
+    modes = ", ".join(mode for mode, _ in copy_on_write_modes())
+    print(f"pandas {pd.__version__}, modes: {modes}")
+
+    failed = False
+    for scale in args.scales:
+        raw = read_games_csv(dataset_path(scale, args.seed))
+        samples = [("as generated", raw)]
+        if args.nan_share > 0:
+            samples.append(
+                (
+                    f"{args.nan_share:.0%} missing",
+                    with_missing_values(raw, args.nan_share, args.seed),
+                )
+            )
+
+        for label, sample in samples:
+            for name, failures in run_checks(sample, args.seed):
+                status = "ok" if not failures else "FAILED"
+                print(f"{scale}x {label:<14} {name:<24} {status}")
+                for failure in failures:
+                    print(f"  {failure}")
+                failed = failed or bool(failures)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+"""
+Deterministic synthetic NBA game data for benchmarks.
+
+Produces game-level team rows with the EXPECTED_COLUMNS schema of
+src/data_loader.py. Every game contributes two rows (home first, then
+away) that share a GAME_ID, with consistent points, plus-minus and
+results. Scale 1 matches the real dataset (30 teams, 82 games, 13
+seasons, ~32k rows); scale N has N times as many teams, so games,
+team-seasons and every downstream table grow N-fold.
+
+Output depends only on (scale, seed): each season draws from its own
+seeded generator, so writing season by season gives the same file as
+generating everything at once.
+
+Usage:
+    python -m benchmarks.synthetic_data games_10x.csv --scale 10
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import EXPECTED_COLUMNS
+
+
+# -----------------------------------
+# League shape
+# -----------------------------------
+BASE_TEAMS = 30
+GAMES_PER_TEAM = 82
+SEASONS = list(range(2012, 2025))
+COVID_SEASONS = {2020, 2021}
+
+FIRST_TEAM_ID = 1610612737
+
+
+def league_teams(scale: int = 1) -> pd.DataFrame:
+    """
+    Team identifiers for a league of BASE_TEAMS * scale teams.
+    """
+
+    n_teams = BASE_TEAMS * scale
+    width = max(len(str(n_teams - 1)), 2)
+    index = np.arange(n_teams)
+
+    return pd.DataFrame(
+        {
+            "TEAM_ID": FIRST_TEAM_ID + index,
+            "TEAM_NAME": [f"Team {i}" for i in index],
+            "TEAM_ABBREVIATION": [f"T{i:0{width}d}" for i in index],
+            "TEAM_CITY": [f"City {i}" for i in index],
+        }
+    )
+
+
+# -----------------------------------
+# Game generation
+# -----------------------------------
+def _box_scores(
+    rng: np.random.Generator,
+    strength: np.ndarray,
+    home: bool,
+) -> dict:
+    n = len(strength)
+    edge = strength + (0.3 if home else 0.0)
+
+    fga = rng.integers(75, 95, n)
+    fgm = rng.binomial(fga, np.clip(0.46 + 0.015 * edge, 0.3, 0.6))
+    fg3a = rng.integers(20, 45, n)
+    fg3m = np.minimum(
+        rng.binomial(fg3a, np.clip(0.355 + 0.01 * edge, 0.2, 0.5)), fgm
+    )
+    fta = rng.integers(15, 32, n)
+    ftm = rng.binomial(fta, 0.77)
+    oreb = rng.integers(5, 15, n)
+    dreb = rng.integers(30, 40, n) + np.rint(edge).astype(int)
+
+    return {
+        "FGM": fgm,
+        "FGA": fga,
+        "FG3M": fg3m,
+        "FG3A": fg3a,
+        "FTM": ftm,
+        "FTA": fta,
+        "OREB": oreb,
+        "DREB": dreb,
+        "AST": rng.binomial(fgm, 0.6),
+        "STL": rng.integers(4, 12, n),
+        "BLK": rng.integers(2, 9, n),
+        "TO": np.clip(rng.integers(8, 20, n) - np.rint(edge), 0, None).astype(
+            int
+        ),
+        "PF": rng.integers(15, 25, n),
+    }
+
+
+def generate_season(season: int, scale: int = 1, seed: int = 0) -> pd.DataFrame:
+    """
+    Generates one season of paired game rows.
+
+    Every team plays GAMES_PER_TEAM games: each round shuffles the
+    league into home/away pairs.
+
+    Args:
+        season (int): Season year
+        scale (int): League size as a multiple of 30 teams
+        seed (int): Base random seed
+
+    Returns:
+        pd.DataFrame: Game-level team rows with the EXPECTED_COLUMNS schema
+    """
+
+    if scale < 1:
+        raise ValueError("scale must be a positive integer")
+
+    rng = np.random.default_rng([seed, scale, season])
+    teams = league_teams(scale)
+    n_teams = len(teams)
+
+    strength = rng.normal(0.0, 1.0, n_teams)
+
+    rounds = rng.permuted(
+        np.tile(np.arange(n_teams), (GAMES_PER_TEAM, 1)), axis=1
+    )
+    home_idx = rounds[:, 0::2].ravel()
+    away_idx = rounds[:, 1::2].ravel()
+    n_games = len(home_idx)
+
+    home = _box_scores(rng, strength[home_idx], home=True)
+    away = _box_scores(rng, strength[away_idx], home=False)
+
+    # Points, with ties broken by one extra home free throw
+    home_pts = 2 * home["FGM"] + home["FG3M"] + home["FTM"]
+    away_pts = 2 * away["FGM"] + away["FG3M"] + away["FTM"]
+    tied = home_pts == away_pts
+    home["FTM"] = home["FTM"] + tied
+    home["FTA"] = np.maximum(home["FTA"], home["FTM"])
+    home_pts = home_pts + tied
+
+    # Rows alternate home, away for each game
+    def interleave(home_values, away_values) -> np.ndarray:
+        values = np.empty(2 * n_games, dtype=np.result_type(home_values))
+        values[0::2] = home_values
+        values[1::2] = away_values
+        return values
+
+    team_idx = interleave(home_idx, away_idx)
+    pts = interleave(home_pts, away_pts)
+    opp_pts = interleave(away_pts, home_pts)
+
+    df = pd.DataFrame(
+        {
+            "GAME_ID": np.repeat(
+                season * 1_000_000 + np.arange(1, n_games + 1), 2
+            ),
+            "TEAM_ID": teams["TEAM_ID"].to_numpy()[team_idx],
+            "TEAM_NAME": teams["TEAM_NAME"].to_numpy()[team_idx],
+            "TEAM_ABBREVIATION": teams["TEAM_ABBREVIATION"].to_numpy()[
+                team_idx
+            ],
+            "TEAM_CITY": teams["TEAM_CITY"].to_numpy()[team_idx],
+            "HOME_TEAM": np.repeat(
+                teams["TEAM_ABBREVIATION"].to_numpy()[home_idx], 2
+            ),
+            "MIN": "240:00",
+        }
+    )
+
+    for col in home:
+        df[col] = interleave(home[col], away[col])
+
+    df["REB"] = df["OREB"] + df["DREB"]
+    df["PTS"] = pts
+    df["PLUS_MINUS"] = pts - opp_pts
+    df["RESULT"] = (pts > opp_pts).astype(int)
+
+    df["FG_PCT"] = df["FGM"] / df["FGA"]
+    df["FG3_PCT"] = df["FG3M"] / df["FG3A"]
+    df["FT_PCT"] = df["FTM"] / df["FTA"]
+    df["EFG_PCT"] = (df["FGM"] + 0.5 * df["FG3M"]) / df["FGA"]
+    df["PIE"] = np.clip(
+        pts / (pts + opp_pts) + rng.normal(0.0, 0.02, 2 * n_games), 0.0, 1.0
+    )
+
+    df["COVID_FLAG"] = int(season in COVID_SEASONS)
+    df["SEASON"] = season
+    df["WIN_PCT"] = df.groupby("TEAM_ID")["RESULT"].transform("mean")
+
+    return df[list(EXPECTED_COLUMNS)].astype(EXPECTED_COLUMNS)
+
+
+def generate_games(scale: int = 1, seed: int = 0) -> pd.DataFrame:
+    """
+    Generates every season of a synthetic league in memory.
+    """
+
+    return pd.concat(
+        [generate_season(season, scale, seed) for season in SEASONS],
+        ignore_index=True,
+    )
+
+
+def write_games_csv(path: Path, scale: int = 1, seed: int = 0) -> Path:
+    """
+    Writes a synthetic dataset to CSV one season at a time, so memory
+    stays bounded by a single season even at large scales.
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    for i, season in enumerate(SEASONS):
+        generate_season(season, scale, seed).to_csv(
+            tmp_path, mode="w" if i == 0 else "a", header=i == 0, index=False
+        )
+
+    tmp_path.replace(path)
+    return path
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output", type=Path, help="CSV file to write")
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    write_games_csv(args.output, args.scale, args.seed)
+    print(f"wrote {args.output} (scale {args.scale}x, seed {args.seed})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,25 @@
 import streamlit as st
-import plotly.express as px
 
-from src.data_loader import load_data
-from src.preprocessing import preprocess_data
-from src.metrics import aggregate_team_season_metrics
-from src.summaries import league_overview_summary
+from src.pipeline import (
+    dataset_fingerprint,
+    load_league_overview_summary,
+    load_seasons,
+    query_team_season_metrics,
+)
+from src.figure_cache import cached_figure
+from src.lazy import lazy_import
+from src.rendering import plot_frame, render_mode
+from src.instrumentation import page_section
+from src.ui import (
+    apply_sidebar_style,
+    render_debug_panel,
+    select_dataset,
+    start_debug_run,
+)
+
+px = lazy_import("plotly.express")
+
+start_debug_run()
 
 
 # -----------------------------------
@@ -23,54 +38,32 @@ st.markdown(
 # ---------------------------------
 # Side Bar Customization
 # ---------------------------------
-st.markdown(
-    """
-    <style>
-    /* Sidebar spacing */
-    section[data-testid="stSidebar"] ul {
-        gap: 12px;
-    }
-
-    /* Sidebar text size */
-    section[data-testid="stSidebar"] span {
-        font-size: 16px;
-    }
-
-    /* Sidebar page labels spacing */
-    section[data-testid="stSidebar"] li {
-        margin-bottom: 10px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+apply_sidebar_style()
+dataset_key = select_dataset()
 
 # -----------------------------------
 # Load & prepare data
 # -----------------------------------
-df_raw = load_data()
-df_clean = preprocess_data(df_raw)
-
-# 🔧 Correct metrics function
-team_season_df = aggregate_team_season_metrics(df_clean)
+page_section("Load & prepare data")
+data_fingerprint = dataset_fingerprint(dataset_key)
 
 # -----------------------------------
 # Season filter
 # -----------------------------------
-seasons = sorted(team_season_df["SEASON"].unique())
+page_section("Season filter")
+seasons = load_seasons(dataset_key)
 selected_seasons = st.multiselect(
     "Select Seasons",
     seasons,
     default=seasons,
 )
 
-filtered_df = team_season_df[
-    team_season_df["SEASON"].isin(selected_seasons)
-]
+filtered_df = query_team_season_metrics(dataset_key, seasons=selected_seasons)
 
 # -----------------------------------
 # KPI Metrics (validated outputs)
 # -----------------------------------
+page_section("KPI Metrics")
 st.subheader("📊 League KPIs")
 
 col1, col2, col3 = st.columns(3)
@@ -96,13 +89,20 @@ with col3:
 # -----------------------------------
 # Win % distribution
 # -----------------------------------
+page_section("Win % distribution")
 st.subheader("🏆 Win Percentage Distribution")
 
-fig_win_dist = px.histogram(
-    filtered_df,
-    x="win_pct",
-    nbins=20,
-    labels={"win_pct": "Win Percentage"},
+fig_win_dist = cached_figure(
+    "league_overview",
+    "win_distribution",
+    selected_seasons,
+    data_fingerprint,
+    lambda: px.histogram(
+        plot_frame(filtered_df, ["win_pct"]),
+        x="win_pct",
+        nbins=20,
+        labels={"win_pct": "Win Percentage"},
+    ),
 )
 
 st.plotly_chart(fig_win_dist, use_container_width=True)
@@ -110,18 +110,29 @@ st.plotly_chart(fig_win_dist, use_container_width=True)
 # -----------------------------------
 # Points vs Net Rating
 # -----------------------------------
+page_section("Points vs Net Rating")
 st.subheader("📈 Offense vs Impact")
 
-fig_scatter = px.scatter(
-    filtered_df,
-    x="points_per_game",
-    y="net_rating",
-    hover_name="TEAM_NAME",
-    color="SEASON",
-    labels={
-        "points_per_game": "Points per Game",
-        "net_rating": "Net Rating",
-    },
+fig_scatter = cached_figure(
+    "league_overview",
+    "offense_vs_impact",
+    selected_seasons,
+    data_fingerprint,
+    lambda: px.scatter(
+        plot_frame(
+            filtered_df,
+            ["points_per_game", "net_rating", "TEAM_NAME", "SEASON"],
+        ),
+        x="points_per_game",
+        y="net_rating",
+        hover_name="TEAM_NAME",
+        color="SEASON",
+        labels={
+            "points_per_game": "Points per Game",
+            "net_rating": "Net Rating",
+        },
+        render_mode=render_mode(len(filtered_df)),
+    ),
 )
 
 st.plotly_chart(fig_scatter, use_container_width=True)
@@ -129,7 +140,10 @@ st.plotly_chart(fig_scatter, use_container_width=True)
 # -----------------------------------
 # Auto-generated summary ⭐
 # -----------------------------------
+page_section("Auto-generated summary")
 st.subheader("🧠 League Summary")
 
-summary_text = league_overview_summary(team_season_df)
-st.markdown(summary_text)
\ No newline at end of file
+summary_text = load_league_overview_summary(dataset_key)
+st.markdown(summary_text)
+
+render_debug_panel()
@@ -1,12 +1,34 @@
 import streamlit as st
-import plotly.express as px
 
-from src.data_loader import load_data
-from src.preprocessing import preprocess_data
-from src.metrics import aggregate_team_season_metrics
-from src.classification import classify_team_strength
-from src.summaries import team_performance_summary
+from src.pipeline import (
+    dataset_fingerprint,
+    load_game_log_index,
+    load_league_rank_store,
+    load_team_season_store,
+)
+from src.insights import INSIGHT_METRICS
+from src.game_log import GAME_LOG_PAGE_SIZE, GAME_LOG_SORTS
+from src.summaries import (
+    league_context_table,
+    league_rank_text,
+    team_performance_summary,
+)
 from src.metric_definitions import METRIC_DEFINITIONS
+from src.figure_cache import cached_figure
+from src.lazy import lazy_import
+from src.rendering import plot_frame, render_mode, table_frame
+from src.instrumentation import page_section
+from src.ui import (
+    apply_sidebar_style,
+    page_bounds,
+    render_debug_panel,
+    select_dataset,
+    start_debug_run,
+)
+
+px = lazy_import("plotly.express")
+
+start_debug_run()
 
 # -----------------------------------
 # Page configuration
@@ -24,31 +46,13 @@ st.markdown(
 # ---------------------------------
 # Side Bar Customization
 # ---------------------------------
-st.markdown(
-    """
-    <style>
-    /* Sidebar spacing */
-    section[data-testid="stSidebar"] ul {
-        gap: 12px;
-    }
-
-    /* Sidebar text size */
-    section[data-testid="stSidebar"] span {
-        font-size: 16px;
-    }
-
-    /* Sidebar page labels spacing */
-    section[data-testid="stSidebar"] li {
-        margin-bottom: 10px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+apply_sidebar_style()
+dataset_key = select_dataset()
 
 # -----------------------------------
 # Metric Definitions Panel
 # -----------------------------------
+page_section("Metric Definitions Panel")
 with st.expander("ℹ️ Metric Definitions"):
     for metric, definition in METRIC_DEFINITIONS.items():
         st.markdown(f"**{metric}**: {definition}")
@@ -56,32 +60,32 @@ with st.expander("ℹ️ Metric Definitions"):
 # -----------------------------------
 # Load & prepare data
 # -----------------------------------
-df_raw = load_data()
-df_clean = preprocess_data(df_raw)
-
-team_season_df = aggregate_team_season_metrics(df_clean)
-classified_df = classify_team_strength(team_season_df)
+page_section("Load & prepare data")
+store = load_team_season_store(dataset_key, classified=True)
+data_fingerprint = dataset_fingerprint(dataset_key)
 
 # -----------------------------------
 # Filters: Team & Season
 # -----------------------------------
-teams = sorted(classified_df["TEAM_NAME"].unique())
+page_section("Filters: Team & Season")
+teams = store.team_names()
 selected_team = st.selectbox("Select Team", teams)
 
-team_df = classified_df[
-    classified_df["TEAM_NAME"] == selected_team
-].sort_values("SEASON")
+team_id = store.team_id(selected_team)
+team_df = store.team_frame(team_id)
 
-seasons = sorted(team_df["SEASON"].unique())
+seasons = store.seasons(team_id).tolist()
 selected_season = st.selectbox("Select Season", seasons)
 
-selected_team_df = team_df[
-    team_df["SEASON"] == selected_season
-]
+selected_team_df = store.rows(team_id, selected_season)
+
+# Precomputed league ranks of the team-season (a keyed lookup)
+team_ranks = load_league_rank_store(dataset_key).row(team_id, selected_season)
 
 # -----------------------------------
 # KPI Metrics
 # -----------------------------------
+page_section("KPI Metrics")
 st.subheader("🏀 Key Performance Indicators")
 
 col1, col2, col3, col4 = st.columns(4)
@@ -97,12 +101,16 @@ with col2:
         "Points / Game",
         f"{selected_team_df['points_per_game'].iloc[0]:.1f}"
     )
+    st.caption(
+        f"{league_rank_text(team_ranks, 'points_per_game')} in the league"
+    )
 
 with col3:
     st.metric(
         "Net Rating",
         f"{selected_team_df['net_rating'].iloc[0]:.2f}"
     )
+    st.caption(f"{league_rank_text(team_ranks, 'net_rating')} in the league")
 
 with col4:
     st.metric(
@@ -110,18 +118,47 @@ with col4:
         selected_team_df["team_strength"].iloc[0]
     )
 
+# -----------------------------------
+# League Context
+# -----------------------------------
+page_section("League Context")
+st.subheader("🏅 League Context")
+st.caption(
+    f"Where {selected_team} ranked among {int(team_ranks['league_size'])} "
+    f"teams in {selected_season}. Rank 1 and the 100th percentile are the "
+    "league's best; for turnovers and fouls, that is the lowest value."
+)
+
+st.dataframe(
+    table_frame(
+        league_context_table(
+            selected_team_df.iloc[0], team_ranks, INSIGHT_METRICS
+        )
+    ),
+    hide_index=True,
+    use_container_width=True,
+)
+
 # -----------------------------------
 # Season Trend: Win %
 # -----------------------------------
+page_section("Season Trend: Win %")
 st.subheader("📈 Season Trend: Win Percentage")
 
-fig_trend = px.line(
-    team_df,
-    x="SEASON",
-    y="win_pct",
-    markers=True,
-    labels={"win_pct": "Win Percentage"},
-    title=f"{selected_team} Win % Over Seasons"
+fig_trend = cached_figure(
+    "team_performance",
+    "win_pct_trend",
+    selected_team,
+    data_fingerprint,
+    lambda: px.line(
+        plot_frame(team_df, ["SEASON", "win_pct"]),
+        x="SEASON",
+        y="win_pct",
+        markers=True,
+        labels={"win_pct": "Win Percentage"},
+        title=f"{selected_team} Win % Over Seasons",
+        render_mode=render_mode(len(team_df)),
+    ),
 )
 
 st.plotly_chart(fig_trend, use_container_width=True)
@@ -129,6 +166,7 @@ st.plotly_chart(fig_trend, use_container_width=True)
 # -----------------------------------
 # Season Trend Analytics: Multiple Metrics
 # -----------------------------------
+page_section("Season Trend Analytics: Multiple Metrics")
 st.subheader("📊 Season Trends: Key Metrics")
 
 metrics_to_plot = [
@@ -139,17 +177,24 @@ metrics_to_plot = [
     "pie"
 ]
 
-fig_metrics = px.line(
-    team_df,
-    x="SEASON",
-    y=metrics_to_plot,
-    markers=True,
-    labels={
-        "value": "Metric Value",
-        "variable": "Metric",
-        "SEASON": "Season"
-    },
-    title=f"{selected_team} Key Metrics Over Seasons"
+fig_metrics = cached_figure(
+    "team_performance",
+    "key_metrics_trend",
+    selected_team,
+    data_fingerprint,
+    lambda: px.line(
+        plot_frame(team_df, ["SEASON"] + metrics_to_plot),
+        x="SEASON",
+        y=metrics_to_plot,
+        markers=True,
+        labels={
+            "value": "Metric Value",
+            "variable": "Metric",
+            "SEASON": "Season"
+        },
+        title=f"{selected_team} Key Metrics Over Seasons",
+        render_mode=render_mode(len(team_df) * len(metrics_to_plot)),
+    ),
 )
 
 st.plotly_chart(fig_metrics, use_container_width=True)
@@ -157,14 +202,15 @@ st.plotly_chart(fig_metrics, use_container_width=True)
 # -----------------------------------
 # Season Trend Summary
 # -----------------------------------
+page_section("Season Trend Summary")
 st.subheader("🧠 Season Trend Summary")
 
 latest = selected_team_df.iloc[0]
-previous_season = team_df[team_df["SEASON"] < selected_season].sort_values("SEASON", ascending=False).head(1)
+previous_season = store.previous_season(team_id, selected_season)
 
 trend_text = ""
-if not previous_season.empty:
-    prev = previous_season.iloc[0]
+if previous_season is not None:
+    prev = store.row(team_id, previous_season)
     for metric in metrics_to_plot:
         change = latest[metric] - prev[metric]
         trend_text += f"- **{metric}** changed by {change:.2f} from last season.\n"
@@ -173,10 +219,67 @@ else:
 
 st.markdown(trend_text)
 
+# -----------------------------------
+# Game Log
+# -----------------------------------
+page_section("Game Log")
+st.subheader("🗒️ Game Log")
+
+game_log = load_game_log_index(dataset_key)
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    result_filter = st.radio(
+        "Games",
+        ["All", "Wins", "Losses"],
+        horizontal=True,
+        key="game_log_result",
+    )
+
+with col2:
+    sort_label = st.selectbox(
+        "Sort By",
+        list(GAME_LOG_SORTS),
+        key="game_log_sort",
+    )
+
+with col3:
+    sort_order = st.selectbox(
+        "Order",
+        ["Ascending", "Descending"],
+        key="game_log_order",
+    )
+
+# Only the visible page of the team-season's games is materialized
+positions = game_log.select(
+    team_id,
+    selected_season,
+    result={"All": None, "Wins": 1, "Losses": 0}[result_filter],
+    sort_by=GAME_LOG_SORTS[sort_label],
+    ascending=sort_order == "Ascending",
+)
+
+if len(positions) == 0:
+    st.info("No games match the selected filters.")
+else:
+    start, stop = page_bounds(
+        len(positions), key="game_log_page", page_size=GAME_LOG_PAGE_SIZE
+    )
+    st.dataframe(
+        table_frame(game_log.rows(positions[start:stop])),
+        hide_index=True,
+        use_container_width=True,
+    )
+    st.caption(f"Games {start + 1:,}–{stop:,} of {len(positions):,}")
+
 # -----------------------------------
 # Auto-generated dynamic summary ⭐
 # -----------------------------------
+page_section("Auto-generated dynamic summary")
 st.subheader("🧠 Team Summary")
 
 summary_text = team_performance_summary(selected_team_df)
-st.markdown(summary_text)
\ No newline at end of file
+st.markdown(summary_text)
+
+render_debug_panel()
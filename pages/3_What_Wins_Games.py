@@ -1,15 +1,31 @@
 import streamlit as st
-import plotly.express as px
 
-from src.data_loader import load_data
-from src.preprocessing import preprocess_data
-from src.metrics import aggregate_team_season_metrics
+from src.pipeline import (
+    dataset_fingerprint,
+    load_seasons,
+    load_win_correlations,
+    query_team_season_metrics,
+)
 from src.insights import (
     calculate_win_correlations,
     identify_key_win_drivers,
     prepare_scatter_data,
 )
 from src.summaries import insight_summary
+from src.figure_cache import cached_figure
+from src.lazy import lazy_import
+from src.rendering import plot_frame, render_mode
+from src.instrumentation import page_section
+from src.ui import (
+    apply_sidebar_style,
+    render_debug_panel,
+    select_dataset,
+    start_debug_run,
+)
+
+px = lazy_import("plotly.express")
+
+start_debug_run()
 
 
 # -----------------------------------
@@ -29,65 +45,54 @@ st.markdown(
 # ---------------------------------
 # Side Bar Customization
 # ---------------------------------
-st.markdown(
-    """
-    <style>
-    /* Sidebar spacing */
-    section[data-testid="stSidebar"] ul {
-        gap: 12px;
-    }
-
-    /* Sidebar text size */
-    section[data-testid="stSidebar"] span {
-        font-size: 16px;
-    }
-
-    /* Sidebar page labels spacing */
-    section[data-testid="stSidebar"] li {
-        margin-bottom: 10px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+apply_sidebar_style()
+dataset_key = select_dataset()
 
 # -----------------------------------
 # Load & prepare data
 # -----------------------------------
-df_raw = load_data()
-df_clean = preprocess_data(df_raw)
-team_season_df = aggregate_team_season_metrics(df_clean)
+page_section("Load & prepare data")
+data_fingerprint = dataset_fingerprint(dataset_key)
 
 # -----------------------------------
 # Season filter
 # -----------------------------------
-seasons = sorted(team_season_df["SEASON"].unique())
+page_section("Season filter")
+seasons = load_seasons(dataset_key)
 selected_seasons = st.multiselect(
     "Select Seasons",
     seasons,
     default=seasons,
 )
 
-filtered_df = team_season_df[
-    team_season_df["SEASON"].isin(selected_seasons)
-]
+filtered_df = query_team_season_metrics(dataset_key, seasons=selected_seasons)
 
 # -----------------------------------
 # Correlation analysis
 # -----------------------------------
+page_section("Correlation analysis")
 st.subheader("📊 Metric Correlation with Winning")
 
-corr_df = calculate_win_correlations(filtered_df)
-
-fig_corr = px.bar(
-    corr_df,
-    x="correlation_with_win_pct",
-    y="metric",
-    orientation="h",
-    labels={
-        "correlation_with_win_pct": "Correlation with Win %",
-        "metric": "Metric",
-    },
+if set(selected_seasons) == set(seasons):
+    corr_df = load_win_correlations(dataset_key)
+else:
+    corr_df = calculate_win_correlations(filtered_df)
+
+fig_corr = cached_figure(
+    "what_wins_games",
+    "win_correlations",
+    selected_seasons,
+    data_fingerprint,
+    lambda: px.bar(
+        plot_frame(corr_df, ["correlation_with_win_pct", "metric"]),
+        x="correlation_with_win_pct",
+        y="metric",
+        orientation="h",
+        labels={
+            "correlation_with_win_pct": "Correlation with Win %",
+            "metric": "Metric",
+        },
+    ),
 )
 
 st.plotly_chart(fig_corr, use_container_width=True)
@@ -95,11 +100,13 @@ st.plotly_chart(fig_corr, use_container_width=True)
 # -----------------------------------
 # Identify key drivers
 # -----------------------------------
+page_section("Identify key drivers")
 drivers = identify_key_win_drivers(corr_df)
 
 # -----------------------------------
 # Scatter relationship explorer
 # -----------------------------------
+page_section("Scatter relationship explorer")
 st.subheader("🔍 Explore Metric vs Winning")
 
 available_metrics = corr_df["metric"].tolist()
@@ -113,16 +120,26 @@ scatter_df = prepare_scatter_data(
     x_metric=selected_metric,
 )
 
-fig_scatter = px.scatter(
-    scatter_df,
-    x=selected_metric,
-    y="win_pct",
-    hover_name="TEAM_NAME",
-    color="SEASON",
-    labels={
-        selected_metric: selected_metric.replace("_", " ").title(),
-        "win_pct": "Win Percentage",
-    },
+fig_scatter = cached_figure(
+    "what_wins_games",
+    "metric_vs_win_pct",
+    [selected_seasons, selected_metric],
+    data_fingerprint,
+    lambda: px.scatter(
+        plot_frame(
+            scatter_df,
+            [selected_metric, "win_pct", "TEAM_NAME", "SEASON"],
+        ),
+        x=selected_metric,
+        y="win_pct",
+        hover_name="TEAM_NAME",
+        color="SEASON",
+        labels={
+            selected_metric: selected_metric.replace("_", " ").title(),
+            "win_pct": "Win Percentage",
+        },
+        render_mode=render_mode(len(scatter_df)),
+    ),
 )
 
 st.plotly_chart(fig_scatter, use_container_width=True)
@@ -130,7 +147,10 @@ st.plotly_chart(fig_scatter, use_container_width=True)
 # -----------------------------------
 # Auto-generated insight summary ⭐
 # -----------------------------------
+page_section("Auto-generated insight summary")
 st.subheader("🧠 Insight Summary")
 
 summary_text = insight_summary(drivers)  # drivers is dict of strong positive/negative metrics
 st.markdown(summary_text)
+
+render_debug_panel()
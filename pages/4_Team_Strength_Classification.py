@@ -1,11 +1,26 @@
 import streamlit as st
-import plotly.express as px
 
-from src.data_loader import load_data
-from src.preprocessing import preprocess_data
-from src.metrics import aggregate_team_season_metrics
-from src.classification import classify_team_strength
-from src.summaries import team_strength_summary
+from src.pipeline import (
+    dataset_fingerprint,
+    load_team_strength_summary,
+    load_seasons,
+    query_classified_team_seasons,
+)
+from src.figure_cache import cached_figure
+from src.lazy import lazy_import
+from src.rendering import plot_frame
+from src.instrumentation import page_section
+from src.ui import (
+    apply_sidebar_style,
+    paginated_dataframe,
+    render_debug_panel,
+    select_dataset,
+    start_debug_run,
+)
+
+px = lazy_import("plotly.express")
+
+start_debug_run()
 
 
 # -----------------------------------
@@ -25,60 +40,46 @@ st.markdown(
 # ---------------------------------
 # Side Bar Customization
 # ---------------------------------
-st.markdown(
-    """
-    <style>
-    /* Sidebar spacing */
-    section[data-testid="stSidebar"] ul {
-        gap: 12px;
-    }
-
-    /* Sidebar text size */
-    section[data-testid="stSidebar"] span {
-        font-size: 16px;
-    }
-
-    /* Sidebar page labels spacing */
-    section[data-testid="stSidebar"] li {
-        margin-bottom: 10px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+apply_sidebar_style()
+dataset_key = select_dataset()
 
 # -----------------------------------
 # Load & prepare data
 # -----------------------------------
-df_raw = load_data()
-df_clean = preprocess_data(df_raw)
-
-team_season_df = aggregate_team_season_metrics(df_clean)
-classified_df = classify_team_strength(team_season_df)
+page_section("Load & prepare data")
+data_fingerprint = dataset_fingerprint(dataset_key)
 
 # -----------------------------------
 # Season filter
 # -----------------------------------
-seasons = sorted(classified_df["SEASON"].unique())
+page_section("Season filter")
+seasons = load_seasons(dataset_key)
 selected_season = st.selectbox(
     "Select Season",
     seasons,
     index=len(seasons) - 1,
 )
 
-season_df = classified_df[
-    classified_df["SEASON"] == selected_season
-]
+season_df = query_classified_team_seasons(
+    dataset_key, seasons=[selected_season]
+)
 
 # -----------------------------------
 # Distribution of team strength
 # -----------------------------------
+page_section("Distribution of team strength")
 st.subheader("📊 Team Strength Distribution")
 
-fig_dist = px.pie(
-    season_df,
-    names="team_strength",
-    title="Team Strength Breakdown",
+fig_dist = cached_figure(
+    "team_strength",
+    "strength_distribution",
+    selected_season,
+    data_fingerprint,
+    lambda: px.pie(
+        plot_frame(season_df, ["team_strength"]),
+        names="team_strength",
+        title="Team Strength Breakdown",
+    ),
 )
 
 st.plotly_chart(fig_dist, use_container_width=True)
@@ -86,6 +87,7 @@ st.plotly_chart(fig_dist, use_container_width=True)
 # -----------------------------------
 # Table view
 # -----------------------------------
+page_section("Table view")
 st.subheader("📋 Team Classification Table")
 
 display_cols = [
@@ -96,18 +98,22 @@ display_cols = [
     "team_strength",
 ]
 
-st.dataframe(
+paginated_dataframe(
     season_df[display_cols].sort_values(
         by="win_pct",
         ascending=False,
     ),
+    key="strength_table_page",
     use_container_width=True,
 )
 
 # -----------------------------------
 # Auto-generated summary ⭐
 # -----------------------------------
+page_section("Auto-generated summary")
 st.subheader("🧠 Classification Summary")
 
-summary_text = team_strength_summary(classified_df)  # classified_df has team_strength column
-st.markdown(summary_text)
\ No newline at end of file
+summary_text = load_team_strength_summary(dataset_key)
+st.markdown(summary_text)
+
+render_debug_panel()
@@ -1,15 +1,35 @@
 import streamlit as st
-import plotly.express as px
 import pandas as pd
-from src.data_loader import load_data
-from src.preprocessing import preprocess_data
-from src.metrics import aggregate_team_season_metrics
+from src.pipeline import (
+    dataset_fingerprint,
+    load_game_scorer,
+    load_team_season_metrics,
+    load_team_season_store,
+    load_walk_forward,
+    load_win_scorer,
+)
 from src.insights import explain_win_prediction
-from src.model import (
-    train_win_prediction_model,
-    predict_win_probability,
+from src.what_if import (
+    cached_probability_surface,
+    feature_range,
+    what_if_probability,
 )
 from src.summaries import win_prediction_summary_v2
+from src.figure_cache import cached_figure
+from src.lazy import lazy_import
+from src.rendering import plot_array, plot_frame, render_mode
+from src.instrumentation import page_section
+from src.ui import (
+    apply_sidebar_style,
+    paginated_dataframe,
+    render_debug_panel,
+    select_dataset,
+    start_debug_run,
+)
+
+px = lazy_import("plotly.express")
+
+start_debug_run()
 
 
 # -----------------------------------
@@ -29,46 +49,27 @@ st.markdown(
 # ---------------------------------
 # Side Bar Customization
 # ---------------------------------
-st.markdown(
-    """
-    <style>
-    /* Sidebar spacing */
-    section[data-testid="stSidebar"] ul {
-        gap: 12px;
-    }
-
-    /* Sidebar text size */
-    section[data-testid="stSidebar"] span {
-        font-size: 16px;
-    }
-
-    /* Sidebar page labels spacing */
-    section[data-testid="stSidebar"] li {
-        margin-bottom: 10px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+apply_sidebar_style()
+dataset_key = select_dataset()
 
 # -----------------------------------
 # Load & prepare data
 # -----------------------------------
-df_raw = load_data()
-df_clean = preprocess_data(df_raw)
-team_season_df = aggregate_team_season_metrics(df_clean)
+page_section("Load & prepare data")
+team_season_df = load_team_season_metrics(dataset_key)
+data_fingerprint = dataset_fingerprint(dataset_key)
 
 # -----------------------------------
-# Train model
+# Train model (served from the model registry or snapshot)
 # -----------------------------------
-model_output = train_win_prediction_model(team_season_df)
-
-model = model_output["model"]
-accuracy = model_output["accuracy"]
+page_section("Train model")
+scorer = load_win_scorer(dataset_key)
+accuracy = scorer.metrics["accuracy"]
 
 # -----------------------------------
 # Model performance
 # -----------------------------------
+page_section("Model performance")
 st.subheader("📈 Model Performance")
 
 st.metric(
@@ -76,22 +77,88 @@ st.metric(
     f"{accuracy * 100:.2f}%"
 )
 
+# -----------------------------------
+# Walk-forward validation by season
+# -----------------------------------
+page_section("Walk-forward validation by season")
+st.subheader("📅 Season-by-Season Validation")
+st.markdown(
+    "Each season is predicted by a model trained only on the seasons "
+    "before it, giving a more honest view than a single random split."
+)
+
+walk_forward_df = load_walk_forward(dataset_key)
+
+fig_walk_forward = cached_figure(
+    "win_prediction",
+    "walk_forward_accuracy",
+    None,
+    data_fingerprint,
+    lambda: px.line(
+        plot_frame(walk_forward_df, ["SEASON", "accuracy"]),
+        x="SEASON",
+        y="accuracy",
+        markers=True,
+        labels={"accuracy": "Accuracy", "SEASON": "Test Season"},
+        render_mode=render_mode(len(walk_forward_df)),
+    ),
+)
+
+st.plotly_chart(fig_walk_forward, use_container_width=True)
+
+paginated_dataframe(
+    walk_forward_df,
+    key="walk_forward_page",
+    use_container_width=True,
+)
+
+# -----------------------------------
+# Game-level model (pre-game rolling features)
+# -----------------------------------
+page_section("Game-level model")
+st.subheader("🏟️ Game-Level Model")
+st.markdown(
+    "Predicts individual game results using only information available "
+    "before tip-off: each team's rolling form over its previous games, "
+    "the opponent's form, and home court."
+)
+
+game_metrics = load_game_scorer(dataset_key).metrics
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        "Game Accuracy",
+        f"{game_metrics['accuracy'] * 100:.2f}%"
+    )
+
+with col2:
+    st.metric(
+        "Games Trained On",
+        f"{game_metrics['n_train']:,}"
+    )
+
+with col3:
+    st.metric(
+        "Training Throughput",
+        f"{game_metrics['rows_per_second']:,.0f} rows/s"
+    )
+
 # -----------------------------------
 # Predict win probability (interactive)
 # -----------------------------------
+page_section("Predict win probability")
 st.subheader("🔮 Predict Win Probability")
 
-teams = sorted(team_season_df["TEAM_NAME"].unique())
+store = load_team_season_store(dataset_key)
+teams = store.team_names()
 selected_team = st.selectbox("Select Team", teams)
 
-team_data = team_season_df[
-    team_season_df["TEAM_NAME"] == selected_team
-].sort_values("SEASON", ascending=False)
-
-latest_team_data = team_data.head(1)
+team_id = store.team_id(selected_team)
+latest_team_data = store.rows(team_id, store.latest_season(team_id))
 
-probability = predict_win_probability(
-    model,
+probability = scorer.predict_win_probability(
     latest_team_data,
 ).iloc[0]
 
@@ -103,10 +170,11 @@ st.metric(
 # -----------------------------------
 # Feature impact visualization
 # -----------------------------------
+page_section("Feature impact visualization")
 st.subheader("📊 Feature Importance (Coefficients)")
 
-coefficients = model.named_steps["model"].coef_[0]
-features = model_output["feature_names"]
+coefficients = scorer.coef
+features = scorer.feature_names
 
 coef_df = pd.DataFrame(
     {
@@ -118,11 +186,17 @@ coef_df = pd.DataFrame(
     ascending=False,
 )
 
-fig_coef = px.bar(
-    coef_df,
-    x="Coefficient",
-    y="Feature",
-    orientation="h",
+fig_coef = cached_figure(
+    "win_prediction",
+    "coefficients",
+    scorer.fingerprint,
+    data_fingerprint,
+    lambda: px.bar(
+        plot_frame(coef_df, ["Coefficient", "Feature"]),
+        x="Coefficient",
+        y="Feature",
+        orientation="h",
+    ),
 )
 
 st.plotly_chart(fig_coef, use_container_width=True)
@@ -131,7 +205,7 @@ st.subheader("🔍 Why This Prediction?")
 
 explanation = explain_win_prediction(
     team_row=latest_team_data.iloc[0],
-    feature_names=model_output["feature_names"],
+    feature_names=scorer.feature_names,
     coefficients=coefficients,
 )
 
@@ -150,6 +224,7 @@ with col2:
 # -----------------------------------
 # Auto-generated summary ⭐
 # -----------------------------------
+page_section("Auto-generated summary")
 st.subheader("🧠 Prediction Summary")
 
 avg_probability = team_season_df["win_flag"].mean()
@@ -161,4 +236,98 @@ summary_text = win_prediction_summary_v2(
     accuracy=accuracy,
 )
 
-st.markdown(summary_text)
\ No newline at end of file
+st.markdown(summary_text)
+
+# -----------------------------------
+# What-if explorer
+# -----------------------------------
+page_section("What-if explorer")
+st.subheader("🧪 What-If Explorer")
+st.markdown(
+    f"How would **{selected_team}**'s win probability change if two "
+    "metrics were different? All other metrics stay at the team's "
+    "latest-season values."
+)
+
+features = scorer.feature_names
+
+col1, col2 = st.columns(2)
+
+with col1:
+    x_feature = st.selectbox("X-Axis Metric", features, index=0)
+
+with col2:
+    y_options = [f for f in features if f != x_feature]
+    y_feature = st.selectbox("Y-Axis Metric", y_options, index=0)
+
+base_row = latest_team_data.iloc[0][features]
+x_range = feature_range(team_season_df, x_feature)
+y_range = feature_range(team_season_df, y_feature)
+
+surface = cached_probability_surface(
+    scorer,
+    scorer.fingerprint,
+    selected_team,
+    base_row,
+    x_feature,
+    y_feature,
+    x_range,
+    y_range,
+)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    x_value = st.slider(
+        x_feature,
+        min_value=x_range[0],
+        max_value=x_range[1],
+        value=float(base_row[x_feature]),
+    )
+
+with col2:
+    y_value = st.slider(
+        y_feature,
+        min_value=y_range[0],
+        max_value=y_range[1],
+        value=float(base_row[y_feature]),
+    )
+
+# The exact slider point is scored; the grid only draws the heatmap.
+# The baseline is scored the same way, so untouched sliders show no
+# change.
+what_if = what_if_probability(
+    scorer, base_row, {x_feature: x_value, y_feature: y_value}
+)
+baseline = what_if_probability(scorer, base_row, {})
+
+st.metric(
+    "What-If Win Probability",
+    f"{what_if * 100:.1f}%",
+    delta=f"{(what_if - baseline) * 100:.1f} pts",
+)
+
+fig_surface = px.imshow(
+    plot_array(surface["probability"]),
+    x=plot_array(surface["x"]),
+    y=plot_array(surface["y"]),
+    origin="lower",
+    aspect="auto",
+    zmin=0,
+    zmax=1,
+    color_continuous_scale="RdYlGn",
+    labels={"x": x_feature, "y": y_feature, "color": "Win Probability"},
+)
+
+fig_surface.add_scatter(
+    x=[x_value],
+    y=[y_value],
+    mode="markers",
+    marker={"color": "black", "size": 12, "symbol": "x"},
+    name="What-if",
+    showlegend=False,
+)
+
+st.plotly_chart(fig_surface, use_container_width=True)
+
+render_debug_panel()
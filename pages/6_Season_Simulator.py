@@ -0,0 +1,222 @@
+import streamlit as st
+
+from src.metrics import aggregate_team_season_metrics
+from src.pipeline import load_clean_games, load_win_scorer
+from src.simulation import (
+    DEFAULT_CHUNK_SIZE,
+    calibrate_ratings,
+    iter_simulate_season,
+    season_state_from_games,
+)
+from src.lazy import lazy_import
+from src.rendering import plot_frame
+from src.instrumentation import page_section
+from src.ui import (
+    apply_sidebar_style,
+    paginated_dataframe,
+    render_debug_panel,
+    select_dataset,
+    start_debug_run,
+)
+
+px = lazy_import("plotly.express")
+
+start_debug_run()
+
+
+# -----------------------------------
+# Page configuration
+# -----------------------------------
+st.set_page_config(
+    page_title="Season Simulator | NBA Team Intelligence",
+    layout="wide",
+)
+
+st.title("🎲 Season Simulator")
+st.markdown(
+    "Simulates the rest of a season thousands of times from the "
+    "standings at a chosen point, producing playoff, seeding and "
+    "win-total odds for every team."
+)
+
+# ---------------------------------
+# Side Bar Customization
+# ---------------------------------
+apply_sidebar_style()
+dataset_key = select_dataset()
+
+# -----------------------------------
+# Load & prepare data
+# -----------------------------------
+page_section("Load & prepare data")
+df_clean = load_clean_games(dataset_key)
+
+# -----------------------------------
+# Simulation settings
+# -----------------------------------
+page_section("Simulation settings")
+seasons = sorted(df_clean["SEASON"].unique())
+
+col1, col2 = st.columns(2)
+
+with col1:
+    selected_season = st.selectbox(
+        "Select Season",
+        seasons,
+        index=len(seasons) - 1,
+    )
+
+    played_pct = st.slider(
+        "Season Completed (%)",
+        min_value=10,
+        max_value=90,
+        value=50,
+        step=5,
+    )
+
+with col2:
+    rating_source = st.radio(
+        "Team Strength Source",
+        ["Model win probability", "Win % to date"],
+    )
+
+    n_simulations = st.select_slider(
+        "Simulations",
+        options=[10_000, 50_000, 100_000, 250_000, 500_000],
+        value=100_000,
+    )
+
+standings, schedule, played = season_state_from_games(
+    df_clean,
+    selected_season,
+    games_played_fraction=played_pct / 100,
+)
+
+# -----------------------------------
+# Team ratings
+# -----------------------------------
+page_section("Team ratings")
+scorer = None
+if rating_source == "Model win probability":
+    # Fitted on earlier seasons only, so the ratings never use the
+    # simulated season's final results
+    scorer = load_win_scorer(dataset_key, before_season=selected_season)
+    if scorer is None:
+        st.info(
+            f"No earlier seasons to fit the model on for {selected_season}; "
+            "using win % to date instead."
+        )
+
+if scorer is not None:
+    to_date_df = aggregate_team_season_metrics(played)
+    model_probabilities = scorer.predict_win_probability(to_date_df)
+    model_probabilities.index = to_date_df["TEAM_ID"]
+
+    # The season model's probabilities are far more extreme than the
+    # odds of one game, so they are calibrated on the games played
+    ratings = calibrate_ratings(model_probabilities, played)
+else:
+    games = standings["wins"] + standings["losses"]
+    ratings = (standings["wins"] + 1) / (games + 2)
+    ratings.index = standings["TEAM_ID"]
+
+st.caption(
+    f"{len(played) // 2:,} games played, "
+    f"{len(schedule):,} games remaining."
+    + (
+        f" Model fitted on seasons before {selected_season} only."
+        if scorer is not None
+        else ""
+    )
+)
+
+# -----------------------------------
+# Run simulation (streams converging odds)
+# -----------------------------------
+page_section("Run simulation")
+settings = (
+    dataset_key,
+    selected_season,
+    played_pct,
+    rating_source,
+    n_simulations,
+)
+
+if st.button("▶️ Run Simulation"):
+    progress = st.progress(0.0)
+    chart_placeholder = st.empty()
+
+    for result in iter_simulate_season(
+        standings,
+        schedule,
+        ratings,
+        n_simulations=n_simulations,
+        chunk_size=min(DEFAULT_CHUNK_SIZE, n_simulations),
+    ):
+        progress.progress(
+            result["simulations"] / n_simulations,
+            text=f"{result['simulations']:,} / {n_simulations:,} seasons simulated",
+        )
+
+        fig_odds = px.bar(
+            plot_frame(result["odds"], ["playoff_prob", "TEAM_NAME"]),
+            x="playoff_prob",
+            y="TEAM_NAME",
+            orientation="h",
+            range_x=[0, 1],
+            labels={"playoff_prob": "Playoff Probability", "TEAM_NAME": "Team"},
+        )
+        fig_odds.update_yaxes(autorange="reversed")
+
+        chart_placeholder.plotly_chart(fig_odds, use_container_width=True)
+
+    # Keep the finished run so later widget changes don't discard it
+    st.session_state["simulation"] = {"settings": settings, "result": result}
+
+# -----------------------------------
+# Final distributions
+# -----------------------------------
+page_section("Final distributions")
+saved = st.session_state.get("simulation")
+
+if saved is not None and saved["settings"] == settings:
+    result = saved["result"]
+
+    st.subheader("📋 Projected Standings")
+
+    paginated_dataframe(
+        result["odds"],
+        key="projected_standings_page",
+        use_container_width=True,
+    )
+
+    st.subheader("🏷️ Seeding Distribution")
+
+    seed_distribution = result["seed_distribution"]
+
+    fig_seeds = px.imshow(
+        plot_frame(seed_distribution, list(seed_distribution.columns)),
+        aspect="auto",
+        labels={"x": "Seed", "y": "Team", "color": "Probability"},
+    )
+
+    st.plotly_chart(fig_seeds, use_container_width=True)
+
+    st.subheader("📈 Win Total Distribution")
+
+    selected_team = st.selectbox(
+        "Select Team",
+        sorted(result["win_distribution"].index),
+    )
+
+    win_dist = result["win_distribution"].loc[selected_team]
+
+    fig_wins = px.bar(
+        x=win_dist.index,
+        y=win_dist.values,
+        labels={"x": "Final Wins", "y": "Probability"},
+    )
+
+    st.plotly_chart(fig_wins, use_container_width=True)
+
+render_debug_panel()
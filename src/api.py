@@ -0,0 +1,660 @@
+"""
+Headless JSON query API.
+
+Serves team-season metrics, strength classifications, win
+correlations and win probabilities over HTTP for other services.
+Tables and the win model are loaded once per process (from the live
+pipeline or a snapshot, see src/pipeline.py); rendered responses are
+kept in a shared LRU and carry ETags, so repeat requests with
+If-None-Match are answered with 304 Not Modified.
+
+Endpoints (GET unless noted):
+    /health
+    /metrics             Prometheus text of the per-stage instrumentation
+    /team-seasons        ?season=2023,2024 &team=BOS
+    /classifications     ?season=2024 &strength=High%20Risk
+    /correlations        ?season=2019,2020
+    /win-probability     ?team=BOS &season=2024
+    /win-probability     POST {"rows": [{feature: value, ...}, ...]}
+
+Usage:
+    python -m src.api --port 8000 --workers 8 [--dataset wnba]
+"""
+
+import argparse
+import hashlib
+import json
+import selectors
+import socket
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from src.insights import calculate_win_correlations
+from src.instrumentation import export_prometheus
+from src.numpy_scorer import NumpyWinScorer
+
+
+# -----------------------------------
+# API configuration
+# -----------------------------------
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 8
+
+# Number of rendered responses kept in memory
+RESPONSE_CACHE_SIZE = 1024
+
+# Largest accepted POST body
+MAX_BODY_BYTES = 1024 * 1024
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 15
+
+# A client that stalls mid-request releases its worker after this many
+# seconds
+REQUEST_TIMEOUT = 5
+
+
+# -----------------------------------
+# Shared state
+# -----------------------------------
+class ApiState:
+    """
+    Tables, model and response cache shared by every worker thread.
+    """
+
+    def __init__(
+        self,
+        team_season_df: pd.DataFrame,
+        classified_df: pd.DataFrame,
+        model_output: dict,
+        data_fingerprint: str,
+        cache_size: int = RESPONSE_CACHE_SIZE,
+    ):
+        self.team_season_df = team_season_df
+        self.classified_df = classified_df
+        self.scorer = NumpyWinScorer.from_model_output(model_output)
+        self.accuracy = float(model_output["accuracy"])
+        self.data_fingerprint = data_fingerprint
+        self.cache_size = cache_size
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, dataset_key: str = None) -> "ApiState":
+        from src.pipeline import (
+            dataset_fingerprint,
+            load_classified_team_seasons,
+            load_team_season_metrics,
+            load_win_model,
+        )
+
+        return cls(
+            team_season_df=load_team_season_metrics(dataset_key),
+            classified_df=load_classified_team_seasons(dataset_key),
+            model_output=load_win_model(dataset_key),
+            data_fingerprint=dataset_fingerprint(dataset_key),
+        )
+
+    def cached_response(self, key: tuple, render) -> tuple:
+        """
+        Returns (etag, body) for a request, rendering it on a miss.
+        """
+
+        with self._lock:
+            hit = self._responses.get(key)
+            if hit is not None:
+                self._responses.move_to_end(key)
+                return hit
+
+        body = json.dumps(render(), default=str).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+        with self._lock:
+            self._responses[key] = (etag, body)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+
+        return etag, body
+
+
+# -----------------------------------
+# Query helpers
+# -----------------------------------
+def _int_list(params: dict, name: str) -> list:
+    values = []
+    for raw in params.get(name, []):
+        for part in raw.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                values.append(int(part))
+            except ValueError:
+                raise ValueError(f"'{name}' must be an integer: {part!r}")
+    return values
+
+
+def _filter_team_seasons(df: pd.DataFrame, params: dict) -> pd.DataFrame:
+    seasons = _int_list(params, "season")
+    if seasons:
+        df = df[df["SEASON"].isin(seasons)]
+
+    team_ids = _int_list(params, "team_id")
+    if team_ids:
+        df = df[df["TEAM_ID"].isin(team_ids)]
+
+    teams = [t for raw in params.get("team", []) for t in raw.split(",") if t]
+    if teams:
+        df = df[
+            df["TEAM_ABBREVIATION"].isin(teams) | df["TEAM_NAME"].isin(teams)
+        ]
+
+    return df
+
+
+def _records(df: pd.DataFrame) -> list:
+    return json.loads(df.to_json(orient="records"))
+
+
+# -----------------------------------
+# Endpoints
+# -----------------------------------
+def _health(state: ApiState, params: dict) -> dict:
+    return {
+        "status": "ok",
+        "dataset": state.data_fingerprint,
+        "model": state.scorer.fingerprint,
+    }
+
+
+def _team_seasons(state: ApiState, params: dict) -> dict:
+    df = _filter_team_seasons(state.team_season_df, params)
+    return {"count": len(df), "rows": _records(df)}
+
+
+def _classifications(state: ApiState, params: dict) -> dict:
+    df = _filter_team_seasons(state.classified_df, params)
+
+    strengths = params.get("strength", [])
+    if strengths:
+        df = df[df["team_strength"].isin(strengths)]
+
+    columns = [
+        "TEAM_ID",
+        "TEAM_NAME",
+        "TEAM_ABBREVIATION",
+        "SEASON",
+        "win_pct",
+        "net_rating",
+        "team_strength",
+    ]
+    df = df[[col for col in columns if col in df.columns]]
+
+    return {"count": len(df), "rows": _records(df)}
+
+
+def _correlations(state: ApiState, params: dict) -> dict:
+    df = _filter_team_seasons(state.team_season_df, params)
+    if len(df) < 2:
+        raise ValueError(
+            "At least two team-seasons are needed for correlations"
+        )
+
+    return {
+        "seasons": sorted(int(s) for s in df["SEASON"].unique()),
+        "rows": _records(calculate_win_correlations(df)),
+    }
+
+
+def _win_probability(state: ApiState, params: dict) -> dict:
+    df = _filter_team_seasons(state.team_season_df, params)
+
+    probabilities = state.scorer.predict_win_probability(df)
+
+    out = df[["TEAM_ID", "TEAM_NAME", "TEAM_ABBREVIATION", "SEASON"]].assign(
+        win_probability=probabilities
+    )
+
+    return {
+        "model_accuracy": state.accuracy,
+        "count": len(out),
+        "rows": _records(out),
+    }
+
+
+def _win_probability_post(state: ApiState, payload: dict) -> dict:
+    rows = payload.get("rows") if isinstance(payload, dict) else None
+    if not isinstance(rows, list) or not rows:
+        raise ValueError("Body must be {\"rows\": [{feature: value, ...}]}")
+
+    input_df = pd.DataFrame(rows)
+
+    missing = set(state.scorer.feature_names) - set(input_df.columns)
+    if missing:
+        raise ValueError(f"Missing required input features: {sorted(missing)}")
+
+    input_df = input_df[state.scorer.feature_names].astype(float)
+
+    probabilities = state.scorer.predict_win_probability(input_df)
+
+    return {
+        "model_accuracy": state.accuracy,
+        "probabilities": [float(p) for p in probabilities],
+    }
+
+
+ROUTES = {
+    "/health": _health,
+    "/team-seasons": _team_seasons,
+    "/classifications": _classifications,
+    "/correlations": _correlations,
+    "/win-probability": _win_probability,
+}
+
+POST_ROUTES = {
+    "/win-probability": _win_probability_post,
+}
+
+
+# -----------------------------------
+# HTTP handling
+# -----------------------------------
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "NBATeamIntelligenceAPI/1.0"
+
+    # Headers and body go out in one write; with Nagle on, keep-alive
+    # clients otherwise stall ~40 ms on delayed ACKs per response
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    timeout = REQUEST_TIMEOUT
+
+    def setup(self) -> None:
+        super().setup()
+        # The read buffer belongs to the connection, not the request: it
+        # may already hold the start of the next pipelined request
+        self.rfile.close()
+        self.rfile = self.server.connection_reader(self.connection)
+
+    def handle(self) -> None:
+        # One request per dispatch; PooledHTTPServer parks the connection
+        # between requests instead of blocking a worker on it
+        self.handle_one_request()
+
+    def finish(self) -> None:
+        # Leaves rfile open; the server closes it with the connection
+        if not self.wfile.closed:
+            try:
+                self.wfile.flush()
+            except OSError:
+                pass
+        self.wfile.close()
+
+    def log_message(self, format, *args) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        etag: str = None,
+        close: bool = False,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_error(
+        self,
+        status: HTTPStatus,
+        message: str,
+        close: bool = False,
+    ) -> None:
+        self._send_json(
+            status, json.dumps({"error": message}).encode(), close=close
+        )
+
+    def _send_metrics(self) -> None:
+        body = export_prometheus().encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+
+        # Totals change on every request, so they bypass the ETag cache
+        if url.path.rstrip("/") == "/metrics":
+            self._send_metrics()
+            return
+
+        endpoint = ROUTES.get(url.path.rstrip("/") or "/")
+        if endpoint is None:
+            self._send_error(
+                HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}"
+            )
+            return
+
+        params = parse_qs(url.query)
+        key = (
+            url.path,
+            tuple(sorted((name, tuple(v)) for name, v in params.items())),
+        )
+
+        state = self.server.state
+        try:
+            etag, body = state.cached_response(
+                key, lambda: endpoint(state, params)
+            )
+        except ValueError as exc:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+
+        if_none_match = self.headers.get("If-None-Match", "")
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self._send_json(HTTPStatus.OK, body, etag=etag)
+
+    do_HEAD = do_GET
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        endpoint = POST_ROUTES.get(url.path.rstrip("/"))
+
+        # The body is left unread on these errors, so the connection
+        # cannot be reused
+        if endpoint is None:
+            self._send_error(
+                HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}", True
+            )
+            return
+
+        raw_length = self.headers.get("Content-Length")
+        if raw_length is None:
+            self._send_error(
+                HTTPStatus.LENGTH_REQUIRED, "Content-Length required", True
+            )
+            return
+
+        try:
+            length = int(raw_length)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self._send_error(
+                HTTPStatus.BAD_REQUEST,
+                f"Invalid Content-Length: {raw_length!r}",
+                True,
+            )
+            return
+
+        if length > MAX_BODY_BYTES:
+            self._send_error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Body too large", True
+            )
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+            result = endpoint(self.server.state, payload)
+        except (ValueError, TypeError) as exc:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+
+        self._send_json(HTTPStatus.OK, json.dumps(result).encode())
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTP server that handles requests on a fixed worker pool.
+
+    Workers are dispatched per request, not per connection: between
+    requests a keep-alive connection waits in a selector on a single
+    watcher thread, so idle clients never hold a worker and cannot
+    starve the pool. Connections idle for KEEPALIVE_TIMEOUT are closed.
+    """
+
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: tuple,
+        state: ApiState,
+        max_workers: int = DEFAULT_WORKERS,
+        quiet: bool = False,
+    ):
+        super().__init__(address, ApiRequestHandler)
+        self.state = state
+        self.quiet = quiet
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="api-worker",
+        )
+
+        # Read buffer of each open connection, kept between requests
+        self._readers = {}
+
+        # Connections handed back by workers, registered by the watcher
+        self._parked = deque()
+        self._closing = False
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+        self._watcher = threading.Thread(
+            target=self._watch_connections,
+            name="api-keepalive",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def process_request(self, request, client_address) -> None:
+        self._pool.submit(self._handle, request, client_address)
+
+    def connection_reader(self, request):
+        reader = self._readers.get(request)
+        if reader is None:
+            reader = self._readers[request] = request.makefile("rb")
+        return reader
+
+    def shutdown_request(self, request) -> None:
+        reader = self._readers.pop(request, None)
+        if reader is not None:
+            reader.close()
+        super().shutdown_request(request)
+
+    def _handle(self, request, client_address) -> None:
+        keep_alive = False
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+            keep_alive = not handler.close_connection
+        except Exception:
+            self.handle_error(request, client_address)
+
+        if not keep_alive or self._closing:
+            self.shutdown_request(request)
+        elif self._next_request_ready(request):
+            self._pool.submit(self._handle, request, client_address)
+        else:
+            self._parked.append((request, client_address))
+            self._wake()
+
+    def _next_request_ready(self, request) -> bool:
+        """
+        Checks, without blocking, whether the next request has already
+        arrived; buffered bytes would never wake the selector.
+        """
+
+        timeout = request.gettimeout()
+        request.settimeout(0)
+        try:
+            return bool(self._readers[request].peek(1))
+        except OSError:
+            return False
+        finally:
+            request.settimeout(timeout)
+
+    def _wake(self) -> None:
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            # Server closed while a worker was finishing
+            pass
+
+    def _watch_connections(self) -> None:
+        """
+        Waits on idle keep-alive connections and submits each one to
+        the pool as soon as its next request arrives.
+        """
+
+        selector = self._selector
+        last_sweep = time.monotonic()
+
+        while not self._closing:
+            events = selector.select(timeout=1.0)
+            now = time.monotonic()
+
+            for key, _ in events:
+                if key.fileobj is self._wakeup_r:
+                    try:
+                        while self._wakeup_r.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+
+                selector.unregister(key.fileobj)
+                self._pool.submit(self._handle, key.fileobj, key.data[0])
+
+            while self._parked:
+                request, client_address = self._parked.popleft()
+                selector.register(
+                    request, selectors.EVENT_READ, (client_address, now)
+                )
+
+            if now - last_sweep >= 1.0:
+                last_sweep = now
+                for key in list(selector.get_map().values()):
+                    if key.data is not None and (
+                        now - key.data[1] > KEEPALIVE_TIMEOUT
+                    ):
+                        selector.unregister(key.fileobj)
+                        self.shutdown_request(key.fileobj)
+
+        for key in list(selector.get_map().values()):
+            selector.unregister(key.fileobj)
+            if key.data is not None:
+                self.shutdown_request(key.fileobj)
+        while self._parked:
+            self.shutdown_request(self._parked.popleft()[0])
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._closing = True
+        self._wake()
+        self._watcher.join()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._selector.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+
+def create_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_workers: int = DEFAULT_WORKERS,
+    state: ApiState = None,
+    quiet: bool = False,
+) -> PooledHTTPServer:
+    """
+    Builds an API server; call serve_forever() to start it.
+
+    Args:
+        host (str): Bind address
+        port (int): Bind port (0 picks a free port)
+        max_workers (int): Worker threads handling requests
+        state (ApiState): Preloaded state (loaded from the pipeline if None)
+        quiet (bool): Suppress per-request access logs
+
+    Returns:
+        PooledHTTPServer: Bound server
+    """
+
+    return PooledHTTPServer(
+        (host, port),
+        state or ApiState.load(),
+        max_workers=max_workers,
+        quiet=quiet,
+    )
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve team analytics as a JSON HTTP API."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--quiet", action="store_true", help="no access log")
+    parser.add_argument(
+        "--dataset", default=None, help="registered dataset key to serve"
+    )
+    args = parser.parse_args(argv)
+
+    server = create_server(
+        args.host,
+        args.port,
+        max_workers=args.workers,
+        state=ApiState.load(args.dataset),
+        quiet=args.quiet,
+    )
+    host, port = server.server_address[:2]
+    print(
+        f"serving on http://{host}:{port} ({args.workers} workers)",
+        file=sys.stderr,
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+Batch win-probability scoring.
+
+Streams feature rows from a CSV, Parquet or .npy file in fixed-size
+chunks, scores each chunk with a cached model and appends the
+probabilities to a CSV, so memory use does not grow with input size.
+
+Usage:
+    python -m src.batch_scoring input.csv scores.csv
+    python -m src.batch_scoring games.parquet scores.csv --mode game
+    python -m src.batch_scoring rows.npy scores.csv --model season_scorer.npz
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.model import FEATURE_COLUMNS, predict_win_probability
+from src.game_model import GAME_FEATURE_COLUMNS, predict_game_win_probability
+from src.instrumentation import instrument
+from src.pandas_compat import enable_copy_on_write
+
+enable_copy_on_write()
+
+
+# -----------------------------------
+# Scoring modes
+# -----------------------------------
+SCORING_MODES = {
+    "season": (FEATURE_COLUMNS, predict_win_probability),
+    "game": (GAME_FEATURE_COLUMNS, predict_game_win_probability),
+}
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+PROBABILITY_COLUMN = "win_probability"
+
+
+# -----------------------------------
+# Chunked readers
+# -----------------------------------
+def iter_feature_chunks(
+    path: Path,
+    feature_columns: list,
+    id_columns: list = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """
+    Yields DataFrame chunks holding the id and feature columns.
+
+    Supported formats:
+    - .csv: read with pandas in chunks
+    - .parquet: read batch by batch with pyarrow
+    - .npy: 2-D float array with columns in feature order, memory-mapped
+
+    Args:
+        path (Path): Input file
+        feature_columns (list): Model features to read
+        id_columns (list): Extra columns to carry through to the output
+        chunk_size (int): Rows per chunk
+
+    Yields:
+        pd.DataFrame: One chunk of rows
+    """
+
+    path = Path(path)
+    id_columns = list(id_columns or [])
+    columns = id_columns + list(feature_columns)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+
+    elif suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Reading Parquet input requires pyarrow"
+            ) from exc
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(
+            batch_size=chunk_size, columns=columns
+        ):
+            yield batch.to_pandas()
+
+    elif suffix == ".npy":
+        if id_columns:
+            raise ValueError(".npy input carries no id columns")
+
+        matrix = np.load(path, mmap_mode="r")
+        if matrix.ndim != 2 or matrix.shape[1] != len(feature_columns):
+            raise ValueError(
+                f".npy input must be 2-D with {len(feature_columns)} "
+                f"columns in model feature order, got shape {matrix.shape}"
+            )
+
+        for start in range(0, matrix.shape[0], chunk_size):
+            block = np.asarray(matrix[start:start + chunk_size], dtype=float)
+            yield pd.DataFrame(
+                block,
+                columns=feature_columns,
+                index=pd.RangeIndex(start, start + len(block)),
+            )
+
+    else:
+        raise ValueError(
+            f"Unsupported input format '{suffix}' (use .csv, .parquet or .npy)"
+        )
+
+
+# -----------------------------------
+# Model loading
+# -----------------------------------
+@instrument
+def load_scoring_model(mode: str, model_path: Path = None):
+    """
+    Returns a fitted model for the given scoring mode.
+
+    A NumPy scorer (.npz), registry artifact or pickled pipeline is
+    loaded from model_path when given; otherwise the model is served
+    from the model registry, training it from the dashboard dataset
+    only if no artifact exists.
+
+    Args:
+        mode (str): Scoring mode, a key of SCORING_MODES
+        model_path (Path): Scorer or pipeline file (None for the registry)
+
+    Returns:
+        A fitted pipeline or NumpyWinScorer exposing predict_proba
+    """
+
+    if model_path is not None and Path(model_path).suffix == ".npz":
+        from src.numpy_scorer import NumpyWinScorer
+
+        return NumpyWinScorer.load(model_path)
+
+    if model_path is not None:
+        artifact = joblib.load(model_path)
+        return artifact["model"] if isinstance(artifact, dict) else artifact
+
+    from src.data_loader import load_data
+    from src.preprocessing import preprocess_data
+    from src.model_registry import (
+        load_or_train_win_model,
+        load_or_train_game_model,
+    )
+
+    df_clean = preprocess_data(load_data())
+
+    if mode == "game":
+        from src.game_model import build_pregame_features
+
+        return load_or_train_game_model(
+            build_pregame_features(df_clean)
+        )["model"]
+
+    from src.metrics import aggregate_team_season_metrics
+
+    return load_or_train_win_model(
+        aggregate_team_season_metrics(df_clean)
+    )["model"]
+
+
+# -----------------------------------
+# Streaming scorer
+# -----------------------------------
+@instrument
+def score_file(
+    model_pipeline,
+    input_path: Path,
+    output_path: Path,
+    mode: str = "season",
+    id_columns: list = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress=None,
+) -> dict:
+    """
+    Scores every row of input_path and writes probabilities to a CSV.
+
+    Args:
+        model_pipeline: Fitted model for the scoring mode
+        input_path (Path): Feature rows (.csv, .parquet or .npy)
+        output_path (Path): Destination CSV
+        mode (str): "season" or "game"
+        id_columns (list): Input columns copied to the output
+        chunk_size (int): Rows per chunk
+        progress (callable): Optional callback receiving running stats
+
+    Returns:
+        dict: Rows scored, elapsed seconds and rows per second
+    """
+
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode: {mode}")
+
+    feature_columns, predict = SCORING_MODES[mode]
+    id_columns = list(id_columns or [])
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    rows = 0
+    start = time.perf_counter()
+
+    with open(output_path, "w", newline="") as out:
+        for i, chunk in enumerate(
+            iter_feature_chunks(
+                input_path, feature_columns, id_columns, chunk_size
+            )
+        ):
+            if id_columns:
+                scored = chunk[id_columns]
+            else:
+                scored = pd.DataFrame(index=chunk.index)
+
+            scored[PROBABILITY_COLUMN] = predict(model_pipeline, chunk)
+
+            scored.to_csv(
+                out,
+                header=(i == 0),
+                index=not id_columns,
+                index_label="row",
+            )
+
+            rows += len(chunk)
+
+            if progress is not None:
+                elapsed = time.perf_counter() - start
+                progress({"rows": rows, "seconds": elapsed})
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_second": rows / max(elapsed, 1e-9),
+    }
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Stream feature rows through the win model in chunks."
+    )
+    parser.add_argument(
+        "input", type=Path, help=".csv, .parquet or .npy feature rows"
+    )
+    parser.add_argument("output", type=Path, help="destination CSV")
+    parser.add_argument(
+        "--mode",
+        choices=sorted(SCORING_MODES),
+        default="season",
+        help="team-season or game-level feature rows (default: season)",
+    )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        default=None,
+        help="NumPy scorer (.npz), registry artifact or pickled pipeline "
+        "(default: model registry)",
+    )
+    parser.add_argument(
+        "--id-columns",
+        nargs="*",
+        default=[],
+        help="input columns to copy into the output",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"rows per chunk (default: {DEFAULT_CHUNK_SIZE:,})",
+    )
+    args = parser.parse_args(argv)
+
+    model_pipeline = load_scoring_model(args.mode, args.model)
+
+    def report(stats: dict) -> None:
+        rate = stats["rows"] / max(stats["seconds"], 1e-9)
+        print(
+            f"\rscored {stats['rows']:,} rows ({rate:,.0f} rows/s)",
+            end="",
+            file=sys.stderr,
+        )
+
+    stats = score_file(
+        model_pipeline,
+        args.input,
+        args.output,
+        mode=args.mode,
+        id_columns=args.id_columns,
+        chunk_size=args.chunk_size,
+        progress=report,
+    )
+
+    print(
+        f"\nscored {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+        f"({stats['rows_per_second']:,.0f} rows/s) -> {args.output}",
+        file=sys.stderr,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
 
+from src.instrumentation import instrument
+from src.pandas_compat import enable_copy_on_write
+
+enable_copy_on_write()
+
 
 # -----------------------------------
 # Classification thresholds
@@ -16,6 +22,7 @@ TURNOVER_RATIO_LIMIT = 0.15
 # -----------------------------------
 # Team strength classification
 # -----------------------------------
+@instrument
 def classify_team_strength(team_season_df: pd.DataFrame) -> pd.DataFrame:
     """
     Classifies teams into strength categories based on
@@ -33,7 +40,7 @@ def classify_team_strength(team_season_df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: Team-season metrics with strength label
     """
 
-    df = team_season_df.copy()
+    df = team_season_df
 
     conditions = [
         (
@@ -52,15 +59,12 @@ def classify_team_strength(team_season_df: pd.DataFrame) -> pd.DataFrame:
         "High Risk",
     ]
 
-    df["team_strength"] = pd.Series(
-        pd.NA, index=df.index
+    team_strength = np.select(
+        conditions, choices, default="Inconsistent Performer"
     )
 
-    df.loc[conditions[0], "team_strength"] = choices[0]
-    df.loc[conditions[1], "team_strength"] = choices[1]
-
-    df["team_strength"] = df["team_strength"].fillna(
-        "Inconsistent Performer"
+    # assign() returns a new frame that shares the input's columns
+    # instead of copying them, and leaves the input untouched
+    return df.assign(
+        team_strength=pd.Series(team_strength, index=df.index, dtype=object)
     )
-
-    return df
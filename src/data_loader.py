@@ -2,10 +2,20 @@ import pandas as pd
 import streamlit as st
 from pathlib import Path
 
+from src.datasets import (
+    BUILTIN_DATASETS,
+    DEFAULT_DATASET,
+    cached_dataset_frame,
+    dataset_path,
+    resolve_dataset,
+)
+from src.instrumentation import instrument
+
 # -----------------------------------
 # File path configuration
 # -----------------------------------
-DATA_PATH = Path("data/nba_data_2012_2024.csv")
+# Path of the default dataset; see src/datasets.py for the registry
+DATA_PATH = Path(BUILTIN_DATASETS[DEFAULT_DATASET]["path"])
 
 
 # -----------------------------------
@@ -50,22 +60,55 @@ EXPECTED_COLUMNS = {
 # -----------------------------------
 # Load & cache dataset
 # -----------------------------------
-@st.cache_data(show_spinner="Loading NBA data...")
-def load_data() -> pd.DataFrame:
+@instrument
+def load_data(dataset_key: str = None) -> pd.DataFrame:
     """
-    Loads the NBA dataset from CSV, validates schema,
+    Loads a registered dataset from CSV, validates schema,
     and returns a pandas DataFrame.
 
+    The frame is kept in the shared, memory-bounded dataset cache
+    (src/datasets.py) and returned without copying; callers must not
+    modify it in place.
+
+    Args:
+        dataset_key (str): Registered dataset key (default dataset if None)
+
+    Returns:
+        pd.DataFrame: Raw NBA game-level team data
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    def build() -> pd.DataFrame:
+        with st.spinner("Loading NBA data..."):
+            return read_games_csv(dataset_path(dataset_key))
+
+    return cached_dataset_frame(dataset_key, "raw", build)
+
+
+@instrument
+def read_games_csv(path: Path) -> pd.DataFrame:
+    """
+    Reads a game-level CSV, validates its schema and enforces dtypes.
+
+    This is the uncached body of load_data(), also used by the
+    benchmarks to load synthetic datasets.
+
+    Args:
+        path (Path): CSV file with the EXPECTED_COLUMNS schema
+
     Returns:
         pd.DataFrame: Raw NBA game-level team data
     """
 
-    if not DATA_PATH.exists():
+    path = Path(path)
+
+    if not path.exists():
         raise FileNotFoundError(
-            f"Dataset not found at path: {DATA_PATH.resolve()}"
+            f"Dataset not found at path: {path.resolve()}"
         )
 
-    df = pd.read_csv(DATA_PATH)
+    df = pd.read_csv(path)
 
     # -----------------------------------
     # Basic schema validation
@@ -0,0 +1,319 @@
+"""
+Dataset registry and the in-memory dataset cache.
+
+A dataset is a game-level CSV with the EXPECTED_COLUMNS schema of
+src/data_loader.py, registered under a short key. The NBA dataset is
+built in; more leagues or data versions (playoffs, WNBA, G League)
+are added without code changes in data/datasets.json:
+
+    {
+        "playoffs": {"label": "NBA playoffs", "path": "data/playoffs.csv"},
+        "wnba": {"label": "WNBA 2015-2024", "path": "data/wnba.csv"}
+    }
+
+Loaded datasets and the frames derived from them share one LRU
+bounded by memory, so rarely used datasets are evicted instead of all
+staying resident. The registry file, like the snapshot pointer and
+manifest, is parsed once and re-read only when it changes on disk.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from src.instrumentation import instrument
+
+
+# -----------------------------------
+# Registry configuration
+# -----------------------------------
+DEFAULT_DATASET = "nba"
+
+BUILTIN_DATASETS = {
+    DEFAULT_DATASET: {
+        "label": "NBA 2012–2024",
+        "path": "data/nba_data_2012_2024.csv",
+    },
+}
+
+# Optional file registering additional datasets
+DATASET_REGISTRY_PATH = Path("data/datasets.json")
+
+# Memory budget of loaded datasets and their derived frames
+DATASET_CACHE_ENV_VAR = "NBA_DASHBOARD_DATASET_CACHE_MB"
+DATASET_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+
+# -----------------------------------
+# Registry
+# -----------------------------------
+def read_file_cached(path: Path, parse):
+    """
+    Returns parse(text) of a small file, re-reading it only when the
+    file is replaced or modified.
+
+    The parsed value is shared between callers and must not be mutated.
+
+    Args:
+        path (Path): File to read
+        parse (callable): Function applied to the file's text
+
+    Returns:
+        The parsed content, or None when the file does not exist
+    """
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = (os.path.abspath(path), parse)
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    value = parse(Path(path).read_text())
+
+    with _file_cache_lock:
+        _file_cache[key] = (signature, value)
+
+    return value
+
+
+def available_datasets() -> dict:
+    """
+    Returns every registered dataset.
+
+    In snapshot mode only the dataset the snapshot was built from is
+    available.
+
+    Returns:
+        dict: key -> {"label": str, "path": Path}
+    """
+
+    datasets = {key: dict(spec) for key, spec in BUILTIN_DATASETS.items()}
+
+    registered = read_file_cached(DATASET_REGISTRY_PATH, json.loads)
+    if registered is not None:
+        for key, spec in registered.items():
+            if "path" not in spec:
+                raise ValueError(
+                    f"Dataset '{key}' in {DATASET_REGISTRY_PATH} has no path"
+                )
+            datasets[key] = {"label": spec.get("label", key), **spec}
+
+    for spec in datasets.values():
+        spec["path"] = Path(spec["path"])
+
+    from src.snapshot import active_snapshot_dir, snapshot_dataset
+
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is not None:
+        key = snapshot_dataset(snapshot_dir)
+        datasets = {key: datasets.get(key, {"label": key, "path": None})}
+
+    return datasets
+
+
+def resolve_dataset(dataset_key: str = None) -> str:
+    """
+    Validates a dataset key, mapping None to the default dataset.
+    """
+
+    datasets = available_datasets()
+
+    if dataset_key is None:
+        if DEFAULT_DATASET in datasets:
+            return DEFAULT_DATASET
+        return next(iter(datasets))
+
+    if dataset_key not in datasets:
+        raise ValueError(
+            f"Unknown dataset '{dataset_key}'. "
+            f"Available: {sorted(datasets)}"
+        )
+
+    return dataset_key
+
+
+def dataset_path(dataset_key: str = None) -> Path:
+    return available_datasets()[resolve_dataset(dataset_key)]["path"]
+
+
+# -----------------------------------
+# Dataset cache
+# -----------------------------------
+def _frame_bytes(frame) -> int:
+    # Page summaries are cached as plain text
+    if isinstance(frame, str):
+        return len(frame.encode())
+
+    # DataFrame.memory_usage returns a Series, Series.memory_usage an int
+    usage = frame.memory_usage(index=True, deep=True)
+    return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+
+
+class DatasetCache:
+    """
+    Memory-bounded LRU of loaded datasets and their derived frames.
+
+    Frames are grouped per dataset and a dataset is evicted as a
+    whole, least recently used first. The dataset in use is never
+    evicted, even when it alone exceeds the budget. Frames are shared
+    between sessions, which is safe because the pipeline never mutates
+    its inputs (copy-on-write, see src/pandas_compat.py).
+    """
+
+    def __init__(self, max_bytes: int = DATASET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._datasets = OrderedDict()
+        self._lock = threading.Lock()
+        # (dataset_key, name) -> lock held while that frame is built
+        self._build_locks = {}
+
+    def get(self, dataset_key: str, name: str):
+        with self._lock:
+            frames = self._datasets.get(dataset_key)
+            if frames is None or name not in frames:
+                self.misses += 1
+                return None
+            self._datasets.move_to_end(dataset_key)
+            self.hits += 1
+            return frames[name][0]
+
+    def _peek(self, dataset_key: str, name: str):
+        with self._lock:
+            entry = self._datasets.get(dataset_key, {}).get(name)
+            return None if entry is None else entry[0]
+
+    def put(self, dataset_key: str, name: str, frame) -> None:
+        size = _frame_bytes(frame)
+
+        with self._lock:
+            frames = self._datasets.setdefault(dataset_key, {})
+            previous = frames.pop(name, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+
+            frames[name] = (frame, size)
+            self.current_bytes += size
+            self._datasets.move_to_end(dataset_key)
+
+            while (
+                self.current_bytes > self.max_bytes
+                and len(self._datasets) > 1
+            ):
+                _, evicted = self._datasets.popitem(last=False)
+                self.current_bytes -= sum(size for _, size in evicted.values())
+                self.evictions += 1
+
+    def get_or_build(self, dataset_key: str, name: str, build):
+        """
+        Returns a cached frame, building and storing it on a miss.
+
+        Concurrent misses on the same frame build it once: the first
+        caller builds while the others wait for its result.
+        """
+
+        frame = self.get(dataset_key, name)
+        if frame is not None:
+            return frame
+
+        key = (dataset_key, name)
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            frame = self._peek(dataset_key, name)
+            if frame is None:
+                frame = build()
+                self.put(dataset_key, name, frame)
+
+            with self._lock:
+                self._build_locks.pop(key, None)
+
+        return frame
+
+    def discard(self, dataset_key: str, names) -> None:
+        with self._lock:
+            frames = self._datasets.get(dataset_key, {})
+            for name in names:
+                entry = frames.pop(name, None)
+                if entry is not None:
+                    self.current_bytes -= entry[1]
+
+    def clear(self, dataset_key: str = None) -> None:
+        with self._lock:
+            if dataset_key is None:
+                self._datasets.clear()
+                self.current_bytes = 0
+                return
+
+            frames = self._datasets.pop(dataset_key, {})
+            self.current_bytes -= sum(size for _, size in frames.values())
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "datasets": {
+                    key: sorted(frames)
+                    for key, frames in self._datasets.items()
+                },
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _cache_budget() -> int:
+    value = os.environ.get(DATASET_CACHE_ENV_VAR, "").strip()
+    if not value:
+        return DATASET_CACHE_MAX_BYTES
+    return int(float(value) * 1024 * 1024)
+
+
+_dataset_cache = DatasetCache(_cache_budget())
+
+
+@instrument
+def cached_dataset_frame(dataset_key: str, name: str, build):
+    """
+    Returns a dataset's raw or derived frame from the shared cache.
+
+    Args:
+        dataset_key (str): Registered dataset key
+        name (str): Frame name within the dataset (e.g. "raw")
+        build (callable): Zero-argument function producing the frame
+
+    Returns:
+        The cached or newly built frame
+    """
+
+    return _dataset_cache.get_or_build(dataset_key, name, build)
+
+
+def dataset_cache_info() -> dict:
+    return _dataset_cache.info()
+
+
+def discard_dataset_frames(dataset_key: str, names) -> None:
+    _dataset_cache.discard(dataset_key, names)
+
+
+def clear_dataset_cache(dataset_key: str = None) -> None:
+    _dataset_cache.clear(dataset_key)
@@ -0,0 +1,253 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.lazy import lazy_import
+from src.model import (
+    FEATURE_COLUMNS,
+    TARGET_COLUMN,
+    prepare_model_data,
+)
+from src.model_registry import (
+    MODEL_CACHE_DIR,
+    fingerprint_frame,
+    load_or_train,
+    model_cache_key,
+)
+from src.instrumentation import instrument
+
+# scikit-learn loads only when folds are fitted, so serving cached
+# walk-forward results does not pay for it
+linear_model = lazy_import("sklearn.linear_model")
+metrics = lazy_import("sklearn.metrics")
+
+
+# -----------------------------------
+# Output schema
+# -----------------------------------
+WALK_FORWARD_COLUMNS = [
+    "SEASON",
+    "train_seasons",
+    "n_train",
+    "n_test",
+    "accuracy",
+    "log_loss",
+]
+
+
+# -----------------------------------
+# Fold worker
+# -----------------------------------
+def _fit_fold(
+    shm_name: str,
+    shape: tuple,
+    train_end: int,
+    test_end: int,
+    mean: np.ndarray,
+    scale: np.ndarray,
+    model_params: dict,
+) -> dict:
+    """
+    Fits one walk-forward fold against the shared feature block.
+
+    The block holds features followed by the target in its last
+    column, sorted by season, so a fold is two row slices.
+    """
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+        X_train = (block[:train_end, :-1] - mean) / scale
+        y_train = block[:train_end, -1].astype(int)
+        X_test = (block[train_end:test_end, :-1] - mean) / scale
+        y_test = block[train_end:test_end, -1].astype(int)
+    finally:
+        shm.close()
+
+    if len(np.unique(y_train)) < 2 or len(y_test) == 0:
+        return {"accuracy": np.nan, "log_loss": np.nan}
+
+    params = {"max_iter": 1000}
+    if model_params:
+        params.update(model_params)
+
+    model = linear_model.LogisticRegression(**params)
+    model.fit(X_train, y_train)
+
+    y_prob = model.predict_proba(X_test)[:, 1]
+
+    return {
+        "accuracy": metrics.accuracy_score(
+            y_test, (y_prob >= 0.5).astype(int)
+        ),
+        "log_loss": metrics.log_loss(y_test, y_prob, labels=[0, 1]),
+    }
+
+
+# -----------------------------------
+# Walk-forward season evaluation
+# -----------------------------------
+@instrument
+def walk_forward_evaluation(
+    team_season_df: pd.DataFrame,
+    model_params: dict = None,
+    min_train_seasons: int = 1,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """
+    Evaluates the win model by training on seasons <= S and
+    testing on season S+1, for every season.
+
+    The feature matrix is copied into shared memory once and read by
+    every fold. Each fold's scaler statistics come from per-season
+    prefix sums, so no fold rescans the data to standardise it.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        model_params (dict): Extra LogisticRegression keyword arguments
+        min_train_seasons (int): Seasons required before the first fold
+        max_workers (int): Process pool size; 1 runs folds inline
+
+    Returns:
+        pd.DataFrame: Per-season accuracy and log-loss
+    """
+
+    X, y = prepare_model_data(team_season_df)
+
+    order = np.argsort(team_season_df["SEASON"].to_numpy(), kind="stable")
+    seasons = team_season_df["SEASON"].to_numpy()[order]
+
+    block = np.column_stack(
+        [X.to_numpy(dtype=np.float64)[order], y.to_numpy(dtype=np.float64)[order]]
+    )
+
+    unique_seasons, season_starts = np.unique(seasons, return_index=True)
+    boundaries = np.append(season_starts, len(seasons))
+
+    # -----------------------------------
+    # Prefix sums for per-fold scaler statistics
+    # -----------------------------------
+    features = block[:, :-1]
+    center = features.mean(axis=0)
+    centered = features - center
+
+    zero_row = np.zeros((1, features.shape[1]))
+    prefix_sum = np.vstack([zero_row, np.cumsum(centered, axis=0)])
+    prefix_sq = np.vstack([zero_row, np.cumsum(centered ** 2, axis=0)])
+
+    folds = []
+    for i in range(max(min_train_seasons, 1), len(unique_seasons)):
+        train_end = boundaries[i]
+        n = train_end
+
+        fold_mean = prefix_sum[n] / n
+        fold_var = np.maximum(prefix_sq[n] / n - fold_mean ** 2, 0.0)
+        fold_scale = np.sqrt(fold_var)
+        # Constant columns are left unscaled, as StandardScaler does
+        fold_scale[fold_scale == 0] = 1.0
+
+        folds.append(
+            {
+                "SEASON": unique_seasons[i],
+                "train_seasons": f"{unique_seasons[0]}–{unique_seasons[i - 1]}",
+                "n_train": int(train_end),
+                "n_test": int(boundaries[i + 1] - train_end),
+                "train_end": int(train_end),
+                "test_end": int(boundaries[i + 1]),
+                "mean": fold_mean + center,
+                "scale": fold_scale,
+            }
+        )
+
+    if not folds:
+        return pd.DataFrame(columns=WALK_FORWARD_COLUMNS)
+
+    # -----------------------------------
+    # Train folds against shared memory
+    # -----------------------------------
+    shm = shared_memory.SharedMemory(create=True, size=block.nbytes)
+
+    try:
+        shared = np.ndarray(block.shape, dtype=np.float64, buffer=shm.buf)
+        shared[:] = block
+
+        fold_args = [
+            (
+                shm.name,
+                block.shape,
+                fold["train_end"],
+                fold["test_end"],
+                fold["mean"],
+                fold["scale"],
+                model_params,
+            )
+            for fold in folds
+        ]
+
+        if max_workers == 1:
+            results = [_fit_fold(*args) for args in fold_args]
+        else:
+            workers = min(max_workers or os.cpu_count() or 1, len(folds))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_fit_fold, *zip(*fold_args)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    rows = [
+        {**{col: fold[col] for col in WALK_FORWARD_COLUMNS[:4]}, **result}
+        for fold, result in zip(folds, results)
+    ]
+
+    return pd.DataFrame(rows, columns=WALK_FORWARD_COLUMNS)
+
+
+@instrument
+def load_or_run_walk_forward(
+    team_season_df: pd.DataFrame,
+    model_params: dict = None,
+    min_train_seasons: int = 1,
+    cache_dir: Path = MODEL_CACHE_DIR,
+) -> pd.DataFrame:
+    """
+    Cached equivalent of walk_forward_evaluation, persisted through
+    the model registry.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        model_params (dict): Extra LogisticRegression keyword arguments
+        min_train_seasons (int): Seasons required before the first fold
+        cache_dir (Path): Directory holding persisted artifacts
+
+    Returns:
+        pd.DataFrame: Per-season accuracy and log-loss
+    """
+
+    data_fingerprint = fingerprint_frame(
+        team_season_df, ["SEASON"] + FEATURE_COLUMNS + [TARGET_COLUMN]
+    )
+
+    key = model_cache_key(
+        namespace=f"walk_forward:{min_train_seasons}",
+        data_fingerprint=data_fingerprint,
+        feature_columns=FEATURE_COLUMNS,
+        test_size=None,
+        random_state=None,
+        model_params=model_params,
+    )
+
+    return load_or_train(
+        key,
+        lambda: walk_forward_evaluation(
+            team_season_df,
+            model_params=model_params,
+            min_train_seasons=min_train_seasons,
+        ),
+        cache_dir=cache_dir,
+    )
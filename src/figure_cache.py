@@ -0,0 +1,140 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from src.lazy import lazy_import
+from src.instrumentation import instrument
+
+pio = lazy_import("plotly.io")
+
+
+# -----------------------------------
+# Figure cache configuration
+# -----------------------------------
+# Total size of serialized figures kept in process memory
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+    """
+    Byte-bounded LRU of serialized Plotly figures.
+
+    Entries are figure JSON strings, so their size is cheap to
+    measure and they can be shared safely between sessions.
+    """
+
+    def __init__(self, max_bytes: int = FIGURE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str:
+        with self._lock:
+            figure_json = self._entries.get(key)
+            if figure_json is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return figure_json
+
+    def put(self, key: str, figure_json: str) -> None:
+        size = len(figure_json)
+
+        # A figure larger than the whole budget would evict everything
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+
+            self._entries[key] = figure_json
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_figure_cache = FigureCache()
+
+
+# -----------------------------------
+# Cached figures
+# -----------------------------------
+def figure_cache_key(
+    page: str,
+    chart: str,
+    filters,
+    data_fingerprint: str,
+) -> str:
+    payload = json.dumps(
+        [page, chart, filters, data_fingerprint],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@instrument
+def cached_figure(
+    page: str,
+    chart: str,
+    filters,
+    data_fingerprint: str,
+    build,
+) -> dict:
+    """
+    Returns a chart from the figure cache, building it on a miss.
+
+    The key covers the page, the chart, the filter selection that
+    shapes it and the dataset fingerprint, so changing an unrelated
+    widget serves the stored figure instead of rebuilding it.
+
+    Args:
+        page (str): Page identifier
+        chart (str): Chart identifier within the page
+        filters: JSON-serializable filter selection the chart depends on
+        data_fingerprint (str): Fingerprint of the underlying dataset
+        build (callable): Zero-argument function returning the figure
+
+    Returns:
+        dict: Figure specification accepted by st.plotly_chart
+    """
+
+    key = figure_cache_key(page, chart, filters, data_fingerprint)
+
+    figure_json = _figure_cache.get(key)
+    if figure_json is None:
+        figure_json = pio.to_json(build(), validate=False)
+        _figure_cache.put(key, figure_json)
+
+    return json.loads(figure_json)
+
+
+def figure_cache_info() -> dict:
+    return _figure_cache.info()
+
+
+def clear_figure_cache() -> None:
+    _figure_cache.clear()
@@ -0,0 +1,198 @@
+"""
+Per-team game logs with server-side paging.
+
+GameLogIndex orders the cleaned game table once by team, season and
+game, so one team's games, or one team-season's, are a contiguous
+slice of row positions. A game-log request filters and sorts only
+that slice and then materializes just the requested page of rows, so
+its cost does not grow with the size of the archive.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.game_model import derive_home_flag
+from src.team_season_store import container_bytes
+
+
+# -----------------------------------
+# Game log configuration
+# -----------------------------------
+GAME_LOG_COLUMNS = [
+    "GAME_ID",
+    "SEASON",
+    "VENUE",
+    "OPPONENT",
+    "RESULT",
+    "PTS",
+    "PLUS_MINUS",
+    "FG_PCT",
+    "FG3_PCT",
+    "FT_PCT",
+    "EFG_PCT",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TO",
+]
+
+GAME_LOG_PAGE_SIZE = 20
+
+# Sort options in the page -> column
+GAME_LOG_SORTS = {
+    "Game": "GAME_ID",
+    "Points": "PTS",
+    "Plus/minus": "PLUS_MINUS",
+    "eFG%": "EFG_PCT",
+    "Rebounds": "REB",
+    "Assists": "AST",
+    "Turnovers": "TO",
+}
+
+
+# -----------------------------------
+# Index
+# -----------------------------------
+class GameLogIndex:
+    """
+    Row index of the cleaned game table by (TEAM_ID, SEASON).
+
+    Each game's two rows are linked at build time, so the opponent of
+    a row is an array lookup instead of a self-join.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        team_ids = df["TEAM_ID"].to_numpy()
+        seasons = df["SEASON"].to_numpy()
+        game_ids = df["GAME_ID"].to_numpy()
+
+        order = np.lexsort((game_ids, seasons, team_ids))
+
+        self.frame = df
+        self._order = order
+        self._abbreviations = df["TEAM_ABBREVIATION"]
+
+        sorted_teams = team_ids[order]
+        sorted_seasons = seasons[order]
+
+        # Contiguous runs of one team-season, and of one team
+        new_run = np.ones(len(order), dtype=bool)
+        new_run[1:] = (sorted_teams[1:] != sorted_teams[:-1]) | (
+            sorted_seasons[1:] != sorted_seasons[:-1]
+        )
+        starts = np.flatnonzero(new_run)
+        stops = np.append(starts[1:], len(order))
+
+        self._team_season_slices = {
+            (team_id, season): (start, stop)
+            for team_id, season, start, stop in zip(
+                sorted_teams[starts].tolist(),
+                sorted_seasons[starts].tolist(),
+                starts.tolist(),
+                stops.tolist(),
+            )
+        }
+
+        self._team_slices = {}
+        for (team_id, _), (start, stop) in self._team_season_slices.items():
+            first, _ = self._team_slices.get(team_id, (start, stop))
+            self._team_slices[team_id] = (first, stop)
+
+        # The other row of the same GAME_ID (-1 when unpaired)
+        by_game = np.argsort(game_ids, kind="stable")
+        sorted_games = game_ids[by_game]
+        paired = np.flatnonzero(sorted_games[1:] == sorted_games[:-1])
+        self._opponent = np.full(len(df), -1, dtype=np.int64)
+        self._opponent[by_game[paired]] = by_game[paired + 1]
+        self._opponent[by_game[paired + 1]] = by_game[paired]
+
+    def _slice(self, team_id: int, season: int = None) -> np.ndarray:
+        team_id = int(team_id)
+        if season is None:
+            bounds = self._team_slices.get(team_id)
+        else:
+            bounds = self._team_season_slices.get((team_id, int(season)))
+
+        if bounds is None:
+            return self._order[:0]
+        return self._order[bounds[0]:bounds[1]]
+
+    def select(
+        self,
+        team_id: int,
+        season: int = None,
+        result: int = None,
+        sort_by: str = "GAME_ID",
+        ascending: bool = True,
+    ) -> np.ndarray:
+        """
+        Row positions of a team's games, filtered and sorted.
+
+        Only the team's (or team-season's) slice is read.
+
+        Args:
+            team_id (int): Team
+            season (int): Season (None for every season)
+            result (int): 1 for wins, 0 for losses, None for both
+            sort_by (str): Column to sort by; ties stay in game order
+            ascending (bool): Sort direction
+
+        Returns:
+            np.ndarray: Row positions into the game table
+        """
+
+        if sort_by not in GAME_LOG_SORTS.values():
+            raise ValueError(
+                f"Cannot sort the game log by '{sort_by}'. "
+                f"Available: {list(GAME_LOG_SORTS.values())}"
+            )
+
+        positions = self._slice(team_id, season)
+
+        if result is not None:
+            results = self.frame["RESULT"].to_numpy()[positions]
+            positions = positions[results == result]
+
+        values = self.frame[sort_by].to_numpy()[positions]
+        if ascending:
+            order = np.argsort(values, kind="stable")
+        else:
+            # Negating keeps ties in game order
+            order = np.argsort(-values, kind="stable")
+
+        return positions[order]
+
+    def rows(self, positions: np.ndarray) -> pd.DataFrame:
+        """
+        Game-log rows (GAME_LOG_COLUMNS) at the given positions.
+        """
+
+        games = self.frame.iloc[positions]
+
+        # Only the page's opponents are converted, not the whole column
+        opponents = self._opponent[positions]
+        abbreviations = self._abbreviations.iloc[
+            np.maximum(opponents, 0)
+        ].to_numpy()
+        opponent = np.where(opponents >= 0, abbreviations, None)
+
+        home = derive_home_flag(games).to_numpy() == 1
+
+        return games.assign(
+            VENUE=np.where(home, "Home", "Away"),
+            OPPONENT=opponent,
+            RESULT=np.where(games["RESULT"].to_numpy() == 1, "W", "L"),
+        )[GAME_LOG_COLUMNS]
+
+    def memory_usage(self, index: bool = True, deep: bool = True) -> int:
+        """
+        Approximate bytes held by the index, so the dataset cache can
+        size it. The frame is the cached cleaned-games table, which the
+        cache already sizes, so it is not counted again.
+        """
+
+        usage = self._order.nbytes + self._opponent.nbytes
+        for lookup in (self._team_slices, self._team_season_slices):
+            usage += container_bytes(lookup)
+        return usage
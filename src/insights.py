@@ -1,5 +1,7 @@
 import pandas as pd
 
+from src.instrumentation import instrument
+
 
 # -----------------------------------
 # Metrics to analyze against winning
@@ -20,10 +22,18 @@ INSIGHT_METRICS = [
     "efg_pct",
 ]
 
+# Metrics where the lowest value ranks first in the league
+LOWER_IS_BETTER_METRICS = {
+    "turnovers_per_game",
+    "fouls_per_game",
+    "turnover_ratio",
+}
+
 
 # -----------------------------------
 # Correlation with win percentage
 # -----------------------------------
+@instrument
 def calculate_win_correlations(team_season_df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculates Pearson correlation between win percentage
@@ -66,6 +76,7 @@ def calculate_win_correlations(team_season_df: pd.DataFrame) -> pd.DataFrame:
 # -----------------------------------
 # Strongest positive & negative drivers
 # -----------------------------------
+@instrument
 def identify_key_win_drivers(
     correlation_df: pd.DataFrame,
     positive_threshold: float = 0.4,
@@ -101,6 +112,7 @@ def identify_key_win_drivers(
 # -----------------------------------
 # Scatter-ready dataset
 # -----------------------------------
+@instrument
 def prepare_scatter_data(
     team_season_df: pd.DataFrame,
     x_metric: str,
@@ -130,6 +142,7 @@ def prepare_scatter_data(
 
     return scatter_df
 
+@instrument
 def explain_win_prediction(
     team_row: pd.Series,
     feature_names: list,
@@ -167,6 +180,7 @@ def explain_win_prediction(
         "negative": negative,
     }
 
+@instrument
 def get_strong_drivers(df: pd.DataFrame, top_n: int = 3) -> dict:
     """
     Computes top positive and negative correlations with win_pct.
@@ -0,0 +1,354 @@
+"""
+Per-stage timing and memory instrumentation.
+
+`@instrument` wraps src/ functions and `page_section()` marks page
+sections. While a run is active (a page rerun opened with
+begin_run(), usually via ?debug=1) every stage records wall time,
+peak traced memory and input/output row counts. Finished runs are
+folded into process-wide totals that can be exported as JSON or
+Prometheus text. With no active run and NBA_DASHBOARD_INSTRUMENT
+unset, instrumented functions call straight through.
+
+Peak memory comes from tracemalloc, whose peak counter is
+process-global, so only one run at a time measures memory. A run
+that starts while another session holds tracemalloc still records
+times and row counts, with peak memory left empty.
+"""
+
+import contextvars
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+import weakref
+
+
+# -----------------------------------
+# Instrumentation configuration
+# -----------------------------------
+INSTRUMENT_ENV_VAR = "NBA_DASHBOARD_INSTRUMENT"
+
+# Record into the process-wide totals even outside a debug run
+ALWAYS_ON = os.environ.get(INSTRUMENT_ENV_VAR, "").strip() == "1"
+
+PROFILE_TOP_N = 30
+
+METRIC_PREFIX = "nba_dashboard_stage"
+
+
+_current_run = contextvars.ContextVar("instrumentation_run", default=None)
+
+_totals = {}
+_totals_lock = threading.Lock()
+
+# Held by the one run measuring memory: reset_peak() in another
+# thread would corrupt its peaks
+_tracing_lock = threading.Lock()
+_tracing_started = False
+
+
+# -----------------------------------
+# Runs
+# -----------------------------------
+class _Run:
+    def __init__(self, memory: bool, profile: bool):
+        self.memory = memory
+        self.records = []
+        self.stack = []
+        self.open_section = None
+        self.profiler = cProfile.Profile() if profile else None
+        self.profile_text = None
+        self.release_tracing = None
+
+
+def _start_tracing() -> bool:
+    """
+    Claims tracemalloc for the calling run.
+
+    Returns:
+        bool: False when another run is already measuring memory
+    """
+
+    global _tracing_started
+    if not _tracing_lock.acquire(blocking=False):
+        return False
+
+    # Leave tracing that someone else started running afterwards
+    _tracing_started = not tracemalloc.is_tracing()
+    if _tracing_started:
+        tracemalloc.start()
+    return True
+
+
+def _stop_tracing() -> None:
+    global _tracing_started
+    if _tracing_started:
+        tracemalloc.stop()
+        _tracing_started = False
+    _tracing_lock.release()
+
+
+def begin_run(memory: bool = True, profile: bool = False) -> None:
+    """
+    Starts collecting stage records for the current rerun.
+
+    Args:
+        memory (bool): Track peak allocated memory with tracemalloc;
+            skipped while another run is measuring memory
+        profile (bool): Capture a cProfile of the whole rerun
+    """
+
+    if _current_run.get() is not None:
+        end_run()
+
+    run = _Run(memory=memory and _start_tracing(), profile=profile)
+    _current_run.set(run)
+
+    if run.memory:
+        # A rerun that raises or stops never reaches end_run(); its run
+        # is dropped with the script thread and gives tracemalloc back
+        run.release_tracing = weakref.finalize(run, _stop_tracing)
+
+    if run.profiler is not None:
+        run.profiler.enable()
+
+
+def end_run() -> dict:
+    """
+    Finishes the current run and folds it into the process totals.
+
+    Returns:
+        dict: {"records": [...], "profile": str or None, "memory": bool},
+        or None when no run was active
+    """
+
+    run = _current_run.get()
+    if run is None:
+        return None
+
+    _close_section(run)
+
+    if run.profiler is not None:
+        run.profiler.disable()
+        buffer = io.StringIO()
+        pstats.Stats(run.profiler, stream=buffer).sort_stats(
+            "cumulative"
+        ).print_stats(PROFILE_TOP_N)
+        run.profile_text = buffer.getvalue()
+
+    if run.release_tracing is not None:
+        run.release_tracing()
+
+    _current_run.set(None)
+
+    return {
+        "records": run.records,
+        "profile": run.profile_text,
+        "memory": run.memory,
+    }
+
+
+def is_recording() -> bool:
+    return ALWAYS_ON or _current_run.get() is not None
+
+
+# -----------------------------------
+# Stage measurement
+# -----------------------------------
+def _rows(value) -> int:
+    shape = getattr(value, "shape", None)
+    if shape:
+        return int(shape[0])
+    return None
+
+
+def _enter(run: _Run) -> dict:
+    frame = {"start": time.perf_counter(), "peak": 0, "base": 0}
+
+    if run is not None and run.memory and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        if run.stack:
+            parent = run.stack[-1]
+            parent["peak"] = max(parent["peak"], peak)
+        tracemalloc.reset_peak()
+        frame["base"] = current
+
+    if run is not None:
+        run.stack.append(frame)
+
+    return frame
+
+
+def _exit(
+    run: _Run,
+    frame: dict,
+    name: str,
+    kind: str,
+    rows_in: int,
+    rows_out: int,
+) -> None:
+    seconds = time.perf_counter() - frame["start"]
+    peak_bytes = None
+
+    if run is not None:
+        run.stack.pop()
+
+        if run.memory and tracemalloc.is_tracing():
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            peak_bytes = max(peak - frame["base"], 0)
+            if run.stack:
+                parent = run.stack[-1]
+                parent["peak"] = max(parent["peak"], peak)
+
+        run.records.append(
+            {
+                "name": name,
+                "kind": kind,
+                "depth": len(run.stack),
+                "started": frame["start"],
+                "seconds": seconds,
+                "peak_bytes": peak_bytes,
+                "rows_in": rows_in,
+                "rows_out": rows_out,
+            }
+        )
+
+    with _totals_lock:
+        total = _totals.setdefault(
+            name,
+            {"calls": 0, "seconds": 0.0, "max_peak_bytes": 0, "rows_out": 0},
+        )
+        total["calls"] += 1
+        total["seconds"] += seconds
+        if peak_bytes is not None:
+            total["max_peak_bytes"] = max(total["max_peak_bytes"], peak_bytes)
+        if rows_out is not None:
+            total["rows_out"] += rows_out
+
+
+def instrument(func=None, *, name: str = None):
+    """
+    Decorator recording time, peak memory and row counts of a function.
+
+    The first argument with a `shape` gives the input row count and
+    the return value the output row count.
+    """
+
+    def decorate(fn):
+        stage = name or f"{fn.__module__.removeprefix('src.')}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            run = _current_run.get()
+            if run is None and not ALWAYS_ON:
+                return fn(*args, **kwargs)
+
+            rows_in = next(
+                (
+                    rows
+                    for rows in map(_rows, list(args) + list(kwargs.values()))
+                    if rows is not None
+                ),
+                None,
+            )
+
+            frame = _enter(run)
+            result = None
+            try:
+                result = fn(*args, **kwargs)
+                return result
+            finally:
+                _exit(run, frame, stage, "function", rows_in, _rows(result))
+
+        return wrapper
+
+    if func is not None:
+        return decorate(func)
+    return decorate
+
+
+# -----------------------------------
+# Page sections
+# -----------------------------------
+def _close_section(run: _Run) -> None:
+    if run.open_section is None:
+        return
+    section_name, frame = run.open_section
+    run.open_section = None
+    _exit(run, frame, section_name, "section", None, None)
+
+
+def page_section(title: str) -> None:
+    """
+    Ends the previous page section and starts timing the next one.
+
+    Sections run until the next page_section() call or end_run(), so
+    pages mark them without re-indenting their code.
+    """
+
+    run = _current_run.get()
+    if run is None:
+        return
+
+    _close_section(run)
+    run.open_section = (f"section: {title}", _enter(run))
+
+
+# -----------------------------------
+# Export
+# -----------------------------------
+def stage_totals() -> dict:
+    with _totals_lock:
+        return {name: dict(total) for name, total in _totals.items()}
+
+
+def export_json(records: list = None) -> str:
+    """
+    Serializes a run's records (or the process totals) as JSON.
+    """
+
+    payload = {"records": records} if records is not None else {
+        "totals": stage_totals()
+    }
+    return json.dumps(payload, indent=1)
+
+
+def export_prometheus() -> str:
+    """
+    Renders the process totals in Prometheus text exposition format.
+    """
+
+    totals = stage_totals()
+
+    metrics = [
+        ("calls_total", "counter", "Instrumented calls", "calls"),
+        ("seconds_total", "counter", "Wall time spent in stage", "seconds"),
+        (
+            "peak_bytes",
+            "gauge",
+            "Largest peak traced memory of a single call",
+            "max_peak_bytes",
+        ),
+        ("rows_out_total", "counter", "Rows returned by stage", "rows_out"),
+    ]
+
+    lines = []
+    for suffix, metric_type, help_text, field in metrics:
+        metric = f"{METRIC_PREFIX}_{suffix}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        for stage, total in sorted(totals.items()):
+            label = stage.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{metric}{{stage="{label}"}} {total[field]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def reset_totals() -> None:
+    with _totals_lock:
+        _totals.clear()
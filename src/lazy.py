@@ -0,0 +1,58 @@
+"""
+Deferred imports for heavy optional modules.
+
+`lazy_import("sklearn.linear_model")` returns a placeholder module
+that performs the real import on first attribute access, so pages
+and serving code only pay for scikit-learn or plotly when a model is
+trained or a chart is drawn.
+"""
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module proxy that imports its target on first attribute access.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_target"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Returns `name` as a lazily imported module.
+
+    Modules that are already imported are returned directly.
+
+    Args:
+        name (str): Dotted module name, e.g. "plotly.express"
+
+    Returns:
+        ModuleType: The module, or a proxy that imports it on first use
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    return LazyModule(name)
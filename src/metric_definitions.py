@@ -10,4 +10,10 @@ METRIC_DEFINITIONS = {
     "rebounds_per_game": "Rebounds/Game: Average number of rebounds per game.",
     "turnovers_per_game": "Turnovers/Game: Average number of turnovers per game.",
     "fouls_per_game": "Fouls/Game: Average number of personal fouls per game.",
+    "fg_pct": "Field Goal %: Share of field goal attempts made.",
+    "fg3_pct": "3-Point %: Share of three-point attempts made.",
+    "ft_pct": "Free Throw %: Share of free throw attempts made.",
+    "steals_per_game": "Steals/Game: Average number of steals per game.",
+    "blocks_per_game": "Blocks/Game: Average number of blocks per game.",
+    "turnover_ratio": "Turnover Ratio: Turnovers per point scored.",
 }
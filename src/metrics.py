@@ -1,9 +1,13 @@
+import numpy as np
 import pandas as pd
 
+from src.instrumentation import instrument
+
 
 # -----------------------------------
 # Season-level aggregation
 # -----------------------------------
+@instrument
 def aggregate_team_season_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregates game-level data into team-season level metrics.
@@ -66,6 +70,7 @@ def aggregate_team_season_metrics(df: pd.DataFrame) -> pd.DataFrame:
 # -----------------------------------
 # League-level season summary
 # -----------------------------------
+@instrument
 def aggregate_league_season_metrics(team_season_df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregates team-season metrics into league-season metrics.
@@ -88,3 +93,67 @@ def aggregate_league_season_metrics(team_season_df: pd.DataFrame) -> pd.DataFram
     ).reset_index()
 
     return league_df
+
+
+# -----------------------------------
+# League context per season
+# -----------------------------------
+@instrument
+def compute_league_ranks(
+    team_season_df: pd.DataFrame,
+    metrics: list = None,
+) -> pd.DataFrame:
+    """
+    Ranks, percentiles and z-scores of every team-season against the
+    rest of the league that season.
+
+    All metrics are handled together in grouped, vectorized passes.
+    Rank 1 and the 100th percentile are the league's best, which is
+    the lowest value for LOWER_IS_BETTER_METRICS. Z-scores keep the
+    metric's own direction.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        metrics (list): Metrics to rank (default INSIGHT_METRICS)
+
+    Returns:
+        pd.DataFrame: One row per team-season (same index and order)
+        with SEASON, TEAM_ID, TEAM_NAME, league_size and, for every
+        metric, <metric>_rank, <metric>_percentile and <metric>_zscore
+    """
+
+    from src.insights import INSIGHT_METRICS, LOWER_IS_BETTER_METRICS
+
+    metrics = [
+        metric
+        for metric in (metrics or INSIGHT_METRICS)
+        if metric in team_season_df.columns
+    ]
+
+    seasons = team_season_df["SEASON"]
+    values = team_season_df[metrics].astype("float64")
+
+    # Oriented so that larger is better for every metric
+    signs = np.where(
+        [metric in LOWER_IS_BETTER_METRICS for metric in metrics], -1.0, 1.0
+    )
+    by_season = (values * signs).groupby(seasons)
+
+    ranks = by_season.rank(method="min", ascending=False)
+    percentiles = by_season.rank(method="max", pct=True) * 100
+
+    raw_by_season = values.groupby(seasons)
+    means = raw_by_season.transform("mean")
+    stds = raw_by_season.transform("std", ddof=0)
+    zscores = (values - means) / stds
+
+    return pd.concat(
+        [
+            team_season_df[["SEASON", "TEAM_ID", "TEAM_NAME"]],
+            seasons.groupby(seasons).transform("size").rename("league_size"),
+            ranks.add_suffix("_rank"),
+            percentiles.add_suffix("_percentile"),
+            zscores.add_suffix("_zscore"),
+        ],
+        axis=1,
+    )
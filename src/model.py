@@ -1,10 +1,18 @@
 import pandas as pd
 
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
-from sklearn.metrics import accuracy_score
+from src.lazy import lazy_import
+from src.instrumentation import instrument
+from src.pandas_compat import enable_copy_on_write
+
+enable_copy_on_write()
+
+# scikit-learn loads on first use, so the feature set and the model
+# registry can be imported by serving code without it
+linear_model = lazy_import("sklearn.linear_model")
+metrics = lazy_import("sklearn.metrics")
+model_selection = lazy_import("sklearn.model_selection")
+pipeline = lazy_import("sklearn.pipeline")
+preprocessing = lazy_import("sklearn.preprocessing")
 
 
 # -----------------------------------
@@ -29,6 +37,7 @@ TARGET_COLUMN = "win_flag"
 # -----------------------------------
 # Prepare training data
 # -----------------------------------
+@instrument
 def prepare_model_data(team_season_df: pd.DataFrame) -> tuple:
     """
     Prepares feature matrix X and target y for modeling.
@@ -49,32 +58,66 @@ def prepare_model_data(team_season_df: pd.DataFrame) -> tuple:
             f"Missing required columns for modeling: {missing}"
         )
 
-    df = team_season_df.copy()
-
-    X = df[FEATURE_COLUMNS]
-    y = df[TARGET_COLUMN]
+    X = team_season_df[FEATURE_COLUMNS]
+    y = team_season_df[TARGET_COLUMN]
 
     return X, y
 
 
+def training_seasons_before(
+    team_season_df: pd.DataFrame,
+    season: int,
+) -> pd.DataFrame:
+    """
+    Team-seasons a model may be trained on when scoring `season`.
+
+    Only earlier seasons are kept, so the model never sees the final
+    results of the season it scores.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        season (int): Season that will be scored
+
+    Returns:
+        pd.DataFrame: Earlier team-seasons, or None when they cannot
+        support a stratified split (at least two wins and two losses)
+    """
+
+    prior = team_season_df[team_season_df["SEASON"] < season]
+
+    counts = prior[TARGET_COLUMN].value_counts()
+    if len(counts) < 2 or counts.min() < 2:
+        return None
+
+    return prior
+
+
 # -----------------------------------
 # Train logistic regression model
 # -----------------------------------
+@instrument
 def train_win_prediction_model(
     team_season_df: pd.DataFrame,
     test_size: float = 0.2,
     random_state: int = 42,
+    model_params: dict = None,
 ) -> dict:
     """
     Trains a logistic regression model to predict wins.
 
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        test_size (float): Fraction of rows held out for evaluation
+        random_state (int): Seed for the train/test split
+        model_params (dict): Extra LogisticRegression keyword arguments
+
     Returns:
         dict: Trained model and performance metrics
     """
 
     X, y = prepare_model_data(team_season_df)
 
-    X_train, X_test, y_train, y_test = train_test_split(
+    X_train, X_test, y_train, y_test = model_selection.train_test_split(
         X,
         y,
         test_size=test_size,
@@ -82,21 +125,25 @@ def train_win_prediction_model(
         stratify=y,
     )
 
-    pipeline = Pipeline(
+    params = {"max_iter": 1000}
+    if model_params:
+        params.update(model_params)
+
+    model_pipeline = pipeline.Pipeline(
         steps=[
-            ("scaler", StandardScaler()),
-            ("model", LogisticRegression(max_iter=1000)),
+            ("scaler", preprocessing.StandardScaler()),
+            ("model", linear_model.LogisticRegression(**params)),
         ]
     )
 
-    pipeline.fit(X_train, y_train)
+    model_pipeline.fit(X_train, y_train)
 
-    y_pred = pipeline.predict(X_test)
+    y_pred = model_pipeline.predict(X_test)
 
-    accuracy = accuracy_score(y_test, y_pred)
+    accuracy = metrics.accuracy_score(y_test, y_pred)
 
     return {
-    "model": pipeline,
+    "model": model_pipeline,
     "accuracy": accuracy,
     "X_test": X_test,
     "y_test": y_test,
@@ -109,8 +156,9 @@ def train_win_prediction_model(
 # -----------------------------------
 # Predict win probability
 # -----------------------------------
+@instrument
 def predict_win_probability(
-    model_pipeline: Pipeline,
+    model_pipeline,
     input_data: pd.DataFrame,
 ) -> pd.Series:
     """
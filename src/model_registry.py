@@ -0,0 +1,435 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from importlib.metadata import version
+from pathlib import Path
+
+import joblib
+import pandas as pd
+
+from src.model import (
+    FEATURE_COLUMNS,
+    TARGET_COLUMN,
+    train_win_prediction_model,
+)
+from src.game_model import (
+    GAME_FEATURE_COLUMNS,
+    GAME_TARGET_COLUMN,
+    train_game_win_model,
+)
+from src.numpy_scorer import NumpyWinScorer, export_numpy_scorer
+from src.instrumentation import instrument
+
+# NOTE: scikit-learn is only imported when a model is trained or a
+# pipeline artifact is unpickled, so serving scorers stays free of it.
+
+
+# -----------------------------------
+# Registry configuration
+# -----------------------------------
+MODEL_CACHE_DIR = Path("artifacts/models")
+
+# Number of fitted models kept in process memory
+MEMORY_CACHE_SIZE = 8
+
+# Bump when the artifact layout changes so stale files are ignored
+REGISTRY_VERSION = 1
+
+# Read from package metadata, which does not import scikit-learn
+SKLEARN_VERSION = version("scikit-learn")
+
+
+_memory_cache = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+# -----------------------------------
+# Fingerprinting
+# -----------------------------------
+@instrument
+def fingerprint_frame(df: pd.DataFrame, columns: list = None) -> str:
+    """
+    Computes a stable content hash of a DataFrame.
+
+    Row order, column names and dtypes are part of the hash, so any
+    change that could alter a fitted model changes the fingerprint.
+
+    Args:
+        df (pd.DataFrame): Frame to hash
+        columns (list): Optional subset of columns to hash
+
+    Returns:
+        str: Hex digest
+    """
+
+    if columns is not None:
+        df = df[list(columns)]
+
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    digest = hashlib.sha256()
+    digest.update(row_hashes.tobytes())
+    digest.update(
+        json.dumps(
+            [(str(col), str(dtype)) for col, dtype in df.dtypes.items()]
+        ).encode()
+    )
+
+    return digest.hexdigest()
+
+
+def model_cache_key(
+    namespace: str,
+    data_fingerprint: str,
+    feature_columns: list,
+    test_size: float,
+    random_state: int,
+    model_params: dict = None,
+) -> str:
+    """
+    Builds the registry key for a trained model.
+
+    Args:
+        namespace (str): Model family (e.g. "season")
+        data_fingerprint (str): Output of fingerprint_frame
+        feature_columns (list): Features the model is trained on
+        test_size (float): Hold-out fraction
+        random_state (int): Split seed
+        model_params (dict): Estimator hyperparameters
+
+    Returns:
+        str: Hex digest identifying the artifact
+    """
+
+    payload = {
+        "namespace": namespace,
+        "data": data_fingerprint,
+        "features": list(feature_columns),
+        "test_size": test_size,
+        "random_state": random_state,
+        "model_params": model_params or {},
+        "registry_version": REGISTRY_VERSION,
+        # Pickled estimators are not portable across sklearn releases
+        "sklearn_version": SKLEARN_VERSION,
+    }
+
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+
+    return hashlib.sha256(encoded).hexdigest()
+
+
+# -----------------------------------
+# Storage tiers
+# -----------------------------------
+def _artifact_path(key: str, cache_dir: Path) -> Path:
+    return Path(cache_dir) / f"{key}.joblib"
+
+
+def _scorer_path(key: str, cache_dir: Path) -> Path:
+    return Path(cache_dir) / f"{key}.npz"
+
+
+def _remember(key: str, model_output: dict) -> None:
+    with _memory_lock:
+        _memory_cache[key] = model_output
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _recall(key: str):
+    with _memory_lock:
+        model_output = _memory_cache.get(key)
+        if model_output is not None:
+            _memory_cache.move_to_end(key)
+        return model_output
+
+
+def _write_artifact(model_output: dict, path: Path) -> None:
+    """
+    Writes an artifact atomically so concurrent server processes
+    never read a partially written file.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+    )
+    os.close(fd)
+
+    try:
+        joblib.dump(model_output, tmp_name)
+        os.replace(tmp_name, path)
+    except Exception:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _read_artifact(path: Path):
+    if not path.exists():
+        return None
+
+    try:
+        return joblib.load(path)
+    except Exception:
+        # Corrupt or incompatible artifact: retrain and overwrite it
+        return None
+
+
+@instrument
+def load_or_train(key: str, trainer, cache_dir: Path = MODEL_CACHE_DIR) -> dict:
+    """
+    Returns a trained model from memory, disk or a fresh fit.
+
+    Args:
+        key (str): Output of model_cache_key
+        trainer (callable): Zero-argument function that trains the model
+        cache_dir (Path): Directory holding persisted artifacts
+
+    Returns:
+        dict: Trained model output, as produced by trainer
+    """
+
+    model_output = _recall(key)
+    if model_output is not None:
+        return model_output
+
+    path = _artifact_path(key, cache_dir)
+    model_output = _read_artifact(path)
+
+    if model_output is None:
+        model_output = trainer()
+        _write_artifact(model_output, path)
+
+    _remember(key, model_output)
+
+    return model_output
+
+
+@instrument
+def load_or_export_scorer(
+    key: str,
+    trainer,
+    cache_dir: Path = MODEL_CACHE_DIR,
+) -> NumpyWinScorer:
+    """
+    Returns the NumpyWinScorer of a registry model.
+
+    The scorer is exported next to the pipeline artifact the first
+    time it is requested; later loads read only the .npz, so serving
+    never unpickles the pipeline or imports scikit-learn.
+
+    Args:
+        key (str): Output of model_cache_key
+        trainer (callable): Zero-argument function that trains the model
+        cache_dir (Path): Directory holding persisted artifacts
+
+    Returns:
+        NumpyWinScorer: Scorer with the model's scalar metrics
+    """
+
+    memory_key = f"{key}:scorer"
+
+    scorer = _recall(memory_key)
+    if scorer is not None:
+        return scorer
+
+    path = _scorer_path(key, cache_dir)
+
+    try:
+        scorer = NumpyWinScorer.load(path)
+    except (OSError, ValueError, KeyError):
+        # Missing or corrupt scorer: export it from the pipeline
+        export_numpy_scorer(load_or_train(key, trainer, cache_dir), path)
+        scorer = NumpyWinScorer.load(path)
+
+    _remember(memory_key, scorer)
+
+    return scorer
+
+
+# -----------------------------------
+# Season-level win model
+# -----------------------------------
+@instrument
+def load_or_train_win_model(
+    team_season_df: pd.DataFrame,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    model_params: dict = None,
+    cache_dir: Path = MODEL_CACHE_DIR,
+) -> dict:
+    """
+    Cached equivalent of train_win_prediction_model.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        test_size (float): Hold-out fraction
+        random_state (int): Split seed
+        model_params (dict): Extra LogisticRegression keyword arguments
+        cache_dir (Path): Directory holding persisted artifacts
+
+    Returns:
+        dict: Trained model and performance metrics
+    """
+
+    return load_or_train(
+        *_win_model_entry(
+            team_season_df, test_size, random_state, model_params
+        ),
+        cache_dir=cache_dir,
+    )
+
+
+@instrument
+def load_or_export_win_scorer(
+    team_season_df: pd.DataFrame,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    model_params: dict = None,
+    cache_dir: Path = MODEL_CACHE_DIR,
+) -> NumpyWinScorer:
+    """
+    NumpyWinScorer of the model load_or_train_win_model returns.
+    """
+
+    return load_or_export_scorer(
+        *_win_model_entry(
+            team_season_df, test_size, random_state, model_params
+        ),
+        cache_dir=cache_dir,
+    )
+
+
+def _win_model_entry(
+    team_season_df: pd.DataFrame,
+    test_size: float,
+    random_state: int,
+    model_params: dict,
+) -> tuple:
+    """
+    Registry key and trainer of a season-level win model.
+    """
+
+    data_fingerprint = fingerprint_frame(
+        team_season_df, FEATURE_COLUMNS + [TARGET_COLUMN]
+    )
+
+    key = model_cache_key(
+        namespace="season",
+        data_fingerprint=data_fingerprint,
+        feature_columns=FEATURE_COLUMNS,
+        test_size=test_size,
+        random_state=random_state,
+        model_params=model_params,
+    )
+
+    def trainer():
+        return train_win_prediction_model(
+            team_season_df,
+            test_size=test_size,
+            random_state=random_state,
+            model_params=model_params,
+        )
+
+    return key, trainer
+
+
+# -----------------------------------
+# Game-level win model
+# -----------------------------------
+@instrument
+def load_or_train_game_model(
+    game_features_df: pd.DataFrame,
+    test_size: float = 0.2,
+    model_params: dict = None,
+    cache_dir: Path = MODEL_CACHE_DIR,
+) -> dict:
+    """
+    Cached equivalent of train_game_win_model.
+
+    Args:
+        game_features_df (pd.DataFrame): Output of build_pregame_features
+        test_size (float): Fraction of most recent games held out
+        model_params (dict): Extra LogisticRegression keyword arguments
+        cache_dir (Path): Directory holding persisted artifacts
+
+    Returns:
+        dict: Trained model, performance metrics and training throughput
+    """
+
+    return load_or_train(
+        *_game_model_entry(game_features_df, test_size, model_params),
+        cache_dir=cache_dir,
+    )
+
+
+@instrument
+def load_or_export_game_scorer(
+    game_features_df: pd.DataFrame,
+    test_size: float = 0.2,
+    model_params: dict = None,
+    cache_dir: Path = MODEL_CACHE_DIR,
+) -> NumpyWinScorer:
+    """
+    NumpyWinScorer of the model load_or_train_game_model returns.
+    """
+
+    return load_or_export_scorer(
+        *_game_model_entry(game_features_df, test_size, model_params),
+        cache_dir=cache_dir,
+    )
+
+
+def _game_model_entry(
+    game_features_df: pd.DataFrame,
+    test_size: float,
+    model_params: dict,
+) -> tuple:
+    """
+    Registry key and trainer of a game-level win model.
+    """
+
+    data_fingerprint = fingerprint_frame(
+        game_features_df,
+        ["GAME_ID"] + GAME_FEATURE_COLUMNS + [GAME_TARGET_COLUMN],
+    )
+
+    key = model_cache_key(
+        namespace="game",
+        data_fingerprint=data_fingerprint,
+        feature_columns=GAME_FEATURE_COLUMNS,
+        test_size=test_size,
+        random_state=None,
+        model_params=model_params,
+    )
+
+    def trainer():
+        return train_game_win_model(
+            game_features_df,
+            test_size=test_size,
+            model_params=model_params,
+        )
+
+    return key, trainer
+
+
+def clear_model_cache(cache_dir: Path = None) -> None:
+    """
+    Empties the in-memory tier and, optionally, the on-disk artifacts.
+
+    Args:
+        cache_dir (Path): Directory to purge; memory only when None
+    """
+
+    with _memory_lock:
+        _memory_cache.clear()
+
+    if cache_dir is not None:
+        for pattern in ("*.joblib", "*.npz"):
+            for path in Path(cache_dir).glob(pattern):
+                path.unlink(missing_ok=True)
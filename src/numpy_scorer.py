@@ -0,0 +1,266 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+from numbers import Real
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.instrumentation import instrument
+
+
+# NOTE: this module must not import scikit-learn (directly or via
+# src.model) so that serving code can score without loading it.
+
+
+def _scalar_metrics(model_output: dict) -> dict:
+    """
+    The model output's scalar entries (accuracy, n_train, ...), which
+    travel with the scorer so pages can report them without the
+    pipeline.
+    """
+
+    return {
+        name: value.item() if hasattr(value, "item") else value
+        for name, value in model_output.items()
+        if isinstance(value, Real) and not isinstance(value, bool)
+    }
+
+
+# -----------------------------------
+# Export
+# -----------------------------------
+@instrument
+def export_numpy_scorer(model_output: dict, path: Path) -> Path:
+    """
+    Exports a fitted StandardScaler + LogisticRegression pipeline as
+    a compact .npz holding only the arrays needed for scoring, plus
+    the model's scalar metrics.
+
+    The file is written next to its final path and renamed into place,
+    so concurrent readers never see a partial scorer.
+
+    Args:
+        model_output (dict): Output of train_win_prediction_model
+            (or train_game_win_model / the model registry)
+        path (Path): Destination .npz file
+
+    Returns:
+        Path: Written artifact path
+    """
+
+    pipeline = model_output["model"]
+    scaler = pipeline.named_steps["scaler"]
+    model = pipeline.named_steps["model"]
+
+    if model.coef_.shape[0] != 1:
+        raise ValueError("Only binary logistic regression can be exported")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            np.savez(
+                tmp_file,
+                mean=np.asarray(scaler.mean_, dtype=np.float64),
+                scale=np.asarray(scaler.scale_, dtype=np.float64),
+                coef=np.asarray(model.coef_[0], dtype=np.float64),
+                intercept=np.float64(model.intercept_[0]),
+                feature_names=np.asarray(
+                    model_output["feature_names"], dtype=str
+                ),
+                metrics=np.asarray(json.dumps(_scalar_metrics(model_output))),
+            )
+        os.replace(tmp_name, path)
+    except Exception:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return path
+
+
+# -----------------------------------
+# Pure-NumPy scorer
+# -----------------------------------
+class NumpyWinScorer:
+    """
+    Reproduces the win model's predict_proba with NumPy only.
+
+    Scoring follows the pipeline step by step (standardise, linear
+    decision function, logistic link), so probabilities match the
+    sklearn pipeline to floating-point precision. The object exposes
+    predict_proba and can be passed to predict_win_probability.
+
+    `metrics` holds the scalar entries of the model output it was
+    exported from (accuracy, n_train, ...), when known.
+    """
+
+    def __init__(
+        self,
+        mean: np.ndarray,
+        scale: np.ndarray,
+        coef: np.ndarray,
+        intercept: float,
+        feature_names: list,
+        metrics: dict = None,
+    ):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.coef = np.asarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.feature_names = [str(name) for name in feature_names]
+        self.metrics = dict(metrics or {})
+
+        # Plain-float copies for the single-row fast path
+        self._row_params = list(
+            zip(self.mean.tolist(), self.scale.tolist(), self.coef.tolist())
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "NumpyWinScorer":
+        with np.load(path) as artifact:
+            return cls(
+                mean=artifact["mean"],
+                scale=artifact["scale"],
+                coef=artifact["coef"],
+                intercept=artifact["intercept"],
+                feature_names=artifact["feature_names"].tolist(),
+                # Scorers exported before metrics were stored have none
+                metrics=(
+                    json.loads(artifact["metrics"].item())
+                    if "metrics" in artifact
+                    else None
+                ),
+            )
+
+    @classmethod
+    def from_model_output(cls, model_output: dict) -> "NumpyWinScorer":
+        pipeline = model_output["model"]
+        scaler = pipeline.named_steps["scaler"]
+        model = pipeline.named_steps["model"]
+
+        return cls(
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            coef=model.coef_[0],
+            intercept=model.intercept_[0],
+            feature_names=model_output["feature_names"],
+            metrics=_scalar_metrics(model_output),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Content hash of the scoring parameters, for use in cache keys.
+        """
+
+        digest = hashlib.sha256()
+        for array in (self.mean, self.scale, self.coef):
+            digest.update(array.tobytes())
+        digest.update(repr((self.intercept, self.feature_names)).encode())
+
+        return digest.hexdigest()
+
+    def decision_function(self, X) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X[self.feature_names]
+
+        X = np.asarray(X, dtype=np.float64)
+
+        return ((X - self.mean) / self.scale) @ self.coef + self.intercept
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Two-column class probabilities, like sklearn's predict_proba.
+        """
+
+        prob = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+
+        return np.column_stack([1.0 - prob, prob])
+
+    def predict_one(self, values) -> float:
+        """
+        Win probability for a single row of feature values given in
+        feature_names order, without any array allocation.
+        """
+
+        z = self.intercept
+        for value, (mean, scale, coef) in zip(values, self._row_params):
+            z += (value - mean) / scale * coef
+
+        return 1.0 / (1.0 + math.exp(-z))
+
+    def predict_win_probability(self, input_data: pd.DataFrame) -> pd.Series:
+        """
+        NumPy equivalent of src.model.predict_win_probability.
+        """
+
+        missing = set(self.feature_names) - set(input_data.columns)
+        if missing:
+            raise ValueError(
+                f"Missing required input features: {missing}"
+            )
+
+        return pd.Series(
+            self.predict_proba(input_data)[:, 1],
+            index=input_data.index,
+        )
+
+
+# -----------------------------------
+# Command-line export
+# -----------------------------------
+def main(argv: list = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Export the cached win model as a NumPy scorer (.npz)."
+    )
+    parser.add_argument("output", type=Path, help="destination .npz file")
+    parser.add_argument(
+        "--mode",
+        choices=["season", "game"],
+        default="season",
+        help="which win model to export (default: season)",
+    )
+    args = parser.parse_args(argv)
+
+    # Training-side imports stay local so serving never loads sklearn
+    from src.data_loader import load_data
+    from src.preprocessing import preprocess_data
+    from src.model_registry import (
+        load_or_train_win_model,
+        load_or_train_game_model,
+    )
+
+    df_clean = preprocess_data(load_data())
+
+    if args.mode == "game":
+        from src.game_model import build_pregame_features
+
+        model_output = load_or_train_game_model(
+            build_pregame_features(df_clean)
+        )
+    else:
+        from src.metrics import aggregate_team_season_metrics
+
+        model_output = load_or_train_win_model(
+            aggregate_team_season_metrics(df_clean)
+        )
+
+    path = export_numpy_scorer(model_output, args.output)
+    print(f"exported {args.mode} scorer -> {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,375 @@
+"""
+Online learning for the win model.
+
+Usage:
+    python -m src.online_model [--season 2024] [--batch-size 500]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.game_model import GAME_FEATURE_COLUMNS, GAME_TARGET_COLUMN
+from src.lazy import lazy_import
+from src.instrumentation import instrument
+
+# scikit-learn loads on first use, like src/model.py
+linear_model = lazy_import("sklearn.linear_model")
+metrics = lazy_import("sklearn.metrics")
+pipeline = lazy_import("sklearn.pipeline")
+preprocessing = lazy_import("sklearn.preprocessing")
+
+
+# -----------------------------------
+# Online learning configuration
+# -----------------------------------
+# Holdout accuracy may dip by this much before a batch is rolled back
+ROLLBACK_TOLERANCE = 0.01
+
+MAX_CHECKPOINTS = 5
+
+DEFAULT_BATCH_SIZE = 500
+
+# Share of the games before the replayed season held out for scoring
+DEFAULT_HOLDOUT_SHARE = 0.2
+
+
+# -----------------------------------
+# Incrementally trained win model
+# -----------------------------------
+class OnlineWinModel:
+    """
+    Win model that learns from new observations in small batches.
+
+    Each batch updates the scaler's running mean/variance and takes
+    SGD steps on a logistic loss. After every batch the model is
+    scored on a fixed holdout set: if accuracy drops by more than
+    `tolerance` the batch is rolled back to the last checkpoint,
+    otherwise the new state becomes the latest checkpoint.
+
+    Defaults to the game-level features, since new games are the
+    observations that arrive during a season; pass FEATURE_COLUMNS
+    and TARGET_COLUMN from src.model to update the season model.
+    """
+
+    def __init__(
+        self,
+        holdout_df: pd.DataFrame,
+        feature_columns: list = None,
+        target_column: str = GAME_TARGET_COLUMN,
+        tolerance: float = ROLLBACK_TOLERANCE,
+        max_checkpoints: int = MAX_CHECKPOINTS,
+        checkpoint_path: Path = None,
+        model_params: dict = None,
+    ):
+        self.feature_columns = list(feature_columns or GAME_FEATURE_COLUMNS)
+        self.target_column = target_column
+        self.tolerance = tolerance
+        self.checkpoint_path = (
+            Path(checkpoint_path) if checkpoint_path is not None else None
+        )
+
+        self.X_holdout, self.y_holdout = self._split(holdout_df)
+
+        # Averaged SGD keeps per-batch updates from jumping around
+        params = {
+            "loss": "log_loss",
+            "alpha": 1e-4,
+            "average": True,
+            "random_state": 42,
+        }
+        if model_params:
+            params.update(model_params)
+
+        self.scaler = preprocessing.StandardScaler()
+        self.model = linear_model.SGDClassifier(**params)
+
+        self.batches_seen = 0
+        self.holdout_accuracy = None
+        self.history = []
+        self._checkpoints = deque(maxlen=max_checkpoints)
+
+    # -----------------------------------
+    # Helpers
+    # -----------------------------------
+    def _split(self, df: pd.DataFrame) -> tuple:
+        required_cols = self.feature_columns + [self.target_column]
+        missing = set(required_cols) - set(df.columns)
+        if missing:
+            raise ValueError(
+                f"Missing required columns for online learning: {missing}"
+            )
+
+        X = df[self.feature_columns].to_numpy(dtype=float)
+        y = df[self.target_column].to_numpy(dtype=int)
+
+        return X, y
+
+    def _state(self) -> dict:
+        return {
+            "scaler": copy.deepcopy(self.scaler),
+            "model": copy.deepcopy(self.model),
+            "batches_seen": self.batches_seen,
+            "holdout_accuracy": self.holdout_accuracy,
+        }
+
+    def _restore(self, state: dict) -> None:
+        self.scaler = copy.deepcopy(state["scaler"])
+        self.model = copy.deepcopy(state["model"])
+        self.batches_seen = state["batches_seen"]
+        self.holdout_accuracy = state["holdout_accuracy"]
+
+    def _score_holdout(self) -> float:
+        X = self.scaler.transform(self.X_holdout)
+        return metrics.accuracy_score(self.y_holdout, self.model.predict(X))
+
+    # -----------------------------------
+    # Incremental update
+    # -----------------------------------
+    @instrument
+    def update(self, batch_df: pd.DataFrame) -> dict:
+        """
+        Learns from one batch of new observations.
+
+        Args:
+            batch_df (pd.DataFrame): New rows with features and target
+
+        Returns:
+            dict: Batch outcome (accepted/rolled back, accuracy, timing)
+        """
+
+        start = time.perf_counter()
+
+        X, y = self._split(batch_df)
+        if len(X) == 0:
+            raise ValueError("Cannot update with an empty batch")
+
+        previous = self._state()
+
+        self.scaler.partial_fit(X)
+        self.model.partial_fit(
+            self.scaler.transform(X), y, classes=np.array([0, 1])
+        )
+
+        accuracy = self._score_holdout()
+        baseline = previous["holdout_accuracy"]
+
+        accepted = baseline is None or accuracy >= baseline - self.tolerance
+
+        if accepted:
+            self.batches_seen += 1
+            self.holdout_accuracy = accuracy
+            self.checkpoint()
+        else:
+            self._restore(previous)
+
+        outcome = {
+            "batch": len(self.history) + 1,
+            "rows": len(X),
+            "holdout_accuracy": accuracy,
+            "previous_accuracy": baseline,
+            "accepted": accepted,
+            "seconds": time.perf_counter() - start,
+        }
+        self.history.append(outcome)
+
+        return outcome
+
+    @instrument
+    def update_stream(
+        self,
+        df: pd.DataFrame,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> pd.DataFrame:
+        """
+        Feeds a frame through update() in order, batch_size rows at a time.
+
+        Returns:
+            pd.DataFrame: One row per batch outcome
+        """
+
+        outcomes = [
+            self.update(df.iloc[start:start + batch_size])
+            for start in range(0, len(df), batch_size)
+        ]
+
+        return pd.DataFrame(outcomes)
+
+    # -----------------------------------
+    # Checkpoints
+    # -----------------------------------
+    def checkpoint(self) -> None:
+        """
+        Records the current state in memory and, when configured,
+        writes it atomically to checkpoint_path.
+        """
+
+        state = self._state()
+        self._checkpoints.append(state)
+
+        if self.checkpoint_path is None:
+            return
+
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.checkpoint_path.parent, suffix=".tmp"
+        )
+        os.close(fd)
+        joblib.dump(state, tmp_name)
+        os.replace(tmp_name, self.checkpoint_path)
+
+    def rollback(self, steps: int = 1) -> None:
+        """
+        Reverts to an earlier accepted checkpoint.
+
+        Args:
+            steps (int): How many accepted batches to undo
+        """
+
+        if steps >= len(self._checkpoints):
+            raise ValueError(
+                f"Only {len(self._checkpoints) - 1} earlier checkpoints kept"
+            )
+
+        for _ in range(steps):
+            self._checkpoints.pop()
+
+        self._restore(self._checkpoints[-1])
+
+    def load_checkpoint(self, path: Path = None) -> None:
+        """
+        Restores state written by checkpoint().
+        """
+
+        state = joblib.load(path or self.checkpoint_path)
+        self._restore(state)
+        self._checkpoints.append(self._state())
+
+    # -----------------------------------
+    # Prediction
+    # -----------------------------------
+    @property
+    def pipeline(self):
+        """
+        Current state as a scaler + model Pipeline, usable wherever a
+        trained win model pipeline is expected.
+        """
+
+        return pipeline.Pipeline(
+            steps=[
+                ("scaler", self.scaler),
+                ("model", self.model),
+            ]
+        )
+
+    @instrument
+    def predict_proba(self, X) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X[self.feature_columns]
+
+        X = np.asarray(X, dtype=float)
+
+        return self.model.predict_proba(self.scaler.transform(X))
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a season's games through the online win model."
+    )
+    parser.add_argument(
+        "--season",
+        type=int,
+        default=None,
+        help="season whose games arrive as batches (default: latest)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"team-game rows per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--holdout",
+        type=float,
+        default=DEFAULT_HOLDOUT_SHARE,
+        help="share of the earlier games held out to judge each batch "
+        f"(default: {DEFAULT_HOLDOUT_SHARE})",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="file the latest accepted state is written to",
+    )
+    parser.add_argument(
+        "--dataset", default=None, help="registered dataset key"
+    )
+    args = parser.parse_args(argv)
+
+    if not 0 < args.holdout < 1:
+        raise ValueError("--holdout must be between 0 and 1")
+
+    from src.pipeline import load_game_features
+
+    features = load_game_features(args.dataset).sort_values(
+        "GAME_ID", kind="stable"
+    )
+
+    seasons = sorted(features["SEASON"].unique())
+    season = seasons[-1] if args.season is None else args.season
+    if season not in seasons:
+        raise ValueError(f"Unknown season {season}. Available: {seasons}")
+
+    # Earlier games warm the model up; the most recent of them judge
+    # every batch
+    prior = features[features["SEASON"] < season]
+    n_holdout = int(len(prior) * args.holdout)
+    if n_holdout == 0:
+        raise ValueError(f"No games before {season} to hold out")
+
+    model = OnlineWinModel(
+        prior.iloc[-n_holdout:], checkpoint_path=args.checkpoint
+    )
+
+    warm = prior.iloc[:-n_holdout]
+    if len(warm):
+        model.update_stream(warm, batch_size=args.batch_size)
+        print(
+            f"warm-up: {model.batches_seen} batches from {len(warm):,} "
+            f"earlier rows, holdout accuracy {model.holdout_accuracy:.3f}",
+            file=sys.stderr,
+        )
+
+    outcomes = model.update_stream(
+        features[features["SEASON"] == season], batch_size=args.batch_size
+    )
+
+    print(
+        outcomes.assign(ms=outcomes["seconds"] * 1000)
+        .drop(columns="seconds")
+        .to_string(index=False, float_format="{:.3f}".format)
+    )
+    print(
+        f"{season}: {int(outcomes['accepted'].sum())} of {len(outcomes)} "
+        f"batches accepted, {outcomes['seconds'].mean() * 1000:.1f} ms per "
+        f"batch, holdout accuracy {model.holdout_accuracy:.3f}",
+        file=sys.stderr,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
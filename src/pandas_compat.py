@@ -0,0 +1,22 @@
+"""
+pandas version compatibility.
+
+The analytics modules rely on copy-on-write semantics: they select and
+derive columns without defensive DataFrame.copy() calls and never
+mutate their inputs in place. pandas 3 always behaves this way;
+pandas 2.x needs the mode switched on.
+"""
+
+import pandas as pd
+
+
+PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+
+def enable_copy_on_write() -> None:
+    """
+    Turns on pandas copy-on-write mode where it is optional.
+    """
+
+    if PANDAS_MAJOR < 3:
+        pd.set_option("mode.copy_on_write", True)
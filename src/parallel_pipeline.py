@@ -0,0 +1,251 @@
+"""
+Per-season parallel preprocessing and aggregation.
+
+Seasons are independent in preprocess_data and
+aggregate_team_season_metrics, so the raw game table is partitioned
+by SEASON and each partition runs through both stages in a worker
+process. Results are concatenated in season order, which gives the
+same output as the serial path: preprocessing sorts by SEASON first
+and the team-season groupby is keyed by SEASON first.
+
+The raw columns are handed to workers through shared memory, not
+pickled per task. Rows are reordered so every season is one
+contiguous slice, numeric columns are packed into one 2-D block per
+dtype, and text columns travel as integer codes into a small table
+of unique values. Each worker copies out only its own slice.
+
+Enable it for the dashboard with NBA_DASHBOARD_WORKERS=<processes>.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from src.instrumentation import instrument
+from src.metrics import aggregate_team_season_metrics
+from src.preprocessing import COLUMNS_TO_KEEP, preprocess_data
+
+
+# -----------------------------------
+# Parallel configuration
+# -----------------------------------
+WORKERS_ENV_VAR = "NBA_DASHBOARD_WORKERS"
+
+
+def parallel_workers() -> int:
+    """
+    Worker processes requested through NBA_DASHBOARD_WORKERS
+    (0 when unset, meaning the serial path).
+    """
+
+    value = os.environ.get(WORKERS_ENV_VAR, "").strip()
+    if not value:
+        return 0
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value)
+
+
+# -----------------------------------
+# Shared-memory packing
+# -----------------------------------
+def _is_packable(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def _pack_columns(df: pd.DataFrame) -> tuple:
+    """
+    Copies a frame into shared memory, one 2-D block per numeric dtype
+    plus one block of codes for every other column.
+
+    Returns:
+        tuple: (segments, layout) where layout describes how to
+        rebuild each column from the blocks
+    """
+
+    groups = {}
+    layout = []
+
+    for col in df.columns:
+        values = df[col]
+
+        if _is_packable(values.dtype):
+            block_key = values.dtype.str
+            array = values.to_numpy()
+            uniques = None
+        else:
+            block_key = "codes"
+            codes, unique_values = pd.factorize(values, use_na_sentinel=True)
+            array = codes.astype(np.int64)
+            # The trailing None is what the NA sentinel (-1) maps to
+            uniques = np.append(np.asarray(unique_values, dtype=object), None)
+
+        columns = groups.setdefault(block_key, [])
+        layout.append(
+            {
+                "name": col,
+                "block": block_key,
+                "index": len(columns),
+                "dtype": values.dtype,
+                "uniques": uniques,
+            }
+        )
+        columns.append(array)
+
+    segments = {}
+    try:
+        for block_key, columns in groups.items():
+            dtype = np.dtype(np.int64 if block_key == "codes" else block_key)
+            shape = (len(columns), len(df))
+            shm = shared_memory.SharedMemory(
+                create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1)
+            )
+            block = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            for i, column in enumerate(columns):
+                block[i] = column
+            segments[block_key] = (shm, shape, dtype.str)
+    except Exception:
+        _release(segments)
+        raise
+
+    return segments, layout
+
+
+def _release(segments: dict) -> None:
+    for shm, _, _ in segments.values():
+        shm.close()
+        shm.unlink()
+
+
+def _unpack_rows(block_specs: dict, layout: list, start: int, stop: int):
+    """
+    Rebuilds rows [start, stop) of the packed frame in a worker.
+    """
+
+    handles = {}
+    data = {}
+
+    try:
+        for block_key, (name, shape, dtype) in block_specs.items():
+            shm = shared_memory.SharedMemory(name=name)
+            handles[block_key] = shm
+            block = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+            for column in layout:
+                if column["block"] != block_key:
+                    continue
+                values = block[column["index"], start:stop].copy()
+                if column["uniques"] is not None:
+                    values = column["uniques"][values]
+                data[column["name"]] = values
+    finally:
+        for shm in handles.values():
+            shm.close()
+
+    df = pd.DataFrame(data, index=pd.RangeIndex(start, stop))
+
+    return df.astype({column["name"]: column["dtype"] for column in layout})
+
+
+# -----------------------------------
+# Season worker
+# -----------------------------------
+def _process_season(
+    block_specs: dict,
+    layout: list,
+    start: int,
+    stop: int,
+) -> tuple:
+    part = _unpack_rows(block_specs, layout, start, stop)
+    df_clean = preprocess_data(part)
+    return df_clean, aggregate_team_season_metrics(df_clean)
+
+
+def _concat(frames: list) -> pd.DataFrame:
+    # Empty partitions would loosen the dtypes of the concatenation
+    non_empty = [frame for frame in frames if len(frame)] or frames[:1]
+    return pd.concat(non_empty, ignore_index=True)
+
+
+# -----------------------------------
+# Parallel pipeline
+# -----------------------------------
+@instrument
+def parallel_preprocess_and_aggregate(
+    df: pd.DataFrame,
+    max_workers: int = None,
+) -> tuple:
+    """
+    Runs preprocess_data and aggregate_team_season_metrics per season
+    in a process pool.
+
+    Args:
+        df (pd.DataFrame): Raw dataset
+        max_workers (int): Process pool size; 1 runs seasons inline
+
+    Returns:
+        tuple: (cleaned games, team-season metrics), identical to
+        preprocess_data(df) and aggregate_team_season_metrics of it
+    """
+
+    missing_cols = set(COLUMNS_TO_KEEP) - set(df.columns)
+    if missing_cols or df["SEASON"].isna().any():
+        # Let the serial path raise its usual errors
+        df_clean = preprocess_data(df)
+        return df_clean, aggregate_team_season_metrics(df_clean)
+
+    # -----------------------------------
+    # Partition into contiguous season slices
+    # -----------------------------------
+    seasons = df["SEASON"].to_numpy()
+    ordered = df[COLUMNS_TO_KEEP]
+
+    # Archives are usually stored season by season already
+    if not (seasons[:-1] <= seasons[1:]).all():
+        order = np.argsort(seasons, kind="stable")
+        ordered = ordered.take(order)
+        seasons = seasons[order]
+
+    _, season_starts = np.unique(seasons, return_index=True)
+    bounds = list(zip(season_starts, np.append(season_starts[1:], len(df))))
+
+    if max_workers == 1 or len(bounds) <= 1:
+        results = [
+            _run_inline(ordered.iloc[start:stop]) for start, stop in bounds
+        ]
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(bounds))
+        segments, layout = _pack_columns(ordered)
+
+        try:
+            block_specs = {
+                block_key: (shm.name, shape, dtype)
+                for block_key, (shm, shape, dtype) in segments.items()
+            }
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _process_season,
+                        block_specs,
+                        layout,
+                        int(start),
+                        int(stop),
+                    )
+                    for start, stop in bounds
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            _release(segments)
+
+    return (
+        _concat([clean for clean, _ in results]),
+        _concat([team_season for _, team_season in results]),
+    )
+
+
+def _run_inline(part: pd.DataFrame) -> tuple:
+    df_clean = preprocess_data(part)
+    return df_clean, aggregate_team_season_metrics(df_clean)
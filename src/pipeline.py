@@ -0,0 +1,620 @@
+"""
+Page data access.
+
+Every page loads its tables and models through these functions, for
+a registered dataset key (None is the default dataset, see
+src/datasets.py). In live mode they run the src/ pipeline against the
+dataset's raw CSV and keep the derived tables in the memory-bounded
+dataset cache; when NBA_DASHBOARD_SNAPSHOT is set they only read the
+precomputed snapshot (see src/snapshot.py), so nothing is parsed or
+trained at request time.
+"""
+
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from src.datasets import (
+    cached_dataset_frame,
+    dataset_cache_info,
+    dataset_path,
+    discard_dataset_frames,
+    resolve_dataset,
+)
+
+from src.snapshot import (
+    active_snapshot_dir,
+    load_snapshot_model,
+    load_snapshot_scorer,
+    load_snapshot_table,
+    read_manifest,
+)
+from src.instrumentation import instrument
+
+
+def _cache_name(name: str) -> str:
+    """
+    Dataset cache name of a frame, prefixed with the active snapshot
+    version so a new build is never served from a stale entry.
+    """
+
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is None:
+        return name
+    return f"{Path(snapshot_dir).name}/{name}"
+
+
+def _snapshot_table(dataset_key: str, name: str) -> pd.DataFrame:
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is None:
+        return None
+
+    # Shared by every session through the dataset cache, like the live
+    # frames
+    return cached_dataset_frame(
+        dataset_key,
+        _cache_name(name),
+        lambda: load_snapshot_table(str(snapshot_dir), name),
+    )
+
+
+def _snapshot_model(name: str) -> dict:
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is None:
+        return None
+    return load_snapshot_model(str(snapshot_dir), name)
+
+
+def _snapshot_scorer(name: str):
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is None:
+        return None
+    return load_snapshot_scorer(str(snapshot_dir), name)
+
+
+@instrument
+def dataset_fingerprint(dataset_key: str = None) -> str:
+    """
+    Returns a cheap identifier of the dataset behind every table.
+
+    In snapshot mode this is the snapshot version; live, it is the
+    dataset key and its raw CSV's path, size and modification time.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is not None:
+        return read_manifest(snapshot_dir)["version"]
+
+    path = dataset_path(dataset_key)
+    stat = path.stat()
+    return f"{dataset_key}:{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+# -----------------------------------
+# Tables
+# -----------------------------------
+@instrument
+def load_clean_games(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns preprocessed game-level data.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_table(dataset_key, "games_clean")
+    if snapshot is not None:
+        return snapshot
+
+    return cached_dataset_frame(
+        dataset_key,
+        "games_clean",
+        lambda: _build_clean_games(dataset_key),
+    )
+
+
+def _build_clean_games(dataset_key: str) -> pd.DataFrame:
+    from src.data_loader import load_data
+    from src.parallel_pipeline import parallel_workers
+
+    df_raw = load_data(dataset_key)
+
+    workers = parallel_workers()
+    if workers > 1:
+        from src.parallel_pipeline import parallel_preprocess_and_aggregate
+
+        # The per-season pool yields the team-season table as well
+        df_clean, team_season = parallel_preprocess_and_aggregate(
+            df_raw, max_workers=workers
+        )
+        cached_dataset_frame(dataset_key, "team_season", lambda: team_season)
+        return df_clean
+
+    from src.preprocessing import preprocess_data
+
+    return preprocess_data(df_raw)
+
+
+@instrument
+def load_team_season_metrics(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns team-season aggregated metrics.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_table(dataset_key, "team_season")
+    if snapshot is not None:
+        return snapshot
+
+    from src.metrics import aggregate_team_season_metrics
+
+    return cached_dataset_frame(
+        dataset_key,
+        "team_season",
+        lambda: aggregate_team_season_metrics(load_clean_games(dataset_key)),
+    )
+
+
+@instrument
+def load_classified_team_seasons(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns team-season metrics with the team_strength label.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_table(dataset_key, "classified")
+    if snapshot is not None:
+        return snapshot
+
+    from src.classification import classify_team_strength
+
+    return cached_dataset_frame(
+        dataset_key,
+        "classified",
+        lambda: classify_team_strength(load_team_season_metrics(dataset_key)),
+    )
+
+
+@instrument
+def load_league_ranks(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns per-season league ranks, percentiles and z-scores of the
+    team-season metrics.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    # Snapshots built before the table existed derive it from their
+    # own team-season table
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is not None:
+        if "league_ranks" in read_manifest(snapshot_dir)["tables"]:
+            return _snapshot_table(dataset_key, "league_ranks")
+
+    from src.metrics import compute_league_ranks
+
+    return cached_dataset_frame(
+        dataset_key,
+        _cache_name("league_ranks"),
+        lambda: compute_league_ranks(load_team_season_metrics(dataset_key)),
+    )
+
+
+@instrument
+def load_game_features(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns leakage-free pre-game features.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_table(dataset_key, "game_features")
+    if snapshot is not None:
+        return snapshot
+
+    from src.game_model import build_pregame_features
+
+    return cached_dataset_frame(
+        dataset_key,
+        "game_features",
+        lambda: build_pregame_features(load_clean_games(dataset_key)),
+    )
+
+
+@instrument
+def load_walk_forward(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns season-by-season walk-forward validation results.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_table(dataset_key, "walk_forward")
+    if snapshot is not None:
+        return snapshot
+
+    from src.evaluation import load_or_run_walk_forward
+
+    return cached_dataset_frame(
+        dataset_key,
+        "walk_forward",
+        lambda: load_or_run_walk_forward(
+            load_team_season_metrics(dataset_key)
+        ),
+    )
+
+
+@instrument
+def load_win_correlations(dataset_key: str = None) -> pd.DataFrame:
+    """
+    Returns metric correlations with win % across all seasons.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_table(dataset_key, "correlations")
+    if snapshot is not None:
+        return snapshot
+
+    from src.insights import calculate_win_correlations
+
+    return cached_dataset_frame(
+        dataset_key,
+        "correlations",
+        lambda: calculate_win_correlations(
+            load_team_season_metrics(dataset_key)
+        ),
+    )
+
+
+# -----------------------------------
+# Models
+# -----------------------------------
+@instrument
+def load_win_model(dataset_key: str = None) -> dict:
+    """
+    Returns the team-season win model output.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_model("win_model")
+    if snapshot is not None:
+        return snapshot
+
+    from src.model_registry import load_or_train_win_model
+
+    return load_or_train_win_model(load_team_season_metrics(dataset_key))
+
+
+@instrument
+def load_game_model(dataset_key: str = None) -> dict:
+    """
+    Returns the game-level win model output.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_model("game_model")
+    if snapshot is not None:
+        return snapshot
+
+    from src.model_registry import load_or_train_game_model
+
+    return load_or_train_game_model(load_game_features(dataset_key))
+
+
+@instrument
+def load_win_scorer(dataset_key: str = None, before_season: int = None):
+    """
+    Returns the team-season win model as a NumpyWinScorer.
+
+    Pages score with this rather than load_win_model: only the
+    exported .npz is read, so scikit-learn is not imported.
+
+    Args:
+        dataset_key (str): Registered dataset key
+        before_season (int): Fit only on seasons before this one, for
+            scoring that season without its final results
+
+    Returns:
+        NumpyWinScorer: Scorer, or None when before_season has too few
+        earlier seasons (or the snapshot predates per-season models)
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    name = "win_model"
+    if before_season is not None:
+        name = f"win_model_before_{int(before_season)}"
+
+    snapshot_dir = active_snapshot_dir()
+    if snapshot_dir is not None:
+        if before_season is not None and (
+            name not in read_manifest(snapshot_dir)["models"]
+        ):
+            return None
+        return _snapshot_scorer(name)
+
+    from src.model_registry import load_or_export_win_scorer
+
+    team_season_df = load_team_season_metrics(dataset_key)
+
+    if before_season is not None:
+        from src.model import training_seasons_before
+
+        team_season_df = training_seasons_before(
+            team_season_df, before_season
+        )
+        if team_season_df is None:
+            return None
+
+    return load_or_export_win_scorer(team_season_df)
+
+
+@instrument
+def load_game_scorer(dataset_key: str = None):
+    """
+    Returns the game-level win model as a NumpyWinScorer.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    snapshot = _snapshot_scorer("game_model")
+    if snapshot is not None:
+        return snapshot
+
+    from src.model_registry import load_or_export_game_scorer
+
+    return load_or_export_game_scorer(load_game_features(dataset_key))
+
+
+# -----------------------------------
+# Filtered queries
+# -----------------------------------
+# Pages read the season and team slices they display through these.
+# With NBA_DASHBOARD_BACKEND=sqlite the filters are pushed down to an
+# indexed SQLite copy of the tables (see src/sql_store.py); otherwise
+# they are applied to the cached frames.
+SQL_TABLES = {
+    "games_clean": load_clean_games,
+    "team_season": load_team_season_metrics,
+    "classified": load_classified_team_seasons,
+}
+
+_sql_build_lock = threading.Lock()
+
+
+def _sql_database(dataset_key: str):
+    """
+    Returns the dataset's SQLite database, or None on the pandas
+    backend. The database is built from the frames on first use; frames
+    loaded only for the build are dropped from the dataset cache again,
+    since the pages then read their rows from SQLite.
+    """
+
+    from src.sql_store import (
+        build_database,
+        database_path,
+        sql_backend_enabled,
+    )
+
+    if not sql_backend_enabled():
+        return None
+
+    path = database_path(dataset_key, dataset_fingerprint(dataset_key))
+    with _sql_build_lock:
+        if not path.exists():
+            resident = _cached_frame_names(dataset_key)
+            build_database(
+                path,
+                {name: load(dataset_key) for name, load in SQL_TABLES.items()},
+            )
+            discard_dataset_frames(
+                dataset_key, _cached_frame_names(dataset_key) - resident
+            )
+    return path
+
+
+def _cached_frame_names(dataset_key: str) -> set:
+    return set(dataset_cache_info()["datasets"].get(dataset_key, []))
+
+
+def _query(
+    table: str,
+    dataset_key: str,
+    seasons: list = None,
+    team_ids: list = None,
+    team_names: list = None,
+) -> pd.DataFrame:
+    dataset_key = resolve_dataset(dataset_key)
+
+    from src.sql_store import filter_frame, query_table
+
+    path = _sql_database(dataset_key)
+    if path is not None:
+        return query_table(path, table, seasons, team_ids, team_names)
+
+    return filter_frame(
+        SQL_TABLES[table](dataset_key), seasons, team_ids, team_names
+    )
+
+
+@instrument
+def query_clean_games(
+    dataset_key: str = None,
+    seasons: list = None,
+    team_ids: list = None,
+) -> pd.DataFrame:
+    """
+    Returns the cleaned games of the given seasons and teams (None
+    keeps all), in their original order and with their row labels.
+    """
+
+    return _query("games_clean", dataset_key, seasons, team_ids=team_ids)
+
+
+@instrument
+def query_team_season_metrics(
+    dataset_key: str = None,
+    seasons: list = None,
+    team_names: list = None,
+) -> pd.DataFrame:
+    """
+    Returns team-season metrics of the given seasons and teams.
+    """
+
+    return _query("team_season", dataset_key, seasons, team_names=team_names)
+
+
+@instrument
+def query_classified_team_seasons(
+    dataset_key: str = None,
+    seasons: list = None,
+    team_names: list = None,
+) -> pd.DataFrame:
+    """
+    Returns classified team-seasons of the given seasons and teams.
+    """
+
+    return _query("classified", dataset_key, seasons, team_names=team_names)
+
+
+# -----------------------------------
+# Page summaries
+# -----------------------------------
+# Summaries cover every season, so they are built once per dataset
+# version and cached as text instead of re-reading the full tables on
+# each rerun.
+def _cached_summary(dataset_key: str, name: str, build) -> str:
+    dataset_key = resolve_dataset(dataset_key)
+
+    return cached_dataset_frame(
+        dataset_key,
+        f"{dataset_fingerprint(dataset_key)}/summary/{name}",
+        lambda: build(dataset_key),
+    )
+
+
+@instrument
+def load_league_overview_summary(dataset_key: str = None) -> str:
+    """
+    Returns the League Overview summary of all seasons.
+    """
+
+    from src.summaries import league_overview_summary
+
+    return _cached_summary(
+        dataset_key,
+        "league_overview",
+        lambda key: league_overview_summary(query_team_season_metrics(key)),
+    )
+
+
+@instrument
+def load_team_strength_summary(dataset_key: str = None) -> str:
+    """
+    Returns the Team Strength Classification summary of all seasons.
+    """
+
+    from src.summaries import team_strength_summary
+
+    return _cached_summary(
+        dataset_key,
+        "team_strength",
+        lambda key: team_strength_summary(query_classified_team_seasons(key)),
+    )
+
+
+@instrument
+def load_seasons(dataset_key: str = None) -> list:
+    """
+    Returns the dataset's seasons in ascending order.
+    """
+
+    return _distinct("SEASON", dataset_key)
+
+
+@instrument
+def load_team_names(dataset_key: str = None) -> list:
+    """
+    Returns the dataset's team names in ascending order.
+    """
+
+    return _distinct("TEAM_NAME", dataset_key)
+
+
+def _distinct(column: str, dataset_key: str) -> list:
+    dataset_key = resolve_dataset(dataset_key)
+
+    path = _sql_database(dataset_key)
+    if path is not None:
+        from src.sql_store import distinct_values
+
+        return distinct_values(path, "team_season", column)
+
+    values = load_team_season_metrics(dataset_key)[column]
+    return sorted(values.unique().tolist())
+
+
+# -----------------------------------
+# Indexed lookups
+# -----------------------------------
+@instrument
+def load_team_season_store(dataset_key: str = None, classified: bool = False):
+    """
+    Returns a TeamSeasonStore over the team-season metrics (or the
+    classified team-seasons), cached with the dataset's frames.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    from src.team_season_store import TeamSeasonStore
+
+    table = "classified" if classified else "team_season"
+
+    return cached_dataset_frame(
+        dataset_key,
+        _cache_name(f"{table}_store"),
+        lambda: TeamSeasonStore(SQL_TABLES[table](dataset_key)),
+    )
+
+
+@instrument
+def load_league_rank_store(dataset_key: str = None):
+    """
+    Returns a TeamSeasonStore over the league ranks, for per-team-season
+    lookups such as "3rd of 30 in eFG%".
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    from src.team_season_store import TeamSeasonStore
+
+    return cached_dataset_frame(
+        dataset_key,
+        _cache_name("league_ranks_store"),
+        lambda: TeamSeasonStore(load_league_ranks(dataset_key)),
+    )
+
+
+@instrument
+def load_game_log_index(dataset_key: str = None):
+    """
+    Returns the per-team GameLogIndex over the cleaned games, cached
+    with the dataset's frames.
+    """
+
+    dataset_key = resolve_dataset(dataset_key)
+
+    from src.game_log import GameLogIndex
+
+    return cached_dataset_frame(
+        dataset_key,
+        _cache_name("game_log_index"),
+        lambda: GameLogIndex(load_clean_games(dataset_key)),
+    )
@@ -1,5 +1,10 @@
 import pandas as pd
 
+from src.instrumentation import instrument
+from src.pandas_compat import enable_copy_on_write
+
+enable_copy_on_write()
+
 
 # -----------------------------------
 # Columns to keep for analysis
@@ -48,6 +53,7 @@ COLUMNS_TO_KEEP = [
 # -----------------------------------
 # Main preprocessing function
 # -----------------------------------
+@instrument
 def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Cleans and validates raw NBA data for analysis.
@@ -65,11 +71,11 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: Cleaned dataset
     """
 
-    df = df.copy()
-
     # -----------------------------------
     # Keep only relevant columns
     # -----------------------------------
+    # Under copy-on-write this selection shares the raw columns; only
+    # columns that are actually modified below get copied
     df = df[COLUMNS_TO_KEEP]
 
     # -----------------------------------
@@ -84,18 +90,22 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     # -----------------------------------
     # Handle missing values
     # -----------------------------------
-    numeric_cols = df.select_dtypes(include="number").columns
-    df[numeric_cols] = df[numeric_cols].fillna(0)
-
-    categorical_cols = df.select_dtypes(include="object").columns
-    df[categorical_cols] = df[categorical_cols].fillna("Unknown")
+    fill_values = {
+        col: 0 for col in df.select_dtypes(include="number").columns
+    }
+    fill_values.update(
+        {col: "Unknown" for col in df.select_dtypes(include="object").columns}
+    )
+    df = df.fillna(fill_values)
 
     # -----------------------------------
     # Ensure logical consistency
     # -----------------------------------
-    df = df[df["FGA"] >= df["FGM"]]
-    df = df[df["FG3A"] >= df["FG3M"]]
-    df = df[df["FTA"] >= df["FTM"]]
+    df = df[
+        (df["FGA"] >= df["FGM"])
+        & (df["FG3A"] >= df["FG3M"])
+        & (df["FTA"] >= df["FTM"])
+    ]
 
     # -----------------------------------
     # Sort for deterministic behavior
@@ -0,0 +1,123 @@
+"""
+Payload trimming for charts and tables.
+
+Pages pass their frames through these helpers before plotting so only
+the plotted and hover columns are serialized, numbers are rounded to
+display precision, and large scatter/line charts switch to WebGL.
+Set NBA_DASHBOARD_TRIM_PAYLOADS=0 to send full frames (used by
+benchmarks/bench_payload.py as the reference).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.instrumentation import instrument
+
+
+# -----------------------------------
+# Rendering configuration
+# -----------------------------------
+TRIM_ENV_VAR = "NBA_DASHBOARD_TRIM_PAYLOADS"
+
+# Points per chart above which scatter/line traces use WebGL
+WEBGL_THRESHOLD = 2_000
+
+# Decimal places kept for plotted and tabulated floats
+DISPLAY_DECIMALS = 3
+
+# Rows per page for server-side table pagination
+TABLE_PAGE_SIZE = 50
+
+
+def trimming_enabled() -> bool:
+    return os.environ.get(TRIM_ENV_VAR, "1").strip() != "0"
+
+
+def render_mode(n_points: int) -> str:
+    """
+    Returns the plotly express render_mode for a chart of n_points.
+    """
+
+    if not trimming_enabled():
+        return "auto"
+    return "webgl" if n_points >= WEBGL_THRESHOLD else "svg"
+
+
+# -----------------------------------
+# Frame trimming
+# -----------------------------------
+def _round_floats(df: pd.DataFrame, decimals: int) -> pd.DataFrame:
+    float_cols = df.select_dtypes(include="floating").columns
+    if len(float_cols) == 0:
+        return df
+    return df.assign(**{col: df[col].round(decimals) for col in float_cols})
+
+
+@instrument
+def plot_frame(
+    df: pd.DataFrame,
+    columns: list,
+    decimals: int = DISPLAY_DECIMALS,
+) -> pd.DataFrame:
+    """
+    Projects and compacts a frame before it is handed to plotly.
+
+    Plotly serializes numeric arrays as typed binary buffers, so
+    rounding alone does not shrink them; rounded floats are also
+    narrowed to float32 and integers to the smallest integer type.
+
+    Args:
+        df (pd.DataFrame): Source frame
+        columns (list): Columns used for axes, color and hover
+        decimals (int): Decimal places kept for floats
+
+    Returns:
+        pd.DataFrame: Frame with only the requested columns
+    """
+
+    if not trimming_enabled():
+        return df
+
+    df = df[list(dict.fromkeys(columns))]
+    df = _round_floats(df, decimals)
+
+    narrowed = {}
+    for col in df.columns:
+        if pd.api.types.is_float_dtype(df[col]):
+            narrowed[col] = df[col].astype(np.float32)
+        elif pd.api.types.is_integer_dtype(df[col]):
+            narrowed[col] = pd.to_numeric(df[col], downcast="integer")
+
+    return df.assign(**narrowed) if narrowed else df
+
+
+def plot_array(
+    values: np.ndarray,
+    decimals: int = DISPLAY_DECIMALS,
+) -> np.ndarray:
+    """
+    Rounds and narrows a numeric array (e.g. a heatmap grid) to float32.
+    """
+
+    if not trimming_enabled():
+        return values
+
+    return np.round(values, decimals).astype(np.float32)
+
+
+def table_frame(
+    df: pd.DataFrame,
+    decimals: int = DISPLAY_DECIMALS,
+) -> pd.DataFrame:
+    """
+    Rounds floats to display precision before a table is sent.
+
+    Dtypes are kept so the grid shows the rounded value exactly.
+    """
+
+    if not trimming_enabled():
+        return df
+
+    return _round_floats(df, decimals)
@@ -0,0 +1,426 @@
+"""
+Static report export.
+
+Renders summaries, KPI tables and chart JSON for every team and
+season into a self-contained HTML/JSON bundle that can be served
+from any static file host.
+
+Usage:
+    python -m src.report_export reports/
+    python -m src.report_export reports/ --workers 8
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import plotly.express as px
+import plotly.offline
+
+from src.insights import (
+    calculate_win_correlations,
+    explain_win_prediction,
+    identify_key_win_drivers,
+)
+from src.summaries import (
+    insight_summary,
+    league_overview_summary,
+    team_performance_summary,
+    team_strength_summary,
+    win_prediction_summary_v2,
+)
+from src.instrumentation import instrument
+
+
+# -----------------------------------
+# Report configuration
+# -----------------------------------
+KPI_COLUMNS = [
+    "games_played",
+    "wins",
+    "win_pct",
+    "points_per_game",
+    "net_rating",
+    "efg_pct",
+    "pie",
+    "turnover_ratio",
+    "team_strength",
+]
+
+TREND_METRICS = [
+    "win_pct",
+    "points_per_game",
+    "net_rating",
+    "efg_pct",
+    "pie",
+]
+
+PLOTLY_JS_PATH = "assets/plotly.min.js"
+
+
+# -----------------------------------
+# HTML helpers
+# -----------------------------------
+def _markdown_to_html(text: str) -> str:
+    escaped = html.escape(text)
+    escaped = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", escaped)
+    return escaped.replace("\n", "<br>")
+
+
+def _page(title: str, body: str, depth: int) -> str:
+    prefix = "../" * depth
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title>"
+        f"<script src='{prefix}{PLOTLY_JS_PATH}'></script>"
+        "<style>body{font-family:sans-serif;max-width:1100px;margin:2rem auto;"
+        "padding:0 1rem}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ddd;padding:4px 8px;text-align:right}"
+        "</style></head><body>"
+        f"<p><a href='{prefix}index.html'>← All teams</a></p>"
+        f"<h1>{html.escape(title)}</h1>{body}</body></html>"
+    )
+
+
+def _chart_div(chart_json: dict, div_id: str) -> str:
+    # A "</" inside a string (e.g. a team name) would end the script
+    payload = json.dumps(chart_json).replace("</", "<\\/")
+    return (
+        f"<div id='{div_id}'></div><script>"
+        f"(function(f){{Plotly.newPlot('{div_id}',f.data,f.layout);}})"
+        f"({payload});</script>"
+    )
+
+
+def _kpi_table(row: pd.Series) -> str:
+    cells = "".join(
+        f"<tr><th>{col}</th><td>{html.escape(str(row[col]))}</td></tr>"
+        for col in KPI_COLUMNS
+        if col in row
+    )
+    return f"<table>{cells}</table>"
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(value)).strip("_") or "team"
+
+
+# -----------------------------------
+# Per-team renderer (worker)
+# -----------------------------------
+def _render_team(
+    team_df: pd.DataFrame,
+    scorer,
+    accuracy: float,
+    out_dir: str,
+) -> dict:
+    """
+    Renders every season of one team and writes its files.
+
+    Returns:
+        dict: Index entry for the team
+    """
+
+    team_df = team_df.sort_values("SEASON")
+    team_name = team_df["TEAM_NAME"].iloc[0]
+    # Abbreviations are reused across relocations and leagues; TEAM_ID
+    # keeps parallel workers from writing to the same directory
+    slug = _slug(
+        f"{team_df['TEAM_ABBREVIATION'].iloc[0]}_"
+        f"{team_df['TEAM_ID'].iloc[0]}"
+    )
+
+    team_dir = Path(out_dir) / "teams" / slug
+    team_dir.mkdir(parents=True, exist_ok=True)
+
+    # -----------------------------------
+    # Team-level trend charts
+    # -----------------------------------
+    trend_chart = json.loads(
+        px.line(
+            team_df,
+            x="SEASON",
+            y=TREND_METRICS,
+            markers=True,
+            title=f"{team_name} Key Metrics Over Seasons",
+        ).to_json()
+    )
+
+    probabilities = scorer.predict_win_probability(team_df)
+
+    season_sections = []
+    seasons = []
+
+    for idx, row in team_df.iterrows():
+        season = int(row["SEASON"])
+        probability = float(probabilities.loc[idx])
+
+        explanation = explain_win_prediction(
+            team_row=row,
+            feature_names=scorer.feature_names,
+            coefficients=scorer.coef,
+        )
+
+        impact = pd.concat(
+            [explanation["positive"], explanation["negative"]]
+        )
+        impact_chart = json.loads(
+            px.bar(
+                impact,
+                x="impact",
+                y="feature",
+                orientation="h",
+                title=f"{season} Prediction Drivers",
+            ).to_json()
+        )
+
+        summaries = {
+            "team_performance": team_performance_summary(row.to_frame().T),
+            "win_prediction": win_prediction_summary_v2(
+                team_name=team_name,
+                probability=probability,
+                explanation=explanation,
+                accuracy=accuracy,
+            ),
+        }
+
+        kpis = {
+            col: (row[col].item() if hasattr(row[col], "item") else row[col])
+            for col in KPI_COLUMNS
+            if col in row
+        }
+
+        season_payload = {
+            "team_id": int(row["TEAM_ID"]),
+            "team_name": team_name,
+            "season": season,
+            "kpis": kpis,
+            "win_probability": probability,
+            "summaries": summaries,
+            "charts": {"prediction_drivers": impact_chart},
+        }
+
+        (team_dir / f"{season}.json").write_text(
+            json.dumps(season_payload, default=str)
+        )
+
+        season_sections.append(
+            f"<h2 id='s{season}'>{season}</h2>"
+            + _kpi_table(row)
+            + "".join(
+                f"<p>{_markdown_to_html(text)}</p>"
+                for text in summaries.values()
+            )
+            + _chart_div(impact_chart, f"drivers_{season}")
+        )
+        seasons.append(season)
+
+    body = (
+        "<p>"
+        + " · ".join(f"<a href='#s{s}'>{s}</a>" for s in seasons)
+        + "</p>"
+        + _chart_div(trend_chart, "trend")
+        + "".join(season_sections)
+    )
+
+    (team_dir / "index.html").write_text(_page(team_name, body, depth=2))
+    (team_dir / "trend.json").write_text(json.dumps(trend_chart))
+
+    return {
+        "team_name": team_name,
+        "slug": slug,
+        "seasons": seasons,
+        "path": f"teams/{slug}/index.html",
+    }
+
+
+# -----------------------------------
+# League-level pages
+# -----------------------------------
+def _render_league(classified_df: pd.DataFrame, out_dir: Path) -> dict:
+    seasons = sorted(int(s) for s in classified_df["SEASON"].unique())
+
+    league = {"overview": league_overview_summary(classified_df), "seasons": {}}
+
+    for season in seasons:
+        season_df = classified_df[classified_df["SEASON"] == season]
+        corr_df = calculate_win_correlations(season_df)
+
+        league["seasons"][season] = {
+            "strength_summary": team_strength_summary(season_df),
+            "insight_summary": insight_summary(
+                identify_key_win_drivers(corr_df)
+            ),
+            "correlations": corr_df.to_dict(orient="records"),
+        }
+
+    (out_dir / "league.json").write_text(json.dumps(league, default=str))
+
+    return league
+
+
+def _render_index(league: dict, teams: list, out_dir: Path) -> None:
+    team_links = "".join(
+        f"<li><a href='{t['path']}'>{html.escape(t['team_name'])}</a> "
+        f"({min(t['seasons'])}–{max(t['seasons'])})</li>"
+        for t in sorted(teams, key=lambda t: t["team_name"])
+    )
+
+    season_blocks = "".join(
+        f"<h3>{season}</h3>"
+        f"<p>{_markdown_to_html(info['strength_summary'])}</p>"
+        f"<p>{_markdown_to_html(info['insight_summary'])}</p>"
+        for season, info in league["seasons"].items()
+    )
+
+    body = (
+        f"<p>{_markdown_to_html(league['overview'])}</p>"
+        f"<h2>Teams</h2><ul>{team_links}</ul>"
+        f"<h2>Seasons</h2>{season_blocks}"
+    )
+
+    (out_dir / "index.html").write_text(
+        _page("NBA Team Intelligence Report", body, depth=0)
+    )
+
+
+# -----------------------------------
+# Export
+# -----------------------------------
+@instrument
+def export_static_report(
+    out_dir: Path,
+    classified_df: pd.DataFrame,
+    model_output: dict,
+    max_workers: int = None,
+    progress=None,
+) -> dict:
+    """
+    Writes the static report bundle for every team and season.
+
+    Teams are rendered in a process pool; each worker writes its
+    team's files as soon as they are ready.
+
+    Args:
+        out_dir (Path): Destination directory
+        classified_df (pd.DataFrame): Output of classify_team_strength
+        model_output (dict): Trained win model output
+        max_workers (int): Process pool size; 1 renders inline
+        progress (callable): Optional callback per finished team
+
+    Returns:
+        dict: The manifest written to manifest.json
+    """
+
+    from src.numpy_scorer import NumpyWinScorer
+
+    out_dir = Path(out_dir)
+    (out_dir / "assets").mkdir(parents=True, exist_ok=True)
+    (out_dir / PLOTLY_JS_PATH).write_text(plotly.offline.get_plotlyjs())
+
+    scorer = NumpyWinScorer.from_model_output(model_output)
+    accuracy = model_output["accuracy"]
+
+    league = _render_league(classified_df, out_dir)
+
+    team_frames = [
+        team_df for _, team_df in classified_df.groupby("TEAM_ID")
+    ]
+    teams = []
+
+    if max_workers == 1:
+        for team_df in team_frames:
+            teams.append(_render_team(team_df, scorer, accuracy, str(out_dir)))
+            if progress is not None:
+                progress(teams[-1], len(teams), len(team_frames))
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(team_frames))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _render_team, team_df, scorer, accuracy, str(out_dir)
+                )
+                for team_df in team_frames
+            ]
+            for future in as_completed(futures):
+                teams.append(future.result())
+                if progress is not None:
+                    progress(teams[-1], len(teams), len(team_frames))
+
+    _render_index(league, teams, out_dir)
+
+    manifest = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "model_accuracy": accuracy,
+        "teams": sorted(teams, key=lambda t: t["team_name"]),
+        "team_seasons": sum(len(t["seasons"]) for t in teams),
+    }
+
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=1))
+
+    return manifest
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Export a static HTML/JSON report for every team and season."
+    )
+    parser.add_argument("out_dir", type=Path, help="destination directory")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
+
+    from src.data_loader import load_data
+    from src.preprocessing import preprocess_data
+    from src.metrics import aggregate_team_season_metrics
+    from src.classification import classify_team_strength
+    from src.model_registry import load_or_train_win_model
+
+    team_season_df = aggregate_team_season_metrics(preprocess_data(load_data()))
+    classified_df = classify_team_strength(team_season_df)
+    model_output = load_or_train_win_model(team_season_df)
+
+    start = time.perf_counter()
+
+    def report(team: dict, done: int, total: int) -> None:
+        print(
+            f"\r[{done}/{total}] {team['team_name']:<30}",
+            end="",
+            file=sys.stderr,
+        )
+
+    manifest = export_static_report(
+        args.out_dir,
+        classified_df,
+        model_output,
+        max_workers=args.workers,
+        progress=report,
+    )
+
+    print(
+        f"\nwrote {manifest['team_seasons']:,} team-seasons for "
+        f"{len(manifest['teams'])} teams in {time.perf_counter() - start:.1f}s "
+        f"-> {args.out_dir / 'index.html'}",
+        file=sys.stderr,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.game_model import derive_home_flag
+from src.instrumentation import instrument
+from src.pandas_compat import enable_copy_on_write
+
+enable_copy_on_write()
+
+
+# -----------------------------------
+# Simulation configuration
+# -----------------------------------
+DEFAULT_SIMULATIONS = 100_000
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Playoff teams per conference, or league-wide without conferences
+PLAYOFF_SPOTS_PER_CONFERENCE = 8
+PLAYOFF_SPOTS_LEAGUE = 16
+
+# Home-court edge on the log-odds scale (~3 percentage points)
+HOME_ADVANTAGE_LOGIT = 0.12
+
+# Per-game ratings are clipped to realistic bounds (the best and worst
+# NBA records are near .890 and .110), so no game is ever a certainty
+RATING_CLIP = (0.1, 0.9)
+
+# Inverse temperatures tried when calibrating ratings (0 rates every
+# team as average, 1 keeps the input probabilities unchanged)
+CALIBRATION_GRID = np.linspace(0.0, 1.0, 201)
+
+
+# -----------------------------------
+# Game probabilities
+# -----------------------------------
+@instrument
+def game_win_probabilities(
+    schedule_df: pd.DataFrame,
+    team_ratings: pd.Series,
+    home_advantage: float = HOME_ADVANTAGE_LOGIT,
+) -> np.ndarray:
+    """
+    Home-team win probability for each scheduled game.
+
+    Uses the log5 formula on team ratings (expected win probability
+    against an average team, e.g. win % or calibrate_ratings output),
+    shifted by a home-court edge on the log-odds scale.
+
+    Args:
+        schedule_df (pd.DataFrame): HOME_TEAM_ID and AWAY_TEAM_ID per game
+        team_ratings (pd.Series): Rating per TEAM_ID
+        home_advantage (float): Home edge in log-odds
+
+    Returns:
+        np.ndarray: Home win probability per game
+    """
+
+    ratings = team_ratings.clip(*RATING_CLIP)
+
+    home = schedule_df["HOME_TEAM_ID"].map(ratings).to_numpy(dtype=float)
+    away = schedule_df["AWAY_TEAM_ID"].map(ratings).to_numpy(dtype=float)
+
+    if np.isnan(home).any() or np.isnan(away).any():
+        raise ValueError("Every scheduled team needs a rating")
+
+    log_odds = (
+        np.log(home / (1 - home))
+        - np.log(away / (1 - away))
+        + home_advantage
+    )
+
+    return 1.0 / (1.0 + np.exp(-log_odds))
+
+
+@instrument
+def calibrate_ratings(
+    team_probabilities: pd.Series,
+    played_df: pd.DataFrame,
+    home_advantage: float = HOME_ADVANTAGE_LOGIT,
+) -> pd.Series:
+    """
+    Turns team strength probabilities into per-game ratings for log5.
+
+    Probabilities such as the season model's P(win % >= .500) rank
+    teams well but are far more extreme than the odds of a single
+    game. Their logits are scaled by the inverse temperature whose
+    log5 home-win probabilities best predict the games already played
+    (lowest log loss), then clipped to RATING_CLIP.
+
+    Args:
+        team_probabilities (pd.Series): Probability per TEAM_ID
+        played_df (pd.DataFrame): Game rows already played (the
+            `played` output of season_state_from_games)
+        home_advantage (float): Home edge in log-odds
+
+    Returns:
+        pd.Series: Per-game rating per TEAM_ID
+    """
+
+    probabilities = team_probabilities.clip(1e-9, 1 - 1e-9)
+    logits = np.log(probabilities / (1 - probabilities))
+
+    games = game_pairs(played_df)
+    home = games["HOME_TEAM_ID"].map(logits).to_numpy(dtype=float)
+    away = games["AWAY_TEAM_ID"].map(logits).to_numpy(dtype=float)
+    home_won = games["HOME_WIN"].to_numpy(dtype=float)
+
+    # Log loss of every candidate temperature at once (grid x games)
+    log_odds = np.outer(CALIBRATION_GRID, home - away) + home_advantage
+    log_loss = (
+        np.logaddexp(0.0, log_odds) - home_won * log_odds
+    ).sum(axis=1)
+    beta = CALIBRATION_GRID[int(np.argmin(log_loss))]
+
+    ratings = 1.0 / (1.0 + np.exp(-beta * logits))
+
+    return ratings.clip(*RATING_CLIP)
+
+
+# -----------------------------------
+# Season state from game data
+# -----------------------------------
+def game_pairs(games_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per game from its two team rows: GAME_ID, HOME_TEAM_ID,
+    AWAY_TEAM_ID and HOME_WIN (1 when the home team won).
+    """
+
+    games_df = games_df.assign(home_flag=derive_home_flag(games_df))
+    columns = ["GAME_ID", "TEAM_ID", "RESULT"]
+    home_rows = games_df[games_df["home_flag"] == 1][columns]
+    away_rows = games_df[games_df["home_flag"] == 0][columns[:2]]
+
+    return home_rows.merge(
+        away_rows, on="GAME_ID", suffixes=("_HOME", "_AWAY")
+    ).rename(
+        columns={
+            "TEAM_ID_HOME": "HOME_TEAM_ID",
+            "TEAM_ID_AWAY": "AWAY_TEAM_ID",
+            "RESULT": "HOME_WIN",
+        }
+    ).sort_values("GAME_ID").reset_index(drop=True)
+
+
+@instrument
+def season_state_from_games(
+    df: pd.DataFrame,
+    season: int,
+    games_played_fraction: float = 0.5,
+) -> tuple:
+    """
+    Splits a season's games into current standings and the
+    remaining schedule at a point partway through the season.
+
+    Args:
+        df (pd.DataFrame): Preprocessed game-level data
+        season (int): Season to split
+        games_played_fraction (float): Share of games treated as played
+
+    Returns:
+        standings (pd.DataFrame): TEAM_ID, TEAM_NAME, wins, losses
+        schedule (pd.DataFrame): GAME_ID, HOME_TEAM_ID, AWAY_TEAM_ID
+        played (pd.DataFrame): Game rows treated as already played
+    """
+
+    season_df = df[df["SEASON"] == season]
+
+    game_ids = np.sort(season_df["GAME_ID"].unique())
+    n_played = int(len(game_ids) * games_played_fraction)
+    cutoff = game_ids[n_played - 1] if n_played > 0 else -1
+
+    played = season_df[season_df["GAME_ID"] <= cutoff]
+    remaining = season_df[season_df["GAME_ID"] > cutoff]
+
+    teams = season_df.groupby("TEAM_ID")["TEAM_NAME"].first()
+
+    standings = (
+        played.groupby("TEAM_ID")["RESULT"]
+        .agg(wins="sum", games="count")
+        .reindex(teams.index, fill_value=0)
+    )
+    standings["losses"] = standings["games"] - standings["wins"]
+    standings = standings.drop(columns="games").reset_index()
+    standings.insert(1, "TEAM_NAME", standings["TEAM_ID"].map(teams))
+
+    # One schedule row per remaining game (home vs away)
+    schedule = game_pairs(remaining).drop(columns="HOME_WIN")
+
+    return standings, schedule, played
+
+
+# -----------------------------------
+# Chunk worker
+# -----------------------------------
+def _simulate_chunk(
+    probabilities: np.ndarray,
+    win_delta: np.ndarray,
+    away_games: np.ndarray,
+    base_wins: np.ndarray,
+    group_columns: list,
+    playoff_spots: int,
+    max_wins: int,
+    n_simulations: int,
+    seed: np.random.SeedSequence,
+) -> dict:
+    """
+    Simulates n_simulations seasons with one random matrix.
+
+    win_delta is the (games x teams) matrix home - away incidence,
+    so the remaining wins of every team in every simulation are
+    outcomes @ win_delta + away_games.
+    """
+
+    rng = np.random.default_rng(seed)
+    n_teams = len(base_wins)
+
+    outcomes = rng.random((n_simulations, len(probabilities)), dtype=np.float32)
+    home_wins = (outcomes < probabilities).astype(np.float32)
+
+    wins = base_wins + away_games + (home_wins @ win_delta)
+    wins = np.rint(wins).astype(np.int64)
+
+    # -----------------------------------
+    # Win-total histogram per team
+    # -----------------------------------
+    offsets = np.arange(n_teams) * (max_wins + 1)
+    win_hist = np.bincount(
+        (wins + offsets).ravel(), minlength=n_teams * (max_wins + 1)
+    ).reshape(n_teams, max_wins + 1)
+
+    # -----------------------------------
+    # Seeding within each group, random tiebreaks
+    # -----------------------------------
+    sort_key = wins + rng.random(wins.shape)
+
+    max_seeds = max(len(cols) for cols in group_columns)
+    seed_hist = np.zeros((n_teams, max_seeds), dtype=np.int64)
+    rows = np.arange(n_simulations)[:, None]
+
+    for cols in group_columns:
+        cols = np.asarray(cols)
+        order = np.argsort(-sort_key[:, cols], axis=1)
+
+        ranks = np.empty_like(order)
+        ranks[rows, order] = np.arange(len(cols))
+
+        team_offsets = cols * max_seeds
+        seed_hist += np.bincount(
+            (ranks + team_offsets).ravel(), minlength=n_teams * max_seeds
+        ).reshape(n_teams, max_seeds)
+
+    return {
+        "simulations": n_simulations,
+        "win_hist": win_hist,
+        "seed_hist": seed_hist,
+        "playoff_spots": playoff_spots,
+    }
+
+
+# -----------------------------------
+# Result summary
+# -----------------------------------
+def _summarize(totals: dict, standings_df: pd.DataFrame) -> dict:
+    n = totals["simulations"]
+    spots = totals["playoff_spots"]
+
+    win_probs = totals["win_hist"] / n
+    seed_probs = totals["seed_hist"] / n
+
+    win_values = np.arange(win_probs.shape[1])
+
+    odds = standings_df[["TEAM_ID", "TEAM_NAME", "wins", "losses"]]
+    odds["expected_wins"] = win_probs @ win_values
+    odds["playoff_prob"] = seed_probs[:, :spots].sum(axis=1)
+    odds["top_seed_prob"] = seed_probs[:, 0]
+    odds = odds.sort_values(
+        "expected_wins", ascending=False
+    ).reset_index(drop=True)
+
+    seed_distribution = pd.DataFrame(
+        seed_probs,
+        index=standings_df["TEAM_NAME"],
+        columns=[f"seed_{i + 1}" for i in range(seed_probs.shape[1])],
+    )
+
+    first_win = int(np.flatnonzero(win_probs.sum(axis=0))[0])
+    win_distribution = pd.DataFrame(
+        win_probs[:, first_win:],
+        index=standings_df["TEAM_NAME"],
+        columns=win_values[first_win:],
+    )
+
+    return {
+        "simulations": n,
+        "odds": odds,
+        "seed_distribution": seed_distribution,
+        "win_distribution": win_distribution,
+    }
+
+
+# -----------------------------------
+# Monte Carlo season simulation
+# -----------------------------------
+def iter_simulate_season(
+    standings_df: pd.DataFrame,
+    schedule_df: pd.DataFrame,
+    team_ratings: pd.Series = None,
+    n_simulations: int = DEFAULT_SIMULATIONS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    playoff_spots: int = None,
+    home_advantage: float = HOME_ADVANTAGE_LOGIT,
+    max_workers: int = None,
+    random_state: int = 42,
+):
+    """
+    Simulates the remainder of a season many times, yielding the
+    cumulative results after every finished chunk so callers can
+    display converging odds.
+
+    Game probabilities come from a `home_win_prob` column on the
+    schedule when present, otherwise from team_ratings via log5.
+    Chunks are independent random streams run in a process pool.
+
+    Args:
+        standings_df (pd.DataFrame): TEAM_ID, TEAM_NAME, wins, losses
+            and optionally conference
+        schedule_df (pd.DataFrame): HOME_TEAM_ID, AWAY_TEAM_ID and
+            optionally home_win_prob
+        team_ratings (pd.Series): Rating per TEAM_ID
+        n_simulations (int): Total simulated seasons
+        chunk_size (int): Simulated seasons per random matrix
+        playoff_spots (int): Playoff teams per conference (or league)
+        home_advantage (float): Home edge in log-odds
+        max_workers (int): Process pool size; 1 runs inline
+        random_state (int): Seed for reproducible results
+
+    Yields:
+        dict: simulations, odds, seed_distribution, win_distribution
+    """
+
+    standings_df = standings_df.reset_index(drop=True)
+    team_index = pd.Series(
+        np.arange(len(standings_df)), index=standings_df["TEAM_ID"]
+    )
+
+    if "home_win_prob" in schedule_df.columns:
+        probabilities = schedule_df["home_win_prob"].to_numpy(dtype=float)
+    elif team_ratings is not None:
+        probabilities = game_win_probabilities(
+            schedule_df, team_ratings, home_advantage
+        )
+    else:
+        raise ValueError(
+            "Provide team_ratings or a home_win_prob schedule column"
+        )
+
+    home_idx = schedule_df["HOME_TEAM_ID"].map(team_index).to_numpy()
+    away_idx = schedule_df["AWAY_TEAM_ID"].map(team_index).to_numpy()
+
+    n_teams = len(standings_df)
+    n_games = len(schedule_df)
+
+    win_delta = np.zeros((n_games, n_teams), dtype=np.float32)
+    win_delta[np.arange(n_games), home_idx] += 1
+    win_delta[np.arange(n_games), away_idx] -= 1
+
+    away_games = np.bincount(away_idx, minlength=n_teams).astype(np.float32)
+    base_wins = standings_df["wins"].to_numpy(dtype=np.float32)
+
+    remaining_games = np.bincount(home_idx, minlength=n_teams) + away_games
+    max_wins = int((base_wins + remaining_games).max())
+
+    # -----------------------------------
+    # Seeding groups (conferences or whole league)
+    # -----------------------------------
+    if "conference" in standings_df.columns:
+        group_columns = [
+            idx.tolist()
+            for _, idx in standings_df.groupby("conference").indices.items()
+        ]
+        spots = playoff_spots or PLAYOFF_SPOTS_PER_CONFERENCE
+    else:
+        group_columns = [list(range(n_teams))]
+        spots = playoff_spots or PLAYOFF_SPOTS_LEAGUE
+
+    chunk_sizes = [chunk_size] * (n_simulations // chunk_size)
+    if n_simulations % chunk_size:
+        chunk_sizes.append(n_simulations % chunk_size)
+
+    seeds = np.random.SeedSequence(random_state).spawn(len(chunk_sizes))
+
+    chunk_args = [
+        (
+            probabilities.astype(np.float32),
+            win_delta,
+            away_games,
+            base_wins,
+            group_columns,
+            spots,
+            max_wins,
+            size,
+            seed,
+        )
+        for size, seed in zip(chunk_sizes, seeds)
+    ]
+
+    totals = None
+
+    def accumulate(result: dict) -> dict:
+        nonlocal totals
+        if totals is None:
+            totals = result
+        else:
+            totals = {
+                "simulations": totals["simulations"] + result["simulations"],
+                "win_hist": totals["win_hist"] + result["win_hist"],
+                "seed_hist": totals["seed_hist"] + result["seed_hist"],
+                "playoff_spots": spots,
+            }
+        return _summarize(totals, standings_df)
+
+    if max_workers == 1:
+        for args in chunk_args:
+            yield accumulate(_simulate_chunk(*args))
+        return
+
+    workers = min(max_workers or os.cpu_count() or 1, len(chunk_args))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_simulate_chunk, *args) for args in chunk_args]
+        for future in as_completed(futures):
+            yield accumulate(future.result())
+
+
+@instrument
+def simulate_season(
+    standings_df: pd.DataFrame,
+    schedule_df: pd.DataFrame,
+    team_ratings: pd.Series = None,
+    **kwargs,
+) -> dict:
+    """
+    Runs iter_simulate_season to completion and returns the final
+    result. Accepts the same keyword arguments.
+    """
+
+    result = None
+    for result in iter_simulate_season(
+        standings_df, schedule_df, team_ratings, **kwargs
+    ):
+        pass
+
+    return result
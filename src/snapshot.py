@@ -0,0 +1,349 @@
+"""
+Precomputed artifact snapshots.
+
+`build` runs the whole src/ pipeline once and writes every derived
+table and fitted model the pages need into a versioned directory
+with a manifest. Setting NBA_DASHBOARD_SNAPSHOT makes the dashboard
+read-only: pages load from the snapshot and never read the raw CSV
+or train a model.
+
+Usage:
+    python -m src.snapshot build [--dataset wnba]
+    NBA_DASHBOARD_SNAPSHOT=latest streamlit run app.py
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import joblib
+import pandas as pd
+import streamlit as st
+
+from src.datasets import DEFAULT_DATASET, read_file_cached
+from src.instrumentation import instrument
+
+
+# -----------------------------------
+# Snapshot configuration
+# -----------------------------------
+SNAPSHOT_ROOT = Path("artifacts/snapshots")
+
+# Snapshot directory, or "latest" for the most recent build
+SNAPSHOT_ENV_VAR = "NBA_DASHBOARD_SNAPSHOT"
+
+LATEST_POINTER = "LATEST"
+MANIFEST_FILE = "manifest.json"
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+# -----------------------------------
+# Read-only mode
+# -----------------------------------
+def active_snapshot_dir() -> Path:
+    """
+    Returns the snapshot directory selected by NBA_DASHBOARD_SNAPSHOT,
+    or None when the dashboard runs live.
+    """
+
+    value = os.environ.get(SNAPSHOT_ENV_VAR, "").strip()
+    if not value:
+        return None
+
+    if value == "latest":
+        version = read_file_cached(SNAPSHOT_ROOT / LATEST_POINTER, str.strip)
+        if version is None:
+            raise FileNotFoundError(
+                f"No snapshot has been built under {SNAPSHOT_ROOT.resolve()}"
+            )
+        return SNAPSHOT_ROOT / version
+
+    return Path(value)
+
+
+def is_read_only() -> bool:
+    return active_snapshot_dir() is not None
+
+
+def snapshot_dataset(snapshot_dir: Path) -> str:
+    """
+    Returns the key of the dataset a snapshot was built from.
+    """
+
+    return read_manifest(snapshot_dir).get("dataset", DEFAULT_DATASET)
+
+
+# -----------------------------------
+# Build
+# -----------------------------------
+@instrument
+def build_snapshot(
+    df_raw: pd.DataFrame,
+    root: Path = SNAPSHOT_ROOT,
+    dataset_key: str = DEFAULT_DATASET,
+) -> Path:
+    """
+    Materializes every derived table and model into a new snapshot.
+
+    The snapshot is written to a temporary directory and renamed
+    into place, so readers never see a partial build.
+
+    Args:
+        df_raw (pd.DataFrame): Raw dataset (output of load_data)
+        root (Path): Directory holding snapshot versions
+        dataset_key (str): Registered key of the dataset, recorded in
+            the manifest
+
+    Returns:
+        Path: The new snapshot directory
+    """
+
+    from src.preprocessing import preprocess_data
+    from src.metrics import (
+        aggregate_team_season_metrics,
+        aggregate_league_season_metrics,
+        compute_league_ranks,
+    )
+    from src.classification import classify_team_strength
+    from src.insights import calculate_win_correlations
+    from src.game_model import build_pregame_features, train_game_win_model
+    from src.model import (
+        train_win_prediction_model,
+        training_seasons_before,
+    )
+    from src.evaluation import walk_forward_evaluation
+    from src.model_registry import fingerprint_frame
+    from src.numpy_scorer import export_numpy_scorer
+
+    df_clean = preprocess_data(df_raw)
+    team_season_df = aggregate_team_season_metrics(df_clean)
+    game_features_df = build_pregame_features(df_clean)
+
+    tables = {
+        "games_clean": df_clean,
+        "team_season": team_season_df,
+        "league_season": aggregate_league_season_metrics(team_season_df),
+        "classified": classify_team_strength(team_season_df),
+        "league_ranks": compute_league_ranks(team_season_df),
+        "correlations": calculate_win_correlations(team_season_df),
+        "game_features": game_features_df,
+        "walk_forward": walk_forward_evaluation(team_season_df),
+    }
+
+    models = {
+        "win_model": train_win_prediction_model(team_season_df),
+        "game_model": train_game_win_model(game_features_df),
+    }
+
+    # The season simulator scores each season with a model that has
+    # not seen its results
+    for season in sorted(team_season_df["SEASON"].unique()):
+        prior = training_seasons_before(team_season_df, season)
+        if prior is not None:
+            models[f"win_model_before_{int(season)}"] = (
+                train_win_prediction_model(prior)
+            )
+
+    data_fingerprint = fingerprint_frame(df_raw)
+    created_at = datetime.now(timezone.utc)
+    version = f"{created_at:%Y%m%dT%H%M%SZ}-{data_fingerprint[:12]}"
+
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=root, prefix=f".{version}."))
+
+    try:
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "version": version,
+            "dataset": dataset_key,
+            "created_at": created_at.isoformat(),
+            "source_fingerprint": data_fingerprint,
+            "source_rows": len(df_raw),
+            "tables": {},
+            "models": {},
+        }
+
+        for name, table in tables.items():
+            file_name = f"{name}.parquet"
+            table.to_parquet(staging / file_name, index=False)
+            manifest["tables"][name] = {
+                "file": file_name,
+                "rows": len(table),
+                "columns": [str(col) for col in table.columns],
+            }
+
+        for name, model_output in models.items():
+            file_name = f"{name}.joblib"
+            joblib.dump(model_output, staging / file_name)
+            scorer_name = f"{name}.npz"
+            export_numpy_scorer(model_output, staging / scorer_name)
+            manifest["models"][name] = {
+                "file": file_name,
+                "scorer": scorer_name,
+                "accuracy": float(model_output["accuracy"]),
+                "feature_names": list(model_output["feature_names"]),
+            }
+
+        (staging / MANIFEST_FILE).write_text(json.dumps(manifest, indent=1))
+
+        target = root / version
+        os.replace(staging, target)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    pointer_tmp = root / f".{LATEST_POINTER}.tmp"
+    pointer_tmp.write_text(version)
+    os.replace(pointer_tmp, root / LATEST_POINTER)
+
+    return target
+
+
+# -----------------------------------
+# Load
+# -----------------------------------
+def read_manifest(snapshot_dir: Path) -> dict:
+    """
+    Returns a snapshot's manifest, parsed once per manifest file.
+    """
+
+    path = Path(snapshot_dir) / MANIFEST_FILE
+    manifest = read_file_cached(path, json.loads)
+    if manifest is None:
+        raise FileNotFoundError(f"Snapshot manifest not found: {path}")
+
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot format: {manifest.get('format_version')}"
+        )
+
+    return manifest
+
+
+@instrument
+def load_snapshot_table(snapshot_dir: str, name: str) -> pd.DataFrame:
+    """
+    Loads one derived table from a snapshot.
+
+    Every call reads the file; src.pipeline keeps the loaded tables in
+    the shared dataset cache.
+
+    Args:
+        snapshot_dir (str): Snapshot directory
+        name (str): Table name from the manifest
+
+    Returns:
+        pd.DataFrame: Stored table
+    """
+
+    manifest = read_manifest(snapshot_dir)
+
+    if name not in manifest["tables"]:
+        raise KeyError(f"Snapshot has no table named '{name}'")
+
+    return pd.read_parquet(
+        Path(snapshot_dir) / manifest["tables"][name]["file"]
+    )
+
+
+@instrument
+@st.cache_resource(show_spinner="Loading model...")
+def load_snapshot_model(snapshot_dir: str, name: str) -> dict:
+    """
+    Loads one fitted model output from a snapshot.
+
+    Args:
+        snapshot_dir (str): Snapshot directory
+        name (str): Model name from the manifest
+
+    Returns:
+        dict: Model output as produced at build time
+    """
+
+    manifest = read_manifest(snapshot_dir)
+
+    if name not in manifest["models"]:
+        raise KeyError(f"Snapshot has no model named '{name}'")
+
+    return joblib.load(Path(snapshot_dir) / manifest["models"][name]["file"])
+
+
+@instrument
+@st.cache_resource(show_spinner="Loading model...")
+def load_snapshot_scorer(snapshot_dir: str, name: str):
+    """
+    Loads the NumpyWinScorer of one snapshot model.
+
+    Only the exported .npz is read, so scikit-learn is never imported.
+    Snapshots built before scorers were stored fall back to exporting
+    it from the pickled pipeline.
+
+    Args:
+        snapshot_dir (str): Snapshot directory
+        name (str): Model name from the manifest
+
+    Returns:
+        NumpyWinScorer: Scorer with the model's scalar metrics
+    """
+
+    from src.numpy_scorer import NumpyWinScorer
+
+    manifest = read_manifest(snapshot_dir)
+
+    if name not in manifest["models"]:
+        raise KeyError(f"Snapshot has no model named '{name}'")
+
+    scorer_file = manifest["models"][name].get("scorer")
+    if scorer_file is None:
+        return NumpyWinScorer.from_model_output(
+            load_snapshot_model(snapshot_dir, name)
+        )
+
+    return NumpyWinScorer.load(Path(snapshot_dir) / scorer_file)
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build a precomputed dashboard snapshot."
+    )
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=SNAPSHOT_ROOT,
+        help=f"snapshot root directory (default: {SNAPSHOT_ROOT})",
+    )
+    parser.add_argument(
+        "--dataset",
+        default=DEFAULT_DATASET,
+        help=f"registered dataset key (default: {DEFAULT_DATASET})",
+    )
+    args = parser.parse_args(argv)
+
+    from src.data_loader import load_data
+
+    target = build_snapshot(
+        load_data(args.dataset), root=args.root, dataset_key=args.dataset
+    )
+    manifest = read_manifest(target)
+
+    for name, info in manifest["tables"].items():
+        print(f"  {name:<15} {info['rows']:>10,} rows")
+
+    print(f"snapshot {manifest['version']} -> {target}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
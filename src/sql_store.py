@@ -0,0 +1,234 @@
+"""
+Indexed SQLite storage of the derived tables.
+
+With NBA_DASHBOARD_BACKEND=sqlite the cleaned games, team-season
+metrics and classified team-seasons are written once per dataset
+version to a local SQLite file, indexed on SEASON, TEAM_ID, TEAM_NAME
+and GAME_ID. The season and team filters of the pages are then pushed
+down as SQL, so only the matching rows are read into pandas.
+
+Query results are identical to filtering the pandas frames: column
+dtypes are recorded when the database is built and restored on read,
+and the original row labels come back as the index.
+"""
+
+import hashlib
+import os
+import sqlite3
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from src.instrumentation import instrument
+
+
+# -----------------------------------
+# Backend configuration
+# -----------------------------------
+BACKEND_ENV_VAR = "NBA_DASHBOARD_BACKEND"
+
+SQL_DIR = Path("artifacts/sqlite")
+
+# Holds the frame index so results keep their original row labels
+ROW_COLUMN = "_row"
+DTYPES_TABLE = "_dtypes"
+
+# Column sets to index, per table, when present
+TABLE_INDEXES = [
+    ("SEASON",),
+    ("TEAM_ID",),
+    ("TEAM_NAME",),
+    ("GAME_ID",),
+    ("TEAM_ID", "SEASON"),
+]
+
+
+def sql_backend_enabled() -> bool:
+    value = os.environ.get(BACKEND_ENV_VAR, "").strip().lower()
+    if value not in ("", "pandas", "sqlite"):
+        raise ValueError(
+            f"{BACKEND_ENV_VAR} must be 'pandas' or 'sqlite', got '{value}'"
+        )
+    return value == "sqlite"
+
+
+def database_path(dataset_key: str, fingerprint: str) -> Path:
+    """
+    Database file of one dataset version.
+    """
+
+    version = hashlib.sha1(fingerprint.encode()).hexdigest()[:12]
+    return SQL_DIR / f"{dataset_key}-{version}.sqlite"
+
+
+# -----------------------------------
+# Build
+# -----------------------------------
+@instrument
+def build_database(path: Path, tables: dict) -> Path:
+    """
+    Writes frames to an indexed SQLite database.
+
+    The file is written next to its final path and renamed into place,
+    so readers never see a partial database.
+
+    Args:
+        path (Path): Database file to create
+        tables (dict): Table name -> DataFrame
+
+    Returns:
+        Path: The database file
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute(
+            f"CREATE TABLE {DTYPES_TABLE} "
+            "(table_name TEXT, column_name TEXT, dtype TEXT)"
+        )
+
+        for name, df in tables.items():
+            df.to_sql(
+                name,
+                conn,
+                index=True,
+                index_label=ROW_COLUMN,
+                chunksize=50_000,
+            )
+            conn.executemany(
+                f"INSERT INTO {DTYPES_TABLE} VALUES (?, ?, ?)",
+                [(name, col, str(dtype)) for col, dtype in df.dtypes.items()],
+            )
+
+            for columns in TABLE_INDEXES:
+                if not set(columns) <= set(df.columns):
+                    continue
+                conn.execute(
+                    f"CREATE INDEX idx_{name}_{'_'.join(columns)} "
+                    f"ON {name} ({', '.join(columns)})"
+                )
+
+        conn.commit()
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    tmp_path.replace(path)
+    return path
+
+
+# -----------------------------------
+# Queries
+# -----------------------------------
+FILTER_COLUMNS = ("SEASON", "TEAM_ID", "TEAM_NAME")
+
+
+def filter_frame(
+    df: pd.DataFrame,
+    seasons: list = None,
+    team_ids: list = None,
+    team_names: list = None,
+) -> pd.DataFrame:
+    """
+    The pandas equivalent of query_table, for frames held in memory.
+    """
+
+    for column, values in zip(FILTER_COLUMNS, (seasons, team_ids, team_names)):
+        if values is not None:
+            df = df[df[column].isin(values)]
+    return df
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+@lru_cache(maxsize=64)
+def _table_dtypes(path: str, table: str) -> dict:
+    # Database files are immutable once built, so this never goes stale
+    with closing(_connect(path)) as conn:
+        return dict(
+            conn.execute(
+                f"SELECT column_name, dtype FROM {DTYPES_TABLE} "
+                "WHERE table_name = ?",
+                (table,),
+            ).fetchall()
+        )
+
+
+def _in_clause(column: str, values) -> tuple:
+    values = list(values)
+    placeholders = ", ".join("?" * len(values))
+    return f"{column} IN ({placeholders})", values
+
+
+def _plain(value):
+    # sqlite3 binds Python scalars only, not numpy ones
+    return value.item() if hasattr(value, "item") else value
+
+
+@instrument
+def query_table(
+    path: Path,
+    table: str,
+    seasons: list = None,
+    team_ids: list = None,
+    team_names: list = None,
+) -> pd.DataFrame:
+    """
+    Reads the rows of a table matching the given filters.
+
+    Args:
+        path (Path): Database built by build_database
+        table (str): Table name
+        seasons (list): Seasons to keep (None keeps all)
+        team_ids (list): TEAM_IDs to keep (None keeps all)
+        team_names (list): TEAM_NAMEs to keep (None keeps all)
+
+    Returns:
+        pd.DataFrame: Matching rows in their original order, with the
+        original dtypes and row labels
+    """
+
+    clauses = []
+    params = []
+    for column, values in zip(FILTER_COLUMNS, (seasons, team_ids, team_names)):
+        if values is None:
+            continue
+        clause, values = _in_clause(column, map(_plain, values))
+        clauses.append(clause)
+        params += values
+
+    sql = f"SELECT * FROM {table}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += f" ORDER BY {ROW_COLUMN}"
+
+    with closing(_connect(path)) as conn:
+        df = pd.read_sql_query(sql, conn, params=params, index_col=ROW_COLUMN)
+
+    df.index = df.index.astype("int64")
+    df.index.name = None
+
+    return df.astype(_table_dtypes(str(path), table))
+
+
+@instrument
+def distinct_values(path: Path, table: str, column: str) -> list:
+    """
+    Sorted distinct values of a column, answered from its index.
+    """
+
+    with closing(_connect(path)) as conn:
+        rows = conn.execute(
+            f"SELECT DISTINCT {column} FROM {table} ORDER BY {column}"
+        ).fetchall()
+
+    return [value for value, in rows]
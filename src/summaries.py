@@ -1,5 +1,7 @@
 import pandas as pd
 
+from src.instrumentation import instrument
+
 
 # -----------------------------------
 # Utility helpers
@@ -19,6 +21,7 @@ def _format_number(value: float, decimals: int = 2) -> str:
 # -----------------------------------
 # League Overview Summary
 # -----------------------------------
+@instrument
 def league_overview_summary(league_df: pd.DataFrame) -> str:
     """
     Generates summary for League Overview page.
@@ -46,6 +49,7 @@ def league_overview_summary(league_df: pd.DataFrame) -> str:
 # -----------------------------------
 # Team Performance Summary
 # -----------------------------------
+@instrument
 def team_performance_summary(team_df: pd.DataFrame) -> str:
     """
     Generates summary for Team Performance Deep-Dive page.
@@ -69,6 +73,7 @@ def team_performance_summary(team_df: pd.DataFrame) -> str:
 # -----------------------------------
 # What Wins Games Summary ⭐
 # -----------------------------------
+@instrument
 def insight_summary(drivers: dict) -> str:
     """
     Generates summary for What Wins Games page.
@@ -109,6 +114,7 @@ def insight_summary(drivers: dict) -> str:
 # -----------------------------------
 # Team Strength Classification Summary
 # -----------------------------------
+@instrument
 def team_strength_summary(classified_df: pd.DataFrame) -> str:
     """
     Generates summary for Team Strength Classification page.
@@ -132,6 +138,7 @@ def team_strength_summary(classified_df: pd.DataFrame) -> str:
 # -----------------------------------
 # Win Prediction Summary (Dynamic)
 # -----------------------------------
+@instrument
 def win_prediction_summary_v2(
     team_name: str,
     probability: float,
@@ -163,3 +170,58 @@ def win_prediction_summary_v2(
     )
 
     return summary
+
+
+# -----------------------------------
+# League context (ranks within a season)
+# -----------------------------------
+def _ordinal(n: int) -> str:
+    if 10 <= n % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def _metric_label(metric: str) -> str:
+    from src.metric_definitions import METRIC_DEFINITIONS
+
+    definition = METRIC_DEFINITIONS.get(metric)
+    return definition.split(":")[0] if definition else metric
+
+
+def league_rank_text(ranks_row: pd.Series, metric: str) -> str:
+    """
+    Formats a team-season's league rank in a metric, e.g. "3rd of 30".
+    """
+
+    rank = ranks_row[f"{metric}_rank"]
+    if pd.isna(rank):
+        return "Not ranked"
+    return f"{_ordinal(int(rank))} of {int(ranks_row['league_size'])}"
+
+
+@instrument
+def league_context_table(
+    team_row: pd.Series,
+    ranks_row: pd.Series,
+    metrics: list,
+) -> pd.DataFrame:
+    """
+    Tabulates a team-season's value, league rank, percentile and
+    z-score for each metric.
+    """
+
+    return pd.DataFrame(
+        {
+            "Metric": [_metric_label(metric) for metric in metrics],
+            "Value": [team_row[metric] for metric in metrics],
+            "League Rank": [
+                league_rank_text(ranks_row, metric) for metric in metrics
+            ],
+            "Percentile": [
+                ranks_row[f"{metric}_percentile"] for metric in metrics
+            ],
+            "Z-Score": [ranks_row[f"{metric}_zscore"] for metric in metrics],
+        }
+    )
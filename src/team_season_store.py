@@ -0,0 +1,172 @@
+"""
+Indexed team-season lookups.
+
+Pages look up one team's seasons, one team-season row and the season
+before it. Boolean masks over the whole team-season frame make each of
+those a full scan; TeamSeasonStore indexes the frame once by
+(TEAM_ID, SEASON) so they become dictionary lookups, slices and
+binary searches.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------
+# Store
+# -----------------------------------
+def container_bytes(container) -> int:
+    # Shallow sizes of the container, its items and the items' members
+    # (keys and values here are scalars or tuples of scalars)
+    items = container.items() if isinstance(container, dict) else container
+    usage = sys.getsizeof(container)
+    for item in items:
+        for value in item if isinstance(item, tuple) else (item,):
+            usage += sys.getsizeof(value)
+            if isinstance(value, tuple):
+                usage += sum(sys.getsizeof(member) for member in value)
+    return usage
+
+
+class TeamSeasonStore:
+    """
+    Team-season rows keyed by (TEAM_ID, SEASON).
+
+    Row positions are kept sorted by team, then season, so each team's
+    seasons form one sorted slice:
+
+    - team_id, team_frame, seasons, latest_season: O(1) lookups and
+      slices (team_frame copies only the team's rows)
+    - row, rows: O(1) dictionary lookup of the row position
+    - previous_season, next_season: O(log n) binary search
+
+    Returned frames keep the original row labels, exactly like
+    filtering the frame with a boolean mask.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        team_ids = df["TEAM_ID"].to_numpy()
+        seasons = df["SEASON"].to_numpy()
+
+        order = np.lexsort((seasons, team_ids))
+        sorted_ids = team_ids[order]
+
+        self.frame = df
+        self._order = order
+        self._seasons = seasons[order]
+        self._seasons.setflags(write=False)
+
+        ids, starts = np.unique(sorted_ids, return_index=True)
+        stops = np.append(starts[1:], len(order))
+        self._slices = {
+            team_id: (start, stop)
+            for team_id, start, stop in zip(
+                ids.tolist(), starts.tolist(), stops.tolist()
+            )
+        }
+
+        self._positions = dict(
+            zip(
+                zip(sorted_ids.tolist(), self._seasons.tolist()),
+                order.tolist(),
+            )
+        )
+        if len(self._positions) != len(df):
+            raise ValueError(
+                "Team-season frame has duplicate (TEAM_ID, SEASON) rows"
+            )
+
+        # Team names are unique per TEAM_ID in the team-season table
+        names = df["TEAM_NAME"].to_numpy()[order]
+        self._ids_by_name = dict(zip(names.tolist(), sorted_ids.tolist()))
+        self._team_names = sorted(self._ids_by_name)
+
+    # -----------------------------------
+    # Teams
+    # -----------------------------------
+    def team_names(self) -> list:
+        return list(self._team_names)
+
+    def team_id(self, team_name: str) -> int:
+        if team_name not in self._ids_by_name:
+            raise ValueError(f"Unknown team '{team_name}'")
+        return self._ids_by_name[team_name]
+
+    def _slice(self, team_id: int) -> tuple:
+        team_slice = self._slices.get(int(team_id))
+        if team_slice is None:
+            raise ValueError(f"Unknown team id {team_id}")
+        return team_slice
+
+    def team_frame(self, team_id: int) -> pd.DataFrame:
+        """
+        The team's rows in ascending season order.
+        """
+
+        start, stop = self._slice(team_id)
+        return self.frame.iloc[self._order[start:stop]]
+
+    # -----------------------------------
+    # Seasons
+    # -----------------------------------
+    def seasons(self, team_id: int) -> np.ndarray:
+        """
+        The team's seasons in ascending order (a read-only view).
+        """
+
+        start, stop = self._slice(team_id)
+        return self._seasons[start:stop]
+
+    def latest_season(self, team_id: int) -> int:
+        return int(self.seasons(team_id)[-1])
+
+    def previous_season(self, team_id: int, season: int):
+        """
+        The team's last season before `season`, or None.
+        """
+
+        seasons = self.seasons(team_id)
+        i = np.searchsorted(seasons, season, side="left")
+        return int(seasons[i - 1]) if i > 0 else None
+
+    def next_season(self, team_id: int, season: int):
+        """
+        The team's first season after `season`, or None.
+        """
+
+        seasons = self.seasons(team_id)
+        i = np.searchsorted(seasons, season, side="right")
+        return int(seasons[i]) if i < len(seasons) else None
+
+    # -----------------------------------
+    # Rows
+    # -----------------------------------
+    def _position(self, team_id: int, season: int) -> int:
+        position = self._positions.get((int(team_id), int(season)))
+        if position is None:
+            raise ValueError(f"No row for team {team_id} in season {season}")
+        return position
+
+    def row(self, team_id: int, season: int) -> pd.Series:
+        return self.frame.iloc[self._position(team_id, season)]
+
+    def rows(self, team_id: int, season: int) -> pd.DataFrame:
+        """
+        The team-season as a one-row frame.
+        """
+
+        return self.frame.iloc[[self._position(team_id, season)]]
+
+    def memory_usage(self, index: bool = True, deep: bool = True) -> int:
+        """
+        Approximate bytes held by the index, so the dataset cache can
+        size the store. The frame itself is not counted: it is the
+        cached team-season table, which the cache already sizes.
+        """
+
+        usage = self._order.nbytes + self._seasons.nbytes
+        for lookup in (self._slices, self._positions, self._ids_by_name):
+            usage += container_bytes(lookup)
+        return usage + container_bytes(self._team_names)
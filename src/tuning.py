@@ -0,0 +1,380 @@
+"""
+Cached hyperparameter search for the win prediction model.
+
+Usage:
+    python -m src.tuning [--penalties l2] [--workers 4] [--top 10]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.lazy import lazy_import
+from src.model import (
+    FEATURE_COLUMNS,
+    TARGET_COLUMN,
+    prepare_model_data,
+)
+from src.model_registry import SKLEARN_VERSION, fingerprint_frame
+from src.instrumentation import instrument
+
+# scikit-learn loads on first use, like src/model.py
+exceptions = lazy_import("sklearn.exceptions")
+linear_model = lazy_import("sklearn.linear_model")
+metrics = lazy_import("sklearn.metrics")
+model_selection = lazy_import("sklearn.model_selection")
+preprocessing = lazy_import("sklearn.preprocessing")
+
+
+# -----------------------------------
+# Search configuration
+# -----------------------------------
+LEADERBOARD_DIR = Path("artifacts/tuning")
+
+DEFAULT_C_GRID = [0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0]
+DEFAULT_PENALTIES = ["l2", "l1"]
+
+LEADERBOARD_COLUMNS = [
+    "candidate",
+    "penalty",
+    "C",
+    "n_features",
+    "features",
+    "accuracy",
+    "log_loss",
+]
+
+# sklearn 1.8 replaced `penalty` with `l1_ratio`
+_USES_L1_RATIO = tuple(
+    int(part) for part in SKLEARN_VERSION.split(".")[:2]
+) >= (1, 8)
+
+
+# -----------------------------------
+# Candidate helpers
+# -----------------------------------
+def default_feature_subsets() -> list:
+    """
+    Full feature set plus every leave-one-out subset of FEATURE_COLUMNS.
+    """
+
+    subsets = [list(FEATURE_COLUMNS)]
+    for dropped in FEATURE_COLUMNS:
+        subsets.append([col for col in FEATURE_COLUMNS if col != dropped])
+    return subsets
+
+
+def candidate_key(penalty: str, C: float, features: list) -> str:
+    return f"{penalty}|C={C:.6g}|{','.join(features)}"
+
+
+def _estimator_params(penalty: str) -> dict:
+    if penalty not in ("l1", "l2"):
+        raise ValueError(f"Unsupported penalty: {penalty}")
+
+    # lbfgs is fastest for L2; saga is the warm-startable L1 solver
+    params = {
+        "solver": "saga" if penalty == "l1" else "lbfgs",
+        "max_iter": 5000,
+        "warm_start": True,
+    }
+
+    if _USES_L1_RATIO:
+        params["l1_ratio"] = 1.0 if penalty == "l1" else 0.0
+    else:
+        params["penalty"] = penalty
+
+    return params
+
+
+# -----------------------------------
+# Regularization path worker
+# -----------------------------------
+def _fit_path(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    penalty: str,
+    features: list,
+    column_idx: list,
+    Cs: list,
+) -> list:
+    """
+    Fits one (penalty, feature subset) group along increasing C,
+    warm-starting each fit from the previous solution.
+    """
+
+    X_train = X_train[:, column_idx]
+    X_test = X_test[:, column_idx]
+
+    model = linear_model.LogisticRegression(**_estimator_params(penalty))
+
+    records = []
+    for C in sorted(Cs):
+        model.set_params(C=C)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", exceptions.ConvergenceWarning)
+            model.fit(X_train, y_train)
+
+        y_prob = model.predict_proba(X_test)[:, 1]
+
+        records.append(
+            {
+                "candidate": candidate_key(penalty, C, features),
+                "penalty": penalty,
+                "C": float(C),
+                "n_features": len(features),
+                "features": ",".join(features),
+                "accuracy": metrics.accuracy_score(
+                    y_test, (y_prob >= 0.5).astype(int)
+                ),
+                "log_loss": metrics.log_loss(y_test, y_prob, labels=[0, 1]),
+            }
+        )
+
+    return records
+
+
+# -----------------------------------
+# Leaderboard storage
+# -----------------------------------
+def _leaderboard_path(
+    team_season_df: pd.DataFrame,
+    test_size: float,
+    random_state: int,
+    leaderboard_dir: Path,
+) -> Path:
+    payload = {
+        "data": fingerprint_frame(
+            team_season_df, FEATURE_COLUMNS + [TARGET_COLUMN]
+        ),
+        "test_size": test_size,
+        "random_state": random_state,
+        "sklearn_version": SKLEARN_VERSION,
+    }
+    key = hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode()
+    ).hexdigest()
+
+    return Path(leaderboard_dir) / f"{key}.json"
+
+
+def _read_leaderboard(path: Path) -> list:
+    if not path.exists():
+        return []
+
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []
+
+
+def _write_leaderboard(records: list, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(records, f, indent=1)
+    os.replace(tmp_name, path)
+
+
+# -----------------------------------
+# Hyperparameter search
+# -----------------------------------
+@instrument
+def run_hyperparameter_search(
+    team_season_df: pd.DataFrame,
+    Cs: list = None,
+    penalties: list = None,
+    feature_subsets: list = None,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    max_workers: int = None,
+    leaderboard_dir: Path = LEADERBOARD_DIR,
+) -> pd.DataFrame:
+    """
+    Searches regularization strength, penalty and feature subsets
+    for the win prediction model.
+
+    Candidates are scored on the same stratified hold-out split as
+    train_win_prediction_model. Each (penalty, subset) group runs in
+    a worker process along its C path with warm starts. Results are
+    merged into an on-disk leaderboard keyed by the data fingerprint,
+    so candidates already on the leaderboard are not re-evaluated.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        Cs (list): Inverse regularization strengths
+        penalties (list): Any of "l1" and "l2"
+        feature_subsets (list): Lists of columns from FEATURE_COLUMNS
+        test_size (float): Hold-out fraction
+        random_state (int): Split seed
+        max_workers (int): Process pool size; 1 runs inline
+        leaderboard_dir (Path): Directory holding leaderboards
+
+    Returns:
+        pd.DataFrame: Leaderboard sorted best first
+    """
+
+    Cs = Cs or DEFAULT_C_GRID
+    penalties = penalties or DEFAULT_PENALTIES
+    feature_subsets = feature_subsets or default_feature_subsets()
+
+    for subset in feature_subsets:
+        unknown = set(subset) - set(FEATURE_COLUMNS)
+        if unknown:
+            raise ValueError(
+                f"Feature subset contains unknown columns: {unknown}"
+            )
+
+    path = _leaderboard_path(
+        team_season_df, test_size, random_state, leaderboard_dir
+    )
+    records = _read_leaderboard(path)
+    evaluated = {record["candidate"] for record in records}
+
+    # -----------------------------------
+    # Group pending candidates into regularization paths
+    # -----------------------------------
+    paths = []
+    for penalty in penalties:
+        for subset in feature_subsets:
+            pending = [
+                C for C in Cs
+                if candidate_key(penalty, C, subset) not in evaluated
+            ]
+            if pending:
+                paths.append((penalty, list(subset), pending))
+
+    if paths:
+        X, y = prepare_model_data(team_season_df)
+
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
+            X,
+            y,
+            test_size=test_size,
+            random_state=random_state,
+            stratify=y,
+        )
+
+        # Scaling is column-wise, so one fit serves every subset
+        scaler = preprocessing.StandardScaler().fit(X_train)
+        X_train = scaler.transform(X_train)
+        X_test = scaler.transform(X_test)
+        y_train = y_train.to_numpy()
+        y_test = y_test.to_numpy()
+
+        path_args = [
+            (
+                X_train,
+                y_train,
+                X_test,
+                y_test,
+                penalty,
+                subset,
+                [FEATURE_COLUMNS.index(col) for col in subset],
+                pending,
+            )
+            for penalty, subset, pending in paths
+        ]
+
+        if max_workers == 1:
+            results = [_fit_path(*args) for args in path_args]
+        else:
+            workers = min(max_workers or os.cpu_count() or 1, len(paths))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_fit_path, *zip(*path_args)))
+
+        for path_records in results:
+            records.extend(path_records)
+
+        _write_leaderboard(records, path)
+
+    leaderboard = pd.DataFrame(records, columns=LEADERBOARD_COLUMNS)
+
+    return leaderboard.sort_values(
+        by=["accuracy", "log_loss"],
+        ascending=[False, True],
+    ).reset_index(drop=True)
+
+
+# -----------------------------------
+# Command-line entry point
+# -----------------------------------
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Search hyperparameters of the win prediction model."
+    )
+    parser.add_argument(
+        "--C",
+        dest="Cs",
+        type=float,
+        nargs="+",
+        default=None,
+        help="inverse regularization strengths (default: 0.001-100 grid)",
+    )
+    parser.add_argument(
+        "--penalties",
+        nargs="+",
+        choices=DEFAULT_PENALTIES,
+        default=None,
+        help="penalties to search (default: l2 l1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes; 1 runs inline (default: one per core)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="leaderboard rows to print"
+    )
+    parser.add_argument(
+        "--leaderboard-dir",
+        type=Path,
+        default=LEADERBOARD_DIR,
+        help=f"leaderboard directory (default: {LEADERBOARD_DIR})",
+    )
+    parser.add_argument(
+        "--dataset", default=None, help="registered dataset key"
+    )
+    args = parser.parse_args(argv)
+
+    from src.pipeline import load_team_season_metrics
+
+    leaderboard = run_hyperparameter_search(
+        load_team_season_metrics(args.dataset),
+        Cs=args.Cs,
+        penalties=args.penalties,
+        max_workers=args.workers,
+        leaderboard_dir=args.leaderboard_dir,
+    )
+
+    # The candidate key repeats penalty, C and features
+    print(
+        leaderboard.drop(columns="candidate")
+        .head(args.top)
+        .to_string(index=False, float_format="{:.4f}".format)
+    )
+    print(
+        f"{len(leaderboard):,} candidates on the leaderboard "
+        f"in {args.leaderboard_dir}",
+        file=sys.stderr,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
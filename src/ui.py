@@ -0,0 +1,221 @@
+import streamlit as st
+
+
+# ---------------------------------
+# Side Bar Customization
+# ---------------------------------
+SIDEBAR_CSS = """
+    <style>
+    /* Sidebar spacing */
+    section[data-testid="stSidebar"] ul {
+        gap: 12px;
+    }
+
+    /* Sidebar text size */
+    section[data-testid="stSidebar"] span {
+        font-size: 16px;
+    }
+
+    /* Sidebar page labels spacing */
+    section[data-testid="stSidebar"] li {
+        margin-bottom: 10px;
+    }
+    </style>
+    """
+
+
+def apply_sidebar_style() -> None:
+    """
+    Injects the shared sidebar CSS into the current page.
+    """
+
+    st.markdown(SIDEBAR_CSS, unsafe_allow_html=True)
+
+
+# ---------------------------------
+# Dataset selection
+# ---------------------------------
+def select_dataset() -> str:
+    """
+    Lets the user pick a registered dataset in the sidebar.
+
+    The choice is kept in session state so it carries across pages.
+    With a single registered dataset no widget is shown.
+
+    Returns:
+        str: The selected dataset key
+    """
+
+    from src.datasets import available_datasets, resolve_dataset
+
+    datasets = available_datasets()
+    keys = list(datasets)
+
+    current = st.session_state.get("dataset_key")
+    if current not in datasets:
+        current = resolve_dataset(None)
+
+    if len(keys) > 1:
+        current = st.sidebar.selectbox(
+            "Dataset",
+            keys,
+            index=keys.index(current),
+            format_func=lambda key: datasets[key]["label"],
+        )
+
+    st.session_state["dataset_key"] = current
+    return current
+
+
+# ---------------------------------
+# Server-side table pagination
+# ---------------------------------
+def paginated_dataframe(
+    df,
+    key: str,
+    page_size: int = None,
+    **dataframe_kwargs,
+) -> None:
+    """
+    Renders a table, sending only the selected page of rows.
+
+    Args:
+        df (pd.DataFrame): Table to display
+        key (str): Unique widget key for the page selector
+        page_size (int): Rows per page (default TABLE_PAGE_SIZE)
+        **dataframe_kwargs: Passed through to st.dataframe
+    """
+
+    # Imported here so app.py, which only needs the sidebar style,
+    # does not load pandas
+    from src.rendering import TABLE_PAGE_SIZE, table_frame, trimming_enabled
+
+    page_size = page_size or TABLE_PAGE_SIZE
+
+    if not trimming_enabled() or len(df) <= page_size:
+        st.dataframe(table_frame(df), **dataframe_kwargs)
+        return
+
+    start, stop = page_bounds(len(df), key, page_size)
+
+    st.dataframe(table_frame(df.iloc[start:stop]), **dataframe_kwargs)
+    st.caption(f"Rows {start + 1:,}–{stop:,} of {len(df):,}")
+
+
+def page_bounds(n_rows: int, key: str, page_size: int) -> tuple:
+    """
+    Renders a page selector and returns the selected page's row range.
+
+    For tables that are sliced server-side before they are built: the
+    caller materializes only rows [start, stop).
+
+    Args:
+        n_rows (int): Rows in the whole table
+        key (str): Unique widget key for the page selector
+        page_size (int): Rows per page
+
+    Returns:
+        tuple: (start, stop) row positions
+    """
+
+    if n_rows <= page_size:
+        return 0, n_rows
+
+    n_pages = -(-n_rows // page_size)
+
+    # A shorter table (e.g. after a filter change) keeps a valid page
+    if st.session_state.get(key, 1) > n_pages:
+        st.session_state[key] = n_pages
+
+    page = st.number_input(
+        f"Page (1–{n_pages})",
+        min_value=1,
+        max_value=n_pages,
+        step=1,
+        key=key,
+    )
+
+    start = (int(page) - 1) * page_size
+    return start, min(start + page_size, n_rows)
+
+
+# ---------------------------------
+# Debug panel (opt-in with ?debug=1, ?profile=1)
+# ---------------------------------
+def start_debug_run() -> None:
+    """
+    Starts instrumenting this rerun when the debug query parameter
+    (or profile, which implies it) is set.
+    """
+
+    from src.instrumentation import begin_run, end_run
+
+    params = st.query_params
+    profile = params.get("profile") == "1"
+
+    if profile or params.get("debug") == "1":
+        begin_run(memory=True, profile=profile)
+    else:
+        # Drop a run left open by an earlier rerun that raised
+        end_run()
+
+
+def render_debug_panel() -> None:
+    """
+    Ends the instrumented rerun and shows its stages in the sidebar.
+    """
+
+    from src.instrumentation import end_run, export_json, export_prometheus
+
+    run = end_run()
+    if run is None:
+        return
+
+    import pandas as pd
+
+    records = sorted(run["records"], key=lambda record: record["started"])
+
+    stages = pd.DataFrame(
+        {
+            "stage": [
+                "  " * record["depth"] + record["name"] for record in records
+            ],
+            "ms": [record["seconds"] * 1000 for record in records],
+            "peak MB": [
+                None
+                if record["peak_bytes"] is None
+                else record["peak_bytes"] / 1024 ** 2
+                for record in records
+            ],
+            "rows in": [record["rows_in"] for record in records],
+            "rows out": [record["rows_out"] for record in records],
+        }
+    )
+
+    with st.sidebar.expander("🛠️ Debug: stage timings", expanded=True):
+        top_level = [r for r in records if r["depth"] == 0]
+        st.caption(
+            f"{len(records)} stages, "
+            f"{sum(r['seconds'] for r in top_level) * 1000:,.0f} ms total"
+        )
+        if not run["memory"]:
+            st.caption(
+                "Peak memory not measured: another session is profiling."
+            )
+        st.dataframe(stages.round(2), hide_index=True)
+
+        st.download_button(
+            "Download JSON",
+            export_json(records),
+            file_name="stages.json",
+            mime="application/json",
+        )
+        st.download_button(
+            "Download Prometheus",
+            export_prometheus(),
+            file_name="stages.prom",
+            mime="text/plain",
+        )
+
+        if run["profile"]:
+            st.code(run["profile"], language="text")
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.instrumentation import instrument
+
+
+# -----------------------------------
+# Grid configuration
+# -----------------------------------
+WHAT_IF_GRID_SIZE = 200
+
+# Axis ranges extend this share of the league range beyond min/max
+RANGE_PADDING = 0.05
+
+
+# -----------------------------------
+# Axis ranges
+# -----------------------------------
+@instrument
+def feature_range(
+    team_season_df: pd.DataFrame,
+    feature: str,
+    padding: float = RANGE_PADDING,
+) -> tuple:
+    """
+    League-wide value range of a feature, slightly padded.
+
+    Args:
+        team_season_df (pd.DataFrame): Team-season metrics
+        feature (str): Feature column
+        padding (float): Fraction of the range added on each side
+
+    Returns:
+        tuple: (low, high)
+    """
+
+    low = float(team_season_df[feature].min())
+    high = float(team_season_df[feature].max())
+    pad = (high - low) * padding or abs(low) * padding or 1.0
+
+    return low - pad, high + pad
+
+
+# -----------------------------------
+# Probability surface
+# -----------------------------------
+@instrument
+def probability_surface(
+    scorer,
+    base_row: pd.Series,
+    x_feature: str,
+    y_feature: str,
+    x_range: tuple,
+    y_range: tuple,
+    grid_size: int = WHAT_IF_GRID_SIZE,
+) -> dict:
+    """
+    Win probability over a grid of adjusted values for two features,
+    holding the team's other features at their actual values.
+
+    The whole grid is scored with a single predict_proba call.
+
+    Args:
+        scorer: NumpyWinScorer (or any model with predict_proba and
+            feature_names)
+        base_row (pd.Series): Team's actual feature values
+        x_feature (str): Feature varied along the x axis
+        y_feature (str): Feature varied along the y axis
+        x_range (tuple): (low, high) for x
+        y_range (tuple): (low, high) for y
+        grid_size (int): Points per axis
+
+    Returns:
+        dict: x values, y values and a (y, x) probability matrix
+    """
+
+    feature_names = list(scorer.feature_names)
+
+    for feature in (x_feature, y_feature):
+        if feature not in feature_names:
+            raise ValueError(f"Unknown model feature: {feature}")
+
+    x_values = np.linspace(*x_range, grid_size)
+    y_values = np.linspace(*y_range, grid_size)
+
+    grid = np.tile(
+        base_row[feature_names].to_numpy(dtype=float),
+        (grid_size * grid_size, 1),
+    )
+
+    # Row-major: row i * grid_size + j holds (y_values[i], x_values[j])
+    grid[:, feature_names.index(x_feature)] = np.tile(x_values, grid_size)
+    grid[:, feature_names.index(y_feature)] = np.repeat(y_values, grid_size)
+
+    probabilities = scorer.predict_proba(grid)[:, 1]
+
+    return {
+        "x": x_values,
+        "y": y_values,
+        "probability": probabilities.reshape(grid_size, grid_size),
+    }
+
+
+@instrument
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_probability_surface(
+    _scorer,
+    model_fingerprint: str,
+    team_name: str,
+    base_row: pd.Series,
+    x_feature: str,
+    y_feature: str,
+    x_range: tuple,
+    y_range: tuple,
+    grid_size: int = WHAT_IF_GRID_SIZE,
+) -> dict:
+    """
+    probability_surface cached per (model, team, features, ranges).
+
+    The scorer itself is not hashed; model_fingerprint identifies it.
+    """
+
+    return probability_surface(
+        _scorer,
+        base_row,
+        x_feature,
+        y_feature,
+        x_range,
+        y_range,
+        grid_size,
+    )
+
+
+def what_if_probability(scorer, base_row: pd.Series, changes: dict) -> float:
+    """
+    Win probability of the team's actual features with `changes`
+    applied, scored exactly with scorer.predict_one.
+
+    Only the heatmap uses the grid of probability_surface; scoring the
+    exact point avoids the nearest-grid-point error.
+
+    Args:
+        scorer: NumpyWinScorer
+        base_row (pd.Series): Team's actual feature values
+        changes (dict): Feature -> adjusted value
+
+    Returns:
+        float: Win probability
+    """
+
+    values = base_row[scorer.feature_names].astype(float).to_dict()
+
+    for feature, value in changes.items():
+        if feature not in values:
+            raise ValueError(f"Unknown model feature: {feature}")
+        values[feature] = float(value)
+
+    return scorer.predict_one(list(values.values()))